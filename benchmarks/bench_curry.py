@@ -0,0 +1,35 @@
+from pyvavr.curry import curry
+
+from .bench_list import SIZES
+
+
+def _add(x, y, z):
+    return x + y + z
+
+
+class CurrySuite:
+    """ Calls a three argument function ``size`` times, directly and through ``curry``. """
+    params = SIZES
+    param_names = ["size"]
+
+    def setup(self, size):
+        # curry returns a factory, calling it without arguments gives the curried function
+        self.curried = curry(_add)()
+
+    def time_direct_calls(self, size):
+        for _ in range(size):
+            _add(1, 2, 3)
+
+    def time_curried_all_arguments(self, size):
+        curried = self.curried
+        for _ in range(size):
+            curried(1, 2, 3)
+
+    def time_curried_one_by_one(self, size):
+        curried = self.curried
+        for _ in range(size):
+            curried(1)(2)(3)
+
+    def time_curry(self, size):
+        for _ in range(size):
+            curry(_add)
@@ -0,0 +1,153 @@
+from pyvavr.collection import ImmutableList
+
+from .memory import allocated, peak
+
+SIZES = [100, 1000, 10000, 100000, 1000000]  # pragma: no mutate
+
+
+def _increment(x):
+    return x + 1
+
+
+def _is_even(x):
+    return x % 2 == 0
+
+
+class ImmutableListSuite:
+    params = SIZES
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.values = list(range(size))
+        self.list = ImmutableList.of_list(self.values)
+        self.other = ImmutableList.of_list(self.values)
+
+    def time_of_list(self, size):
+        ImmutableList.of_list(self.values)
+
+    def time_from_iterable(self, size):
+        ImmutableList.from_iterable(range(size))
+
+    def time_builder(self, size):
+        ImmutableList.builder().extend(range(size)).build()
+
+    def time_iterate(self, size):
+        for _ in self.list:
+            pass
+
+    def time_iterate_reversed(self, size):
+        for _ in reversed(self.list):
+            pass
+
+    def time_len(self, size):
+        len(self.list)
+
+    def time_map(self, size):
+        self.list.map(_increment)
+
+    def time_filter(self, size):
+        self.list.filter(_is_even)
+
+    def time_take(self, size):
+        self.list.take(size // 2)
+
+    def time_drop(self, size):
+        self.list.drop(size // 2)
+
+    def time_take_right_while(self, size):
+        self.list.take_right_while(_is_even)
+
+    def time_drop_right_while(self, size):
+        self.list.drop_right_while(_is_even)
+
+    def time_zip(self, size):
+        self.list.zip(self.other)
+
+    def time_to_string(self, size):
+        self.list.to_string()
+
+    def time_hash_new_list(self, size):
+        # hashes are cached per cell, so every run hashes a freshly built list; compare with time_of_list
+        hash(ImmutableList.of_list(self.values))
+
+    def time_get(self, size):
+        self.list.get(size - 1)
+
+    def time_index_of(self, size):
+        self.list.index_of(-1)
+
+    def time_partition(self, size):
+        self.list.partition(_is_even)
+
+    def time_group_by(self, size):
+        self.list.group_by(_is_even)
+
+    def time_count_by(self, size):
+        self.list.count_by(_is_even)
+
+    def time_distinct(self, size):
+        self.list.distinct()
+
+    def time_merge_sorted(self, size):
+        self.list.merge_sorted(self.other)
+
+    def track_memory_of_list(self, size):
+        return allocated(lambda: ImmutableList.of_list(self.values))
+
+    track_memory_of_list.unit = "bytes"
+
+    def track_peak_memory_from_iterable(self, size):
+        return peak(lambda: ImmutableList.from_iterable(x for x in range(size)))
+
+    track_peak_memory_from_iterable.unit = "bytes"
+
+    def track_peak_memory_builder(self, size):
+        return peak(lambda: ImmutableList.builder().extend(x for x in range(size)).build())
+
+    track_peak_memory_builder.unit = "bytes"
+
+
+class BuiltinListSuite:
+    params = SIZES
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.values = list(range(size))
+        self.other = list(range(size))
+
+    def time_of_list(self, size):
+        list(self.values)
+
+    def time_from_iterable(self, size):
+        list(range(size))
+
+    def time_iterate(self, size):
+        for _ in self.values:
+            pass
+
+    def time_iterate_reversed(self, size):
+        for _ in reversed(self.values):
+            pass
+
+    def time_len(self, size):
+        len(self.values)
+
+    def time_map(self, size):
+        [_increment(x) for x in self.values]
+
+    def time_filter(self, size):
+        [x for x in self.values if _is_even(x)]
+
+    def time_take(self, size):
+        self.values[:size // 2]
+
+    def time_drop(self, size):
+        self.values[size // 2:]
+
+    def time_zip(self, size):
+        list(zip(self.values, self.other))
+
+    def track_memory_of_list(self, size):
+        return allocated(lambda: list(self.values))
+
+    track_memory_of_list.unit = "bytes"
@@ -0,0 +1,145 @@
+import gc
+import time
+from collections import deque
+
+from pyvavr.collection import ImmutableQueue, RealTimeQueue
+
+from .bench_list import SIZES
+from .memory import allocated
+
+
+def _enqueue_all(size):
+    queue = ImmutableQueue.empty()
+    for value in range(size):
+        queue = queue.enqueue(value)
+    return queue
+
+
+def _append_all(size):
+    queue = deque()
+    for value in range(size):
+        queue.append(value)
+    return queue
+
+
+def _mixed_latencies(queue, size):
+    """ Runs ``size`` operations, two enqueues for every dequeue, and returns each duration sorted.
+
+    The garbage collector is paused meanwhile, its pauses would otherwise hide the queue's own spikes.
+    """
+    latencies = []
+    clock = time.perf_counter
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(size):
+            start = clock()
+            if i % 3 == 2:
+                _, queue = queue.dequeue()
+            else:
+                queue = queue.enqueue(i)
+            latencies.append(clock() - start)
+    finally:
+        if collecting:
+            gc.enable()
+    latencies.sort()
+    return latencies
+
+
+def _percentile(latencies, fraction):
+    return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)]
+
+
+class ImmutableQueueSuite:
+    params = SIZES
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.queue = _enqueue_all(size)
+
+    def time_enqueue(self, size):
+        _enqueue_all(size)
+
+    def time_dequeue(self, size):
+        queue = self.queue
+        while not queue.is_empty():
+            _, queue = queue.dequeue()
+
+    def time_iterate(self, size):
+        for _ in self.queue:
+            pass
+
+    def track_memory_enqueue(self, size):
+        return allocated(lambda: _enqueue_all(size))
+
+    track_memory_enqueue.unit = "bytes"
+
+    def track_p99_mixed_latency(self, size):
+        return _percentile(_mixed_latencies(ImmutableQueue.empty(), size), 0.99)
+
+    track_p99_mixed_latency.unit = "seconds"
+
+    def track_max_mixed_latency(self, size):
+        return _mixed_latencies(ImmutableQueue.empty(), size)[-1]
+
+    track_max_mixed_latency.unit = "seconds"
+
+
+class RealTimeQueueSuite:
+    params = SIZES
+    param_names = ["size"]
+
+    def setup(self, size):
+        queue = RealTimeQueue.empty()
+        for value in range(size):
+            queue = queue.enqueue(value)
+        self.queue = queue
+
+    def time_enqueue(self, size):
+        queue = RealTimeQueue.empty()
+        for value in range(size):
+            queue = queue.enqueue(value)
+
+    def time_dequeue(self, size):
+        queue = self.queue
+        while not queue.is_empty():
+            _, queue = queue.dequeue()
+
+    def time_iterate(self, size):
+        for _ in self.queue:
+            pass
+
+    def track_p99_mixed_latency(self, size):
+        return _percentile(_mixed_latencies(RealTimeQueue.empty(), size), 0.99)
+
+    track_p99_mixed_latency.unit = "seconds"
+
+    def track_max_mixed_latency(self, size):
+        return _mixed_latencies(RealTimeQueue.empty(), size)[-1]
+
+    track_max_mixed_latency.unit = "seconds"
+
+
+class DequeSuite:
+    params = SIZES
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.queue = _append_all(size)
+
+    def time_enqueue(self, size):
+        _append_all(size)
+
+    def time_dequeue(self, size):
+        queue = deque(self.queue)
+        while queue:
+            queue.popleft()
+
+    def time_iterate(self, size):
+        for _ in self.queue:
+            pass
+
+    def track_memory_enqueue(self, size):
+        return allocated(lambda: _append_all(size))
+
+    track_memory_enqueue.unit = "bytes"
@@ -0,0 +1,51 @@
+from pyvavr.attempts import Try
+from pyvavr.either import Right
+from pyvavr.option import Just
+from pyvavr.validation import Valid
+
+from .bench_list import SIZES
+
+
+def _increment(x):
+    return x + 1
+
+
+class ValueChainSuite:
+    """ Chains ``size`` map or flat_map calls on every value type. """
+    params = SIZES
+    param_names = ["size"]
+
+    def time_function_calls(self, size):
+        value = 1
+        for _ in range(size):
+            value = _increment(value)
+
+    def time_option_map(self, size):
+        option = Just(1)
+        for _ in range(size):
+            option = option.map(_increment)
+
+    def time_option_flat_map(self, size):
+        option = Just(1)
+        for _ in range(size):
+            option = option.flat_map(lambda x: Just(x + 1))
+
+    def time_try_map(self, size):
+        attempt = Try.success(1)
+        for _ in range(size):
+            attempt = attempt.map(_increment)
+
+    def time_try_flat_map(self, size):
+        attempt = Try.success(1)
+        for _ in range(size):
+            attempt = attempt.flat_map(lambda x: Try.success(x + 1))
+
+    def time_either_map(self, size):
+        either = Right(1)
+        for _ in range(size):
+            either = either.map(_increment)
+
+    def time_validation_map(self, size):
+        validation = Valid(1)
+        for _ in range(size):
+            validation = validation.map(_increment)
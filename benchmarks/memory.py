@@ -0,0 +1,27 @@
+import tracemalloc
+from typing import Callable
+
+
+def allocated(func: Callable[[], object]) -> int:
+    """ Returns the number of bytes still held by the result of ``func``, measured with tracemalloc. """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def peak(func: Callable[[], object]) -> int:
+    """ Returns the largest number of bytes allocated at once while ``func`` runs, measured with tracemalloc. """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        func()
+        highest = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return highest - before
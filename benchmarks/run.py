@@ -0,0 +1,105 @@
+""" Runs the benchmark suites offline and reports the results as JSON.
+
+The suites follow the conventions of airspeed velocity (asv): classes with ``params``, ``setup``,
+``time_*`` methods measured in seconds and ``track_*`` methods returning a value, so they can also
+be run with asv. Usage::
+
+    python -m benchmarks.run [--max-size N] [--filter TEXT] [--repeat N] [--output FILE]
+"""
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import pkgutil
+import platform
+import sys
+import time
+import timeit
+from typing import Iterator, List, Optional
+
+import benchmarks
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Runs the pyvavr benchmarks and writes JSON results.")
+    parser.add_argument("--max-size", type=int, default=None, help="skip parameter sets with a larger size")
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repetitions, the best one is reported")
+    parser.add_argument("--output", default=None, help="file to write the JSON results to, default stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name, suite in _suites():
+        for params in _params(suite, args.max_size):
+            for method in sorted(m for m in dir(suite) if m.startswith(("time_", "track_"))):
+                benchmark = name + "." + method
+                if args.filter and args.filter not in benchmark:
+                    continue
+                result = _run(suite, method, params, args.repeat)
+                result["benchmark"] = benchmark
+                results.append(result)
+                print(benchmark, params, result["value"], result["unit"], file=sys.stderr)
+
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": time.time(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+    return 0
+
+
+def _suites() -> Iterator:
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module("benchmarks." + module_info.name)
+        for name, suite in inspect.getmembers(module, inspect.isclass):
+            if name.endswith("Suite") and suite.__module__ == module.__name__:
+                yield module_info.name + "." + name, suite
+
+
+def _params(suite, max_size: Optional[int]) -> List[tuple]:
+    params = getattr(suite, "params", None)
+    if params is None:
+        return [()]
+    names = getattr(suite, "param_names", [])
+    if params and all(isinstance(p, list) for p in params):
+        combinations = list(itertools.product(*params))
+    else:
+        combinations = [(p,) for p in params]
+    if max_size is not None and "size" in names:
+        position = names.index("size")
+        combinations = [c for c in combinations if c[position] <= max_size]
+    return combinations
+
+
+def _run(suite, method: str, params: tuple, repeat: int) -> dict:
+    instance = suite()
+    if hasattr(instance, "setup"):
+        instance.setup(*params)
+    try:
+        func = getattr(instance, method)
+        if method.startswith("time_"):
+            timer = timeit.Timer(lambda: func(*params))
+            number, _ = timer.autorange()
+            value = min(timer.repeat(repeat, number)) / number
+            unit = "seconds"
+        else:
+            value = func(*params)
+            unit = getattr(func, "unit", "unit")
+    finally:
+        if hasattr(instance, "teardown"):
+            instance.teardown(*params)
+    return {"params": dict(zip(getattr(suite, "param_names", []), params)), "value": value, "unit": unit}
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -60,6 +60,15 @@ class Try(ABC, Generic[T, E]):
     def is_failure(self) -> bool:
         return not self.is_success()
 
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self._value == other._value
+
+    def __hash__(self):
+        return hash((type(self), self._value))
+
+    def __reduce__(self):
+        return type(self), (self._value,)
+
     def __repr__(self) -> str:
         return str(self._value)
 
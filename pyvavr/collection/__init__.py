@@ -0,0 +1,15 @@
+from pyvavr.collection.list import ImmutableList
+from pyvavr.collection.queue import ImmutableQueue
+from pyvavr.collection.catenable import CatenableList
+from pyvavr.collection.vector import Vector
+from pyvavr.collection.stream import Stream
+from pyvavr.collection.realtime_queue import RealTimeQueue
+from pyvavr.collection.deque import Deque
+from pyvavr.collection.priority_queue import PriorityQueue
+from pyvavr.collection.map import HashMap
+from pyvavr.collection.tree import TreeMap, TreeSet
+from pyvavr.collection.set import HashSet
+from pyvavr.collection.numeric import IntVector, FloatVector
+
+__all__ = ["ImmutableList", "ImmutableQueue", "CatenableList", "Vector", "Stream", "RealTimeQueue", "Deque",
+           "PriorityQueue", "HashMap", "TreeMap", "TreeSet", "HashSet", "IntVector", "FloatVector"]
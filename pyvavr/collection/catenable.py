@@ -0,0 +1,166 @@
+from typing import Generic, TypeVar, Callable, Iterable, Iterator, Optional
+
+from pyvavr import ValueException
+from pyvavr.collection.list import ImmutableList
+from pyvavr.collection.realtime_queue import RealTimeQueue
+
+T = TypeVar("T")  # pragma: no mutate
+U = TypeVar("U")  # pragma: no mutate
+
+
+class CatenableList(Generic[T]):
+    """ Persistent list with O(1) concatenation, after Okasaki's catenable lists.
+
+    A non-empty list is its head plus a ``RealTimeQueue`` of suspended non-empty sub lists. ``concat``,
+    ``prepend`` and ``append`` only enqueue a sub list; ``tail`` links the first queued sub list to a
+    suspension that links the rest on demand, so it is amortized O(1) even if an older version of the
+    list is used again. Iteration walks the sub lists and is O(n).
+    """
+    __slots__ = ("_head", "_children", "_size")
+
+    def __init__(self, head: Optional[T] = None, children: Optional[RealTimeQueue] = None, size: int = 0):
+        self._head = head
+        self._children = children
+        self._size = size
+
+    @staticmethod
+    def of(*values: T) -> 'CatenableList[T]':
+        return CatenableList.of_iterable(values)
+
+    @staticmethod
+    def of_iterable(values: Iterable[T]) -> 'CatenableList[T]':
+        result = _EMPTY
+        for value in reversed(list(values)):
+            result = _single(value).concat(result)
+        return result
+
+    @staticmethod
+    def empty() -> 'CatenableList[T]':
+        return _EMPTY
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        stack = [self] if self._size else []
+        while stack:
+            current = stack.pop()
+            yield current._head
+            stack.extend(reversed([child.force() for child in current._children]))
+
+    def __add__(self, other: 'CatenableList[T]') -> 'CatenableList[T]':
+        return self.concat(other)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, CatenableList) or self._size != other._size:
+            return False
+        return all(x == y for x, y in zip(self, other))
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return CatenableList.of_iterable, (list(self),)
+
+    def __repr__(self):
+        return "CatenableList(" + ", ".join(repr(x) for x in self) + ")"
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def head(self) -> T:
+        if self._size == 0:
+            raise ValueException("No head of an empty list")
+        return self._head
+
+    def tail(self) -> 'CatenableList[T]':
+        """ Returns the list without its head in amortized O(1). """
+        if self._size == 0:
+            raise ValueException("No tail of an empty list")
+        if self._children.is_empty():
+            return _EMPTY
+        return _link_all(self._children, self._size - 1)
+
+    def concat(self, other: 'CatenableList[T]') -> 'CatenableList[T]':
+        """ Returns this list followed by ``other`` in O(1). """
+        if other._size == 0:
+            return self
+        if self._size == 0:
+            return other
+        return _link(self, _Suspension.of(other))
+
+    def append_all(self, values: Iterable[T]) -> 'CatenableList[T]':
+        if isinstance(values, CatenableList):
+            return self.concat(values)
+        return self.concat(CatenableList.of_iterable(values))
+
+    def prepend(self, value: T) -> 'CatenableList[T]':
+        return _single(value).concat(self)
+
+    def append(self, value: T) -> 'CatenableList[T]':
+        return self.concat(_single(value))
+
+    def map(self, func: Callable[[T], U]) -> 'CatenableList[U]':
+        return CatenableList.of_iterable(func(x) for x in self)
+
+    def filter(self, predicate: Callable[[T], bool]) -> 'CatenableList[T]':
+        return CatenableList.of_iterable(x for x in self if predicate(x))
+
+    def fold_left(self, zero: U, combine: Callable[[U, T], U]) -> U:
+        result = zero
+        for value in self:
+            result = combine(result, value)
+        return result
+
+    def or_else(self, alternative: 'CatenableList[T]') -> 'CatenableList[T]':
+        if self.is_empty():
+            return alternative
+        return self
+
+    def to_list(self) -> ImmutableList[T]:
+        return ImmutableList.from_iterable(self)
+
+
+class _Suspension(Generic[T]):
+    """ A non-empty sub list that is computed on first use and then memoized; its size is known upfront. """
+    __slots__ = ("_thunk", "_value", "size")
+
+    def __init__(self, thunk: Optional[Callable[[], CatenableList[T]]], value: Optional[CatenableList[T]],
+                 size: int):
+        self._thunk = thunk
+        self._value = value
+        self.size = size
+
+    @staticmethod
+    def of(value: CatenableList[T]) -> '_Suspension[T]':
+        return _Suspension(None, value, value._size)
+
+    def force(self) -> CatenableList[T]:
+        thunk = self._thunk
+        if thunk is not None:
+            self._value = thunk()
+            self._thunk = None
+        return self._value
+
+
+def _single(value: T) -> CatenableList[T]:
+    return CatenableList(value, RealTimeQueue.empty(), 1)
+
+
+def _link(left: CatenableList[T], right: _Suspension[T]) -> CatenableList[T]:
+    return CatenableList(left._head, left._children.enqueue(right), left._size + right.size)
+
+
+def _link_all(children: RealTimeQueue, size: int) -> CatenableList[T]:
+    # links the first child to the suspended link of the others, so only O(1) work happens now
+    first = children.head().force()
+    rest = children.tail()
+    if rest.is_empty():
+        return first
+    rest_size = size - first._size
+    return _link(first, _Suspension(lambda: _link_all(rest, rest_size), None, rest_size))
+
+
+_EMPTY = CatenableList()
@@ -0,0 +1,420 @@
+from typing import Generic, TypeVar, Callable, Iterable, Iterator, Optional, Tuple
+
+from pyvavr import NoSuchElementException
+
+T = TypeVar("T")  # pragma: no mutate
+U = TypeVar("U")  # pragma: no mutate
+
+
+class _Node:
+    """ Branch of 2 or 3 items of the level below, annotated with the number of elements in it. """
+    __slots__ = ("children", "size")
+
+    def __init__(self, children: tuple, size: int):
+        self.children = children
+        self.size = size
+
+
+class _Empty:
+    __slots__ = ()
+    size = 0
+
+
+class _Single:
+    __slots__ = ("item", "size")
+
+    def __init__(self, item):
+        self.item = item
+        self.size = _measure(item)
+
+
+class _Deep:
+    # prefix and suffix are tuples of 1 to 4 items, middle is a tree of _Nodes
+    __slots__ = ("prefix", "middle", "suffix", "size")
+
+    def __init__(self, prefix: tuple, middle, suffix: tuple, size: Optional[int] = None):
+        self.prefix = prefix
+        self.middle = middle
+        self.suffix = suffix
+        self.size = size if size is not None else _measure_all(prefix) + middle.size + _measure_all(suffix)
+
+
+_EMPTY_TREE = _Empty()
+
+
+class Deque(Generic[T]):
+    """ Persistent double ended queue backed by a 2-3 finger tree annotated with sizes.
+
+    Adding or removing at either end is amortized O(1), ``get`` and ``split_at`` are O(log n) and
+    ``concat`` is O(log min(n, m)). All versions share their unchanged subtrees, see Hinze and
+    Paterson, "Finger trees: a simple general-purpose data structure".
+    """
+    __slots__ = ("_tree",)
+
+    def __init__(self, tree=_EMPTY_TREE):
+        self._tree = tree
+
+    @staticmethod
+    def of(*values: T) -> 'Deque[T]':
+        return Deque.of_iterable(values)
+
+    @staticmethod
+    def of_iterable(values: Iterable[T]) -> 'Deque[T]':
+        tree = _EMPTY_TREE
+        for value in values:
+            tree = _push_back(tree, value)
+        return Deque(tree)
+
+    @staticmethod
+    def empty() -> 'Deque[T]':
+        return _EMPTY
+
+    def __len__(self):
+        return self._tree.size
+
+    def __iter__(self) -> Iterator[T]:
+        return _iterate(self._tree)
+
+    def __reversed__(self) -> Iterator[T]:
+        return _iterate_reversed(self._tree)
+
+    def __getitem__(self, index: int) -> T:
+        if index < 0 <= index + len(self):
+            index += len(self)
+        return self.get(index)
+
+    def __contains__(self, value: T) -> bool:
+        return any(x is value or x == value for x in self)
+
+    def __add__(self, other: 'Deque[T]') -> 'Deque[T]':
+        return self.concat(other)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Deque) or len(self) != len(other):
+            return False
+        return all(x == y for x, y in zip(self, other))
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return Deque.of_iterable, (list(self),)
+
+    def __repr__(self):
+        return "Deque(" + ", ".join(repr(x) for x in self) + ")"
+
+    def is_empty(self) -> bool:
+        return self._tree.size == 0
+
+    def prepend(self, value: T) -> 'Deque[T]':
+        """ Adds ``value`` at the front in amortized O(1). """
+        return Deque(_push_front(self._tree, value))
+
+    def append(self, value: T) -> 'Deque[T]':
+        """ Adds ``value`` at the back in amortized O(1). """
+        return Deque(_push_back(self._tree, value))
+
+    def head(self) -> T:
+        if self.is_empty():
+            raise NoSuchElementException("head of empty deque")
+        tree = self._tree
+        return tree.item if isinstance(tree, _Single) else tree.prefix[0]
+
+    def last(self) -> T:
+        if self.is_empty():
+            raise NoSuchElementException("last of empty deque")
+        tree = self._tree
+        return tree.item if isinstance(tree, _Single) else tree.suffix[-1]
+
+    def tail(self) -> 'Deque[T]':
+        """ Returns the deque without its first element in amortized O(1). """
+        return self.pop_left()[1]
+
+    def init(self) -> 'Deque[T]':
+        """ Returns the deque without its last element in amortized O(1). """
+        return self.pop_right()[1]
+
+    def pop_left(self) -> Tuple[T, 'Deque[T]']:
+        if self.is_empty():
+            raise NoSuchElementException("pop of empty deque")
+        value, tree = _view_left(self._tree)
+        return value, Deque(tree)
+
+    def pop_right(self) -> Tuple[T, 'Deque[T]']:
+        if self.is_empty():
+            raise NoSuchElementException("pop of empty deque")
+        value, tree = _view_right(self._tree)
+        return value, Deque(tree)
+
+    def get(self, index: int) -> T:
+        """ Returns the element at ``index`` in O(log n). """
+        if index < 0 or index >= len(self):
+            raise IndexError("index " + str(index) + " out of range")
+        return _lookup(self._tree, index)
+
+    def split_at(self, index: int) -> Tuple['Deque[T]', 'Deque[T]']:
+        """ Splits into the first ``index`` elements and the rest in O(log n), sharing both halves. """
+        if index <= 0:
+            return _EMPTY, self
+        if index >= len(self):
+            return self, _EMPTY
+        left, item, right = _split_tree(self._tree, index, 0)
+        return Deque(left), Deque(_push_front(right, item))
+
+    def take(self, n: int) -> 'Deque[T]':
+        return self.split_at(n)[0]
+
+    def drop(self, n: int) -> 'Deque[T]':
+        return self.split_at(n)[1]
+
+    def concat(self, other: 'Deque[T]') -> 'Deque[T]':
+        """ Returns this deque followed by ``other`` in O(log min(n, m)). """
+        if other.is_empty():
+            return self
+        if self.is_empty():
+            return other
+        return Deque(_app3(self._tree, (), other._tree))
+
+    def map(self, func: Callable[[T], U]) -> 'Deque[U]':
+        return Deque.of_iterable(func(x) for x in self)
+
+    def filter(self, predicate: Callable[[T], bool]) -> 'Deque[T]':
+        return Deque.of_iterable(x for x in self if predicate(x))
+
+    def fold_left(self, zero: U, combine: Callable[[U, T], U]) -> U:
+        result = zero
+        for value in self:
+            result = combine(result, value)
+        return result
+
+    def or_else(self, alternative: 'Deque[T]') -> 'Deque[T]':
+        if self.is_empty():
+            return alternative
+        return self
+
+
+def _measure(item) -> int:
+    # user elements never are _Nodes, so every other item counts as one element
+    return item.size if type(item) is _Node else 1
+
+
+def _measure_all(items: tuple) -> int:
+    return sum(_measure(item) for item in items)
+
+
+def _node(*children) -> _Node:
+    return _Node(children, _measure_all(children))
+
+
+def _push_front(tree, item):
+    if isinstance(tree, _Empty):
+        return _Single(item)
+    if isinstance(tree, _Single):
+        return _Deep((item,), _EMPTY_TREE, (tree.item,))
+    size = tree.size + _measure(item)
+    prefix = tree.prefix
+    if len(prefix) == 4:
+        return _Deep((item, prefix[0]), _push_front(tree.middle, _node(*prefix[1:])), tree.suffix, size)
+    return _Deep((item,) + prefix, tree.middle, tree.suffix, size)
+
+
+def _push_back(tree, item):
+    if isinstance(tree, _Empty):
+        return _Single(item)
+    if isinstance(tree, _Single):
+        return _Deep((tree.item,), _EMPTY_TREE, (item,))
+    size = tree.size + _measure(item)
+    suffix = tree.suffix
+    if len(suffix) == 4:
+        return _Deep(tree.prefix, _push_back(tree.middle, _node(*suffix[:3])), (suffix[3], item), size)
+    return _Deep(tree.prefix, tree.middle, suffix + (item,), size)
+
+
+def _view_left(tree):
+    if isinstance(tree, _Single):
+        return tree.item, _EMPTY_TREE
+    item = tree.prefix[0]
+    return item, _deep_left(tree.prefix[1:], tree.middle, tree.suffix, tree.size - _measure(item))
+
+
+def _view_right(tree):
+    if isinstance(tree, _Single):
+        return tree.item, _EMPTY_TREE
+    item = tree.suffix[-1]
+    return item, _deep_right(tree.prefix, tree.middle, tree.suffix[:-1], tree.size - _measure(item))
+
+
+def _deep_left(prefix: tuple, middle, suffix: tuple, size: Optional[int] = None):
+    # like _Deep, but the prefix may be empty
+    if prefix:
+        return _Deep(prefix, middle, suffix, size)
+    if isinstance(middle, _Empty):
+        return _of_items(suffix)
+    node, middle = _view_left(middle)
+    return _Deep(node.children, middle, suffix, size)
+
+
+def _deep_right(prefix: tuple, middle, suffix: tuple, size: Optional[int] = None):
+    # like _Deep, but the suffix may be empty
+    if suffix:
+        return _Deep(prefix, middle, suffix, size)
+    if isinstance(middle, _Empty):
+        return _of_items(prefix)
+    node, middle = _view_right(middle)
+    return _Deep(prefix, middle, node.children, size)
+
+
+def _of_items(items: tuple):
+    tree = _EMPTY_TREE
+    for item in items:
+        tree = _push_back(tree, item)
+    return tree
+
+
+def _app3(left, items: tuple, right):
+    # concatenates left, the loose items and right; only recurses into the middle trees
+    if isinstance(left, _Empty):
+        for item in reversed(items):
+            right = _push_front(right, item)
+        return right
+    if isinstance(right, _Empty):
+        for item in items:
+            left = _push_back(left, item)
+        return left
+    if isinstance(left, _Single):
+        return _push_front(_app3(_EMPTY_TREE, items, right), left.item)
+    if isinstance(right, _Single):
+        return _push_back(_app3(left, items, _EMPTY_TREE), right.item)
+    middle = _app3(left.middle, _nodes(left.suffix + items + right.prefix), right.middle)
+    return _Deep(left.prefix, middle, right.suffix, left.size + _measure_all(items) + right.size)
+
+
+def _nodes(items: tuple) -> tuple:
+    # groups 2 to 12 items into nodes of 2 or 3
+    nodes = []
+    while len(items) > 4:
+        nodes.append(_node(*items[:3]))
+        items = items[3:]
+    if len(items) == 4:
+        nodes.append(_node(*items[:2]))
+        nodes.append(_node(*items[2:]))
+    else:
+        nodes.append(_node(*items))
+    return tuple(nodes)
+
+
+def _lookup(tree, index: int):
+    item, index = _lookup_item(tree, index)
+    while type(item) is _Node:
+        item, index = _lookup_digit(item.children, index)
+    return item
+
+
+def _lookup_item(tree, index: int):
+    # returns the item of this level containing index and the offset of index within it
+    if isinstance(tree, _Single):
+        return tree.item, index
+    prefix_size = _measure_all(tree.prefix)
+    if index < prefix_size:
+        return _lookup_digit(tree.prefix, index)
+    index -= prefix_size
+    if index < tree.middle.size:
+        node, index = _lookup_item(tree.middle, index)
+        return _lookup_digit(node.children, index)
+    return _lookup_digit(tree.suffix, index - tree.middle.size)
+
+
+def _lookup_digit(items: tuple, index: int):
+    for item in items:
+        size = _measure(item)
+        if index < size:
+            return item, index
+        index -= size
+    raise IndexError("index out of range")  # pragma: no cover
+
+
+def _split_tree(tree, index: int, offset: int):
+    """ Splits a non-empty tree around the item containing position ``index``.
+
+    ``offset`` is the number of elements before ``tree``. Returns the tree before the item, the item
+    and the tree after it.
+    """
+    if isinstance(tree, _Single):
+        return _EMPTY_TREE, tree.item, _EMPTY_TREE
+    prefix_end = offset + _measure_all(tree.prefix)
+    if index < prefix_end:
+        before, item, after = _split_digit(tree.prefix, index, offset)
+        return _of_items(before), item, _deep_left(after, tree.middle, tree.suffix)
+    middle_end = prefix_end + tree.middle.size
+    if index < middle_end:
+        middle_before, node, middle_after = _split_tree(tree.middle, index, prefix_end)
+        before, item, after = _split_digit(node.children, index, prefix_end + middle_before.size)
+        return (_deep_right(tree.prefix, middle_before, before), item,
+                _deep_left(after, middle_after, tree.suffix))
+    before, item, after = _split_digit(tree.suffix, index, middle_end)
+    return _deep_right(tree.prefix, tree.middle, before), item, _of_items(after)
+
+
+def _split_digit(items: tuple, index: int, offset: int):
+    for position, item in enumerate(items):
+        offset += _measure(item)
+        if index < offset:
+            return items[:position], item, items[position + 1:]
+    raise IndexError("index out of range")  # pragma: no cover
+
+
+def _iterate(tree) -> Iterator:
+    if isinstance(tree, _Empty):
+        return
+    if isinstance(tree, _Single):
+        yield from _flatten(tree.item)
+        return
+    for item in tree.prefix:
+        yield from _flatten(item)
+    yield from _iterate(tree.middle)
+    for item in tree.suffix:
+        yield from _flatten(item)
+
+
+def _iterate_reversed(tree) -> Iterator:
+    if isinstance(tree, _Empty):
+        return
+    if isinstance(tree, _Single):
+        yield from _flatten_reversed(tree.item)
+        return
+    for item in reversed(tree.suffix):
+        yield from _flatten_reversed(item)
+    yield from _iterate_reversed(tree.middle)
+    for item in reversed(tree.prefix):
+        yield from _flatten_reversed(item)
+
+
+def _flatten(item) -> Iterator:
+    if type(item) is not _Node:
+        yield item
+        return
+    stack = [item]
+    while stack:
+        current = stack.pop()
+        if type(current) is _Node:
+            stack.extend(reversed(current.children))
+        else:
+            yield current
+
+
+def _flatten_reversed(item) -> Iterator:
+    if type(item) is not _Node:
+        yield item
+        return
+    stack = [item]
+    while stack:
+        current = stack.pop()
+        if type(current) is _Node:
+            stack.extend(current.children)
+        else:
+            yield current
+
+
+_EMPTY = Deque()
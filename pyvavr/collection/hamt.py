@@ -0,0 +1,357 @@
+import sys
+from typing import Callable, Iterator, Optional, Tuple, Union
+
+_BITS = 5  # pragma: no mutate
+_MASK = (1 << _BITS) - 1  # pragma: no mutate
+_HASH_MASK = (1 << sys.hash_info.width) - 1  # pragma: no mutate
+
+NOT_FOUND = object()
+
+# An entry is a plain (hash, key, value) tuple, everything else stored in a node is a sub node.
+Entry = Tuple[int, object, object]
+Resolve = Optional[Callable[[object, object], object]]
+
+if hasattr(int, "bit_count"):
+    def _popcount(x: int) -> int:
+        return x.bit_count()
+else:  # pragma: no cover
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+
+def hash_key(key) -> int:
+    return hash(key) & _HASH_MASK
+
+
+class BitmapNode:
+    """ Node of a hash array mapped trie.
+
+    ``bitmap`` has one bit set for every occupied slot of the 32 possible ones and ``children`` only
+    holds the occupied slots, in order. ``size`` is the number of entries below this node.
+    """
+    __slots__ = ("bitmap", "children", "size")
+
+    def __init__(self, bitmap: int, children: tuple, size: int):
+        self.bitmap = bitmap
+        self.children = children
+        self.size = size
+
+    def get(self, shift: int, h: int, key, default=NOT_FOUND):
+        node = self
+        while isinstance(node, BitmapNode):
+            bit = 1 << ((h >> shift) & _MASK)
+            if not node.bitmap & bit:
+                return default
+            child = node.children[_popcount(node.bitmap & (bit - 1))]
+            if type(child) is tuple:
+                return child[2] if child[0] == h and (child[1] is key or child[1] == key) else default
+            node = child
+            shift += _BITS
+        return node.get(shift, h, key, default)
+
+    def put(self, shift: int, h: int, key, value, resolve: Resolve = None) -> 'Node':
+        """ Returns a node with ``key`` mapped to ``value``, or this node if nothing changed.
+
+        If ``key`` is already present and ``resolve`` is given, the stored value becomes
+        ``resolve(existing, value)``.
+        """
+        bit = 1 << ((h >> shift) & _MASK)
+        position = _popcount(self.bitmap & (bit - 1))
+        children = self.children
+        if not self.bitmap & bit:
+            children = children[:position] + ((h, key, value),) + children[position:]
+            return BitmapNode(self.bitmap | bit, children, self.size + 1)
+
+        child = children[position]
+        if type(child) is tuple:
+            if child[0] == h and (child[1] is key or child[1] == key):
+                if resolve is not None:
+                    value = resolve(child[2], value)
+                if value is child[2]:
+                    return self
+                return self._replace(position, (h, child[1], value), 0)
+            return self._replace(position, _pair(shift + _BITS, child, (h, key, value)), 1)
+
+        new_child = child.put(shift + _BITS, h, key, value, resolve)
+        if new_child is child:
+            return self
+        return self._replace(position, new_child, new_child.size - child.size)
+
+    def remove(self, shift: int, h: int, key) -> Optional['Node']:
+        """ Returns a node without ``key``, this node if ``key`` is absent or None if it became empty. """
+        bit = 1 << ((h >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self
+
+        position = _popcount(self.bitmap & (bit - 1))
+        child = self.children[position]
+        if type(child) is tuple:
+            if child[0] != h or not (child[1] is key or child[1] == key):
+                return self
+            new_child = None
+        else:
+            new_child = child.remove(shift + _BITS, h, key)
+            if new_child is child:
+                return self
+            new_child = _compact(new_child)
+
+        if new_child is not None:
+            return self._replace(position, new_child, -1)
+        if len(self.children) == 1:
+            return None
+        children = self.children[:position] + self.children[position + 1:]
+        return BitmapNode(self.bitmap ^ bit, children, self.size - 1)
+
+    def entries(self) -> Iterator[Entry]:
+        for child in self.children:
+            if type(child) is tuple:
+                yield child
+            else:
+                yield from child.entries()
+
+    def _replace(self, position: int, child, growth: int) -> 'BitmapNode':
+        children = self.children[:position] + (child,) + self.children[position + 1:]
+        return BitmapNode(self.bitmap, children, self.size + growth)
+
+
+class CollisionNode:
+    """ Leaf holding entries whose keys have exactly the same hash. """
+    __slots__ = ("hash", "pairs", "size")
+
+    def __init__(self, h: int, pairs: Tuple[Entry, ...]):
+        self.hash = h
+        self.pairs = pairs
+        self.size = len(pairs)
+
+    def get(self, shift: int, h: int, key, default=NOT_FOUND):
+        if h == self.hash:
+            for entry in self.pairs:
+                if entry[1] is key or entry[1] == key:
+                    return entry[2]
+        return default
+
+    def put(self, shift: int, h: int, key, value, resolve: Resolve = None) -> 'Node':
+        if h != self.hash:
+            node = BitmapNode(1 << ((self.hash >> shift) & _MASK), (self,), self.size)
+            return node.put(shift, h, key, value, resolve)
+
+        for position, entry in enumerate(self.pairs):
+            if entry[1] is key or entry[1] == key:
+                if resolve is not None:
+                    value = resolve(entry[2], value)
+                if value is entry[2]:
+                    return self
+                return CollisionNode(h, self.pairs[:position] + ((h, entry[1], value),) + self.pairs[position + 1:])
+        return CollisionNode(h, self.pairs + ((h, key, value),))
+
+    def remove(self, shift: int, h: int, key) -> Optional['Node']:
+        if h != self.hash:
+            return self
+        for position, entry in enumerate(self.pairs):
+            if entry[1] is key or entry[1] == key:
+                if self.size == 1:
+                    return None
+                return CollisionNode(h, self.pairs[:position] + self.pairs[position + 1:])
+        return self
+
+    def entries(self) -> Iterator[Entry]:
+        return iter(self.pairs)
+
+
+Node = Union[BitmapNode, CollisionNode]
+
+EMPTY = BitmapNode(0, (), 0)
+
+
+def merge(left: Node, right: Node, shift: int, resolve: Resolve = None) -> Node:
+    """ Merges two tries, reusing every subtree that only occurs on one side.
+
+    Keys present in both resolve to ``resolve(left_value, right_value)``, or to the left value if no
+    function is given. In that case subtrees shared by both tries are reused as they are.
+    """
+    if left is right and resolve is None:
+        return left
+    if not isinstance(left, BitmapNode):
+        for h, key, value in left.entries():
+            right = right.put(shift, h, key, value, _flip(resolve) or _replace_existing)
+        return right
+    if not isinstance(right, BitmapNode):
+        for h, key, value in right.entries():
+            left = left.put(shift, h, key, value, resolve or _keep_existing)
+        return left
+
+    bitmap = left.bitmap | right.bitmap
+    children = []
+    size = 0
+    left_position = right_position = 0
+    for index in range(0, _MASK + 1):
+        bit = 1 << index
+        if not bitmap & bit:
+            continue
+        if not right.bitmap & bit:
+            child = left.children[left_position]
+            left_position += 1
+        elif not left.bitmap & bit:
+            child = right.children[right_position]
+            right_position += 1
+        else:
+            child = _merge_child(left.children[left_position], right.children[right_position], shift + _BITS, resolve)
+            left_position += 1
+            right_position += 1
+        children.append(child)
+        size += 1 if type(child) is tuple else child.size
+
+    return BitmapNode(bitmap, tuple(children), size)
+
+
+def _merge_child(left, right, shift: int, resolve: Resolve):
+    if type(left) is tuple and type(right) is tuple:
+        if left[0] == right[0] and (left[1] is right[1] or left[1] == right[1]):
+            if resolve is None:
+                return left
+            return (left[0], left[1], resolve(left[2], right[2]))
+        return _pair(shift, left, right)
+    if type(left) is tuple:
+        return right.put(shift, left[0], left[1], left[2], _flip(resolve) or _replace_existing)
+    if type(right) is tuple:
+        return left.put(shift, right[0], right[1], right[2], resolve or _keep_existing)
+    return merge(left, right, shift, resolve)
+
+
+def _pair(shift: int, first: Entry, second: Entry) -> Node:
+    if first[0] == second[0]:
+        return CollisionNode(first[0], (first, second))
+
+    first_index = (first[0] >> shift) & _MASK
+    second_index = (second[0] >> shift) & _MASK
+    if first_index == second_index:
+        return BitmapNode(1 << first_index, (_pair(shift + _BITS, first, second),), 2)
+    children = (first, second) if first_index < second_index else (second, first)
+    return BitmapNode((1 << first_index) | (1 << second_index), children, 2)
+
+
+def _flip(resolve: Resolve) -> Resolve:
+    if resolve is None:
+        return None
+    return lambda existing, value: resolve(value, existing)
+
+
+def _keep_existing(existing, value):
+    return existing
+
+
+def _replace_existing(existing, value):
+    return value
+
+
+def intersect(left: Node, right: Node, shift: int) -> Optional[Node]:
+    """ Keeps the entries of ``left`` whose keys are also in ``right``, or returns None if there are none.
+
+    Subtrees that survive unchanged, including subtrees shared by both tries, are reused; if the
+    result is identical to ``left`` or ``right`` that trie itself is returned.
+    """
+    if left is right:
+        return left
+    if not isinstance(left, BitmapNode) or not isinstance(right, BitmapNode):
+        result = left
+        for h, key, _ in left.entries():
+            if right.get(shift, h, key) is NOT_FOUND:
+                result = result.remove(shift, h, key)
+                if result is None:
+                    return None
+        return result
+
+    common = left.bitmap & right.bitmap
+    bitmap = 0
+    children = []
+    size = 0
+    for index in range(0, _MASK + 1):
+        bit = 1 << index
+        if not common & bit:
+            continue
+        left_child = left.children[_popcount(left.bitmap & (bit - 1))]
+        right_child = right.children[_popcount(right.bitmap & (bit - 1))]
+        child = _intersect_child(left_child, right_child, shift + _BITS)
+        if child is not None:
+            bitmap |= bit
+            children.append(child)
+            size += 1 if type(child) is tuple else child.size
+
+    if bitmap == left.bitmap and all(x is y for x, y in zip(children, left.children)):
+        return left
+    if bitmap == right.bitmap and all(x is y for x, y in zip(children, right.children)):
+        return right
+    if not children:
+        return None
+    return BitmapNode(bitmap, tuple(children), size)
+
+
+def difference(left: Node, right: Node, shift: int) -> Optional[Node]:
+    """ Removes the keys of ``right`` from ``left``, or returns None if nothing is left.
+
+    Subtrees of ``left`` that do not overlap with ``right`` are reused.
+    """
+    if left is right:
+        return None
+    if not isinstance(left, BitmapNode) or not isinstance(right, BitmapNode):
+        result = left
+        for h, key, _ in right.entries():
+            result = result.remove(shift, h, key)
+            if result is None:
+                return None
+        return result
+
+    bitmap = 0
+    children = []
+    size = 0
+    position = 0
+    for index in range(0, _MASK + 1):
+        bit = 1 << index
+        if not left.bitmap & bit:
+            continue
+        child = left.children[position]
+        position += 1
+        if right.bitmap & bit:
+            child = _difference_child(child, right.children[_popcount(right.bitmap & (bit - 1))], shift + _BITS)
+        if child is not None:
+            bitmap |= bit
+            children.append(child)
+            size += 1 if type(child) is tuple else child.size
+
+    if bitmap == left.bitmap and all(x is y for x, y in zip(children, left.children)):
+        return left
+    if not children:
+        return None
+    return BitmapNode(bitmap, tuple(children), size)
+
+
+def _intersect_child(left, right, shift: int):
+    if type(left) is tuple:
+        if type(right) is tuple:
+            found = left[0] == right[0] and (left[1] is right[1] or left[1] == right[1])
+        else:
+            found = right.get(shift, left[0], left[1]) is not NOT_FOUND
+        return left if found else None
+    if type(right) is tuple:
+        value = left.get(shift, right[0], right[1])
+        return None if value is NOT_FOUND else (right[0], right[1], value)
+    return _compact(intersect(left, right, shift))
+
+
+def _difference_child(left, right, shift: int):
+    if type(left) is tuple:
+        if type(right) is tuple:
+            found = left[0] == right[0] and (left[1] is right[1] or left[1] == right[1])
+        else:
+            found = right.get(shift, left[0], left[1]) is not NOT_FOUND
+        return None if found else left
+    if type(right) is tuple:
+        return _compact(left.remove(shift, right[0], right[1]))
+    return _compact(difference(left, right, shift))
+
+
+def _compact(node: Optional[Node]):
+    # a sub node holding a single entry is replaced by the entry itself
+    if node is not None and node.size == 1:
+        return next(node.entries())
+    return node
@@ -1,36 +1,50 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Callable, Tuple
+from collections import Counter
+from concurrent.futures import Executor
+from functools import reduce
+from heapq import nlargest, nsmallest
+from itertools import chain, dropwhile, islice, takewhile
+from typing import Generic, TypeVar, Dict, List, Callable, Tuple, Iterable, Iterator, Optional
 
 from pyvavr import ValueException
+from pyvavr.collection import parallel
+from pyvavr.collection.map import HashMap
 
 T = TypeVar("T")  # pragma: no mutate
 U = TypeVar("U")  # pragma: no mutate
 R = TypeVar("R")  # pragma: no mutate
+K = TypeVar("K")  # pragma: no mutate
+
+_REVERSE_CHUNK = 64  # pragma: no mutate
 
 
 class ImmutableList(ABC, Generic[T]):
+    __slots__ = ()
 
     @staticmethod
     def of(*values: T) -> 'ImmutableList[T]':
-        result = Nil()
-        for value in reversed(values):
-            result = result.prepend(value)
-        return result
+        return _prepend_all(values, Nil())
 
     @staticmethod
     def range(start: int, end: int, step: int = 1):
-        list = ImmutableList.of()
-        sign = _sign(step)
-        for x in range(end - sign, start - sign, -step):
-            list = list.prepend(x)
-        return list
+        return _prepend_all(range(start, end, step), Nil())
 
     @staticmethod
     def of_list(list: List[T]) -> 'ImmutableList[T]':
-        result = Nil()
-        for value in reversed(list):
-            result = result.prepend(value)
-        return result
+        return _prepend_all(list, Nil())
+
+    @staticmethod
+    def from_iterable(values: Iterable[T]) -> 'ImmutableList[T]':
+        """ Builds a list from any iterable, also a generator, in O(n).
+
+        Iterables other than lists and tuples are copied into a Python list first, which is the
+        fastest way to build the cells. Use ``builder()`` to avoid that copy for very large inputs.
+        """
+        return _prepend_all(values if isinstance(values, (list, tuple)) else list(values), Nil())
+
+    @staticmethod
+    def builder() -> 'ImmutableListBuilder[T]':
+        return ImmutableListBuilder()
 
     @staticmethod
     def empty():
@@ -40,8 +54,48 @@ class ImmutableList(ABC, Generic[T]):
     def __len__(self):
         pass
 
-    def __iter__(self):
-        return ImmutableListIterator(self)
+    def __iter__(self) -> Iterator[T]:
+        return _walk(self)
+
+    def __reversed__(self) -> Iterator[T]:
+        """ Iterates from the last element to the first without building a reversed list.
+
+        Short lists are buffered in one chunk. Longer ones remember every k-th cell, k being about
+        the square root of the length, and then reverse one chunk of k elements at a time, so only
+        O(sqrt(n)) extra references are held.
+        """
+        size = len(self)
+        chunk = max(_REVERSE_CHUNK, int(size ** 0.5))
+        starts = []
+        current = self
+        for i in range(0, size, chunk):
+            starts.append(current)
+            if i + chunk < size:
+                current = _cell_at(current, chunk)
+        for start in reversed(starts):
+            yield from reversed(list(islice(_walk(start), chunk)))
+
+    def __contains__(self, value: T) -> bool:
+        """ O(n), stops at the first match. """
+        return self.index_of(value) >= 0
+
+    def __getitem__(self, index):
+        """ Returns the element at ``index`` in O(index), or a sub list for a slice.
+
+        A slice with step 1 copies only the cells before ``stop`` and shares the rest if it reaches
+        the end of the list.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.drop(start).take(stop - start)
+            if step > 0:
+                return _prepend_all(list(islice(self, start, stop, step)), Nil())
+            values = list(self)
+            return _prepend_all([values[i] for i in range(start, stop, step)], Nil())
+        if index < 0 <= index + len(self):
+            index += len(self)
+        return self.get(index)
 
     @abstractmethod
     def head(self) -> T:
@@ -70,6 +124,63 @@ class ImmutableList(ABC, Generic[T]):
     def prepend(self, value: T) -> 'ImmutableList[T]':
         return Cons(value, self)
 
+    def concat(self, other: 'ImmutableList[T]') -> 'ImmutableList[T]':
+        """ Returns this list followed by ``other`` in O(len(self)), sharing all cells of ``other``.
+
+        Use a ``CatenableList`` to concatenate many lists in O(1) each.
+        """
+        if other.is_empty():
+            return self
+        return _prepend_all(list(self), other)
+
+    def append_all(self, values: Iterable[T]) -> 'ImmutableList[T]':
+        if isinstance(values, ImmutableList):
+            return self.concat(values)
+        return self.concat(ImmutableList.of_list(list(values)))
+
+    def __add__(self, other: 'ImmutableList[T]') -> 'ImmutableList[T]':
+        return self.concat(other)
+
+    def append(self, value: T) -> 'ImmutableList[T]':
+        """ Returns a list with ``value`` at the end; O(n), as every cell has to be copied. """
+        return _prepend_all(list(self), Cons(value, Nil()))
+
+    def insert(self, index: int, value: T) -> 'ImmutableList[T]':
+        """ Inserts ``value`` before ``index`` in O(index), sharing all cells from ``index`` on. """
+        if index < 0 or index > len(self):
+            raise IndexError("index " + str(index) + " out of range")
+        values, rest = _split_at(self, index)
+        return _prepend_all(values, Cons(value, rest))
+
+    def get(self, index: int) -> T:
+        """ Returns the element at ``index`` in O(index). """
+        if index < 0 or index >= len(self):
+            raise IndexError("index " + str(index) + " out of range")
+        return _cell_at(self, index).value
+
+    def update(self, index: int, value: T) -> 'ImmutableList[T]':
+        """ Replaces the element at ``index`` in O(index), sharing all cells after it. """
+        if index < 0 or index >= len(self):
+            raise IndexError("index " + str(index) + " out of range")
+        values, rest = _split_at(self, index)
+        return _prepend_all(values, Cons(value, rest.next))
+
+    def remove_at(self, index: int) -> 'ImmutableList[T]':
+        """ Removes the element at ``index`` in O(index), sharing all cells after it. """
+        if index < 0 or index >= len(self):
+            raise IndexError("index " + str(index) + " out of range")
+        values, rest = _split_at(self, index)
+        return _prepend_all(values, rest.next)
+
+    def index_of(self, value: T, from_index: int = 0) -> int:
+        """ Returns the index of the first occurrence of ``value`` at or after ``from_index``, or -1. O(n). """
+        return _index_of(self.drop(from_index), value, max(from_index, 0))
+
+    def partition(self, predicate: Callable[[T], bool]) -> Tuple['ImmutableList[T]', 'ImmutableList[T]']:
+        """ Splits the list into the elements matching ``predicate`` and the rest, in one O(n) pass. """
+        matching, others = _partition(self, predicate)
+        return _prepend_all(matching, Nil()), _prepend_all(others, Nil())
+
     def peek(self) -> T:
         return self.head()
 
@@ -96,7 +207,7 @@ class ImmutableList(ABC, Generic[T]):
         return result
 
     def drop_right(self, n: int) -> 'ImmutableList[T]':
-        return self.reverse().drop(n).reverse()
+        return self.take(len(self) - n)
 
     def drop_until(self, predicate: Callable[[T], bool]) -> 'ImmutableList[T]':
         return self.drop_while(lambda x: not predicate(x))
@@ -112,7 +223,14 @@ class ImmutableList(ABC, Generic[T]):
         return result
 
     def drop_right_while(self, predicate: Callable[[T], bool]) -> 'ImmutableList[T]':
-        return self.reverse().drop_while(predicate).reverse()
+        values = list(_walk(self))
+        keep = len(values)
+        while keep > 0 and predicate(values[keep - 1]):
+            keep -= 1
+
+        if keep == len(values):
+            return self
+        return _prepend_all(values[:keep], Nil())
 
     @abstractmethod
     def or_else(self, list: 'ImmutableList[U]') -> 'ImmutableList[U]':
@@ -125,16 +243,8 @@ class ImmutableList(ABC, Generic[T]):
         if n >= len(self):
             return self
 
-        result = ImmutableList.empty()
-        current = self
-        for i in range(0, n):
-            if current.is_empty():
-                return result
-            result = result.prepend(current.head())
-
-            current = current.tail()
-
-        return result.reverse()
+        values, _ = _split_at(self, n)
+        return _prepend_all(values, Nil())
 
     def take_until(self, predicate: Callable[[T], bool]) -> 'ImmutableList[T]':
         result = ImmutableList.empty()
@@ -149,13 +259,13 @@ class ImmutableList(ABC, Generic[T]):
         return self.take_until(lambda x: not predicate(x))
 
     def take_right(self, n: int) -> 'ImmutableList[T]':
-        return self.reverse().take(n).reverse()
+        return self.drop(len(self) - n)
 
     def take_right_until(self, predicate: Callable[[T], bool]) -> 'ImmutableList[T]':
-        return self.reverse().take_until(predicate).reverse()
+        return self.take_right_while(lambda x: not predicate(x))
 
     def take_right_while(self, predicate: Callable[[T], bool]) -> 'ImmutableList[T]':
-        return self.reverse().take_while(predicate).reverse()
+        return _after_last_miss(self, predicate)
 
     def filter(self, predicate: Callable[[T], bool]) -> 'ImmutableList[T]':
         result = ImmutableList.empty()
@@ -177,6 +287,77 @@ class ImmutableList(ABC, Generic[T]):
 
         return list.reverse()
 
+    def group_by(self, key: Callable[[T], K]) -> HashMap[K, 'ImmutableList[T]']:
+        """ Groups the elements by ``key`` in one O(n) pass; every group keeps the order of the list. """
+        return HashMap.of_entries((k, _prepend_all(values, Nil())) for k, values in _groups(self, key).items())
+
+    def count_by(self, key: Callable[[T], K]) -> HashMap[K, int]:
+        """ Counts the elements per ``key`` in one O(n) pass. """
+        return HashMap.of_dict(Counter(map(key, _walk(self))))
+
+    def distinct(self) -> 'ImmutableList[T]':
+        """ Keeps the first occurrence of every element in O(n); the elements must be hashable. """
+        return self.distinct_by(lambda x: x)
+
+    def distinct_by(self, key: Callable[[T], K]) -> 'ImmutableList[T]':
+        """ Keeps the first element for every ``key`` in O(n), returning this list if there are no duplicates. """
+        values = _first_per_key(self, key)
+        if len(values) == len(self):
+            return self
+        return _prepend_all(values, Nil())
+
+    def sorted(self, key: Optional[Callable[[T], K]] = None, reverse: bool = False) -> 'ImmutableList[T]':
+        """ Returns the elements sorted stably in O(n log n); equal elements keep their order, also if ``reverse``. """
+        return _prepend_all(sorted(self, key=key, reverse=reverse), Nil())
+
+    def sort_by(self, key: Callable[[T], K], reverse: bool = False) -> 'ImmutableList[T]':
+        return self.sorted(key=key, reverse=reverse)
+
+    def min_by(self, key: Callable[[T], K]) -> Optional[T]:
+        """ Returns the first element with the smallest ``key`` in O(n), or None if the list is empty. """
+        return min(self, key=key, default=None)
+
+    def max_by(self, key: Callable[[T], K]) -> Optional[T]:
+        """ Returns the first element with the largest ``key`` in O(n), or None if the list is empty. """
+        return max(self, key=key, default=None)
+
+    def top_k(self, n: int, key: Optional[Callable[[T], K]] = None, reverse: bool = False) -> 'ImmutableList[T]':
+        """ Returns the ``n`` largest elements, largest first, with a heap of size ``n``: O(len * log n).
+
+        Ties are kept in list order. With ``reverse`` the ``n`` smallest elements are returned instead.
+        """
+        select = nsmallest if reverse else nlargest
+        return _prepend_all(select(n, self, key=key), Nil())
+
+    def merge_sorted(self, other: 'ImmutableList[T]', key: Optional[Callable[[T], K]] = None) -> 'ImmutableList[T]':
+        """ Merges two sorted lists in O(n + m) into one sorted list.
+
+        On ties the elements of this list come first. Once one list is exhausted, the rest of the
+        other list is shared instead of copied.
+        """
+        return _merge(self, other, _identity if key is None else key)
+
+    def to_string(self, limit: Optional[int] = None) -> str:
+        """ Renders the list like ``repr`` in linear time, eliding all elements after the first ``limit``. """
+        return _to_string(self, limit)
+
+    def par_map(self, func: Callable[[T], U], executor: Optional[Executor] = None,
+                chunk_size: Optional[int] = None) -> 'ImmutableList[U]':
+        """ Like ``map``, but maps chunks of the list in parallel on ``executor``.
+
+        Without an executor the chunks run on a ``ProcessPoolExecutor`` started for the call, so
+        ``func`` has to be picklable.
+        """
+        return ImmutableList.from_iterable(parallel.par_map(self, len(self), func, executor, chunk_size))
+
+    def par_fold(self, zero: T, combine: Callable[[T, T], T], executor: Optional[Executor] = None,
+                 chunk_size: Optional[int] = None) -> T:
+        """ Folds chunks of the list in parallel; ``combine`` must be associative with identity ``zero``. """
+        return parallel.par_fold(self, len(self), zero, combine, executor, chunk_size)
+
+    def view(self) -> 'ImmutableListView[T]':
+        return ImmutableListView(self)
+
     def zip(self, other: 'ImmutableList[U]') -> 'ImmutableList[Tuple[T,U]]':
         return self.zip_with(other, lambda x, y: (x, y))
 
@@ -198,42 +379,58 @@ class ImmutableList(ABC, Generic[T]):
         return result.reverse()
 
 
-# @abstractmethod
-# def append(self, value: T) -> 'ImmutableList[T]':
-#     pass
-#
-#
-# @abstractmethod
-# def partition(self, predicate: Callable[[T], bool]) -> 'ImmutableList[U]':
-#     pass
-#
-# @abstractmethod
-# def insert(self, index: int, element: T) -> 'ImmutableList[U]':
-#     pass
-
-
 class Cons(ImmutableList, Generic[T]):
+    __slots__ = ("value", "next", "_size", "_hash")
 
     def __init__(self, value: T, next: ImmutableList[T]):
         self.value = value
         self.next = next
+        self._size = next._size + 1
+        self._hash = None
 
     def __len__(self):
-        current = self
-        acc = 0
-        while not current.is_empty():
-            acc += 1
-            current = current.tail()
-        return acc
+        return self._size
 
     def __eq__(self, o: object) -> bool:
-        if isinstance(o, Cons):
-            return self.value == o.value and self.next == o.next
-        else:
+        if not isinstance(o, Cons) or self._size != o._size:
             return False
+        if self._hash is not None and o._hash is not None and self._hash != o._hash:
+            return False
+
+        current = self
+        while current is not o:
+            if not isinstance(current, Cons) or not isinstance(o, Cons):
+                return current == o
+            if current.value != o.value:
+                return False
+            current = current.next
+            o = o.next
+
+        return True
+
+    def __hash__(self):
+        result = self._hash
+        if result is None:
+            # hash every cell that has no cached hash yet, starting from the cell closest to the end
+            pending = []
+            current = self
+            while isinstance(current, Cons) and current._hash is None:
+                pending.append(current)
+                current = current.next
+
+            result = hash(current)
+            for cell in reversed(pending):
+                result = hash((cell.value, result))
+                cell._hash = result
+
+        return result
+
+    def __reduce__(self):
+        # pickled as one flat list instead of a chain of nested cells
+        return ImmutableList.of_list, (list(self),)
 
     def __repr__(self):
-        return "(" + str(self.value) + ", " + str(self.next) + ")"
+        return self.to_string()
 
     def map(self, func: Callable[[T], U]) -> ImmutableList[U]:
         current = self
@@ -247,9 +444,9 @@ class Cons(ImmutableList, Generic[T]):
     def reverse(self) -> ImmutableList[T]:
         current = self
         result = Nil()
-        while not current.is_empty():
-            result = result.prepend(current.head())
-            current = current.tail()
+        while isinstance(current, Cons):
+            result = Cons(current.value, result)
+            current = current.next
         return result
 
     def head(self) -> T:
@@ -274,7 +471,14 @@ class Cons(ImmutableList, Generic[T]):
 
 
 class Nil(ImmutableList):
-    pass
+    __slots__ = ()
+    _size = 0
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
     def __len__(self):
         return 0
@@ -282,6 +486,12 @@ class Nil(ImmutableList):
     def __eq__(self, other):
         return isinstance(other, Nil)
 
+    def __hash__(self):
+        return hash(Nil)
+
+    def __reduce__(self):
+        return Nil, ()
+
     def __repr__(self):
         return "Nil()"
 
@@ -307,25 +517,246 @@ class Nil(ImmutableList):
         return list
 
 
-def _sign(x):
-    if x > 0:
-        return 1
-    elif x < 0:
-        return -1
-    elif x == 0:
-        return 0
-    else:
-        return x
+class ImmutableListBuilder(Generic[T]):
+    """ Mutable builder that links cells front to back, like a Clojure transient.
+
+    The cells are only reachable through the builder until ``build`` fixes up their sizes and hands
+    out the finished list, after which the builder starts over empty.
+
+    This saves the intermediate Python list that ``from_iterable`` copies the values into, about 8
+    bytes per element of peak memory, but is roughly 30% slower because every cell is written twice.
+    Prefer ``from_iterable`` unless peak memory matters.
+    """
+
+    def __init__(self):
+        self._first = Nil()
+        self._last = None
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value: T) -> 'ImmutableListBuilder[T]':
+        cell = Cons(value, Nil())
+        if self._last is None:
+            self._first = cell
+        else:
+            self._last.next = cell
+        self._last = cell
+        self._count += 1
+        return self
+
+    def extend(self, values: Iterable[T]) -> 'ImmutableListBuilder[T]':
+        nil = Nil()
+        last = self._last
+        count = self._count
+        try:
+            for value in values:
+                cell = Cons(value, nil)
+                if last is None:
+                    self._first = cell
+                else:
+                    last.next = cell
+                last = cell
+                count += 1
+        finally:
+            # keep the builder consistent with the linked cells if ``values`` raises part way
+            self._last = last
+            self._count = count
+        return self
+
+    def build(self) -> ImmutableList[T]:
+        result = self._first
+        size = self._count
+        current = result
+        while size > 0:
+            current._size = size
+            current = current.next
+            size -= 1
+
+        self._first = Nil()
+        self._last = None
+        self._count = 0
+        return result
+
+
+def _identity(value: T) -> T:
+    return value
+
+
+def _cell_at(immutable_list: ImmutableList[T], index: int) -> ImmutableList[T]:
+    current = immutable_list
+    for _ in range(index):
+        current = current.next
+    return current
+
+
+def _split_at(immutable_list: ImmutableList[T], index: int) -> Tuple[List[T], ImmutableList[T]]:
+    # the first index values and the cell at index, which can be shared by the result
+    values = []
+    current = immutable_list
+    for _ in range(index):
+        values.append(current.value)
+        current = current.next
+    return values, current
+
+
+def _after_last_miss(immutable_list: ImmutableList[T], predicate: Callable[[T], bool]) -> ImmutableList[T]:
+    # the cells after the last element not matching predicate
+    result = immutable_list
+    current = immutable_list
+    while isinstance(current, Cons):
+        if not predicate(current.value):
+            result = current.next
+        current = current.next
+    return result
+
+
+def _to_string(immutable_list: ImmutableList[T], limit: Optional[int]) -> str:
+    parts = []
+    current = immutable_list
+    while isinstance(current, Cons):
+        if limit is not None and len(parts) >= limit:
+            return "".join(parts) + "..." + ")" * len(parts)
+        parts.append("(" + str(current.value) + ", ")
+        current = current.next
+
+    return "".join(parts) + "Nil()" + ")" * len(parts)
+
+
+def _groups(immutable_list: ImmutableList[T], key: Callable[[T], K]) -> Dict[K, List[T]]:
+    groups = {}
+    current = immutable_list
+    while isinstance(current, Cons):
+        groups.setdefault(key(current.value), []).append(current.value)
+        current = current.next
+    return groups
+
+
+def _first_per_key(immutable_list: ImmutableList[T], key: Callable[[T], K]) -> List[T]:
+    seen = set()
+    values = []
+    current = immutable_list
+    while isinstance(current, Cons):
+        k = key(current.value)
+        if k not in seen:
+            seen.add(k)
+            values.append(current.value)
+        current = current.next
+    return values
+
+
+def _merge(left: ImmutableList[T], right: ImmutableList[T], key: Callable) -> ImmutableList[T]:
+    values = []
+    while isinstance(left, Cons) and isinstance(right, Cons):
+        if key(right.value) < key(left.value):
+            values.append(right.value)
+            right = right.next
+        else:
+            values.append(left.value)
+            left = left.next
+    return _prepend_all(values, right if left.is_empty() else left)
+
+
+def _partition(immutable_list: ImmutableList[T], predicate: Callable[[T], bool]) -> Tuple[List[T], List[T]]:
+    matching = []
+    others = []
+    current = immutable_list
+    while isinstance(current, Cons):
+        if predicate(current.value):
+            matching.append(current.value)
+        else:
+            others.append(current.value)
+        current = current.next
+    return matching, others
+
+
+def _index_of(immutable_list: ImmutableList[T], value: T, index: int) -> int:
+    current = immutable_list
+    while isinstance(current, Cons):
+        if current.value is value or current.value == value:
+            return index
+        current = current.next
+        index += 1
+    return -1
+
+
+def _prepend_all(values: List[T], suffix: ImmutableList[T]) -> ImmutableList[T]:
+    result = suffix
+    for value in reversed(values):
+        result = Cons(value, result)
+    return result
 
 
 class ImmutableListIterator(Generic[T]):
     def __init__(self, immutable_list: ImmutableList[T]):
         self.immutable_list = immutable_list
 
+    def __iter__(self) -> 'ImmutableListIterator[T]':
+        return self
+
     def __next__(self) -> T:
-        if self.immutable_list.is_empty():
+        current = self.immutable_list
+        if not isinstance(current, Cons):
             raise StopIteration()
 
-        current = self.immutable_list.head()
-        self.immutable_list = self.immutable_list.tail()
-        return current
+        self.immutable_list = current.next
+        return current.value
+
+
+class ImmutableListView(Generic[T]):
+    """ Lazy view on an ImmutableList.
+
+    Transformations only record a stage. The stages are fused into one pass over the source when the
+    view is consumed by ``to_list``, ``fold_left`` or iteration, so no intermediate lists are built.
+    """
+
+    def __init__(self, source: ImmutableList, stages: Tuple[Callable[[Iterator], Iterator], ...] = ()):
+        self._source = source
+        self._stages = stages
+
+    def __iter__(self) -> Iterator[T]:
+        iterator = _walk(self._source)
+        for stage in self._stages:
+            iterator = stage(iterator)
+        return iterator
+
+    def __repr__(self):
+        return "ImmutableListView(" + repr(self._source) + ", " + str(len(self._stages)) + " stages)"
+
+    def map(self, func: Callable[[T], U]) -> 'ImmutableListView[U]':
+        return self._with_stage(lambda iterator: map(func, iterator))
+
+    def filter(self, predicate: Callable[[T], bool]) -> 'ImmutableListView[T]':
+        return self._with_stage(lambda iterator: filter(predicate, iterator))
+
+    def flat_map(self, func: Callable[[T], Iterable[U]]) -> 'ImmutableListView[U]':
+        return self._with_stage(lambda iterator: chain.from_iterable(map(func, iterator)))
+
+    def take(self, n: int) -> 'ImmutableListView[T]':
+        return self._with_stage(lambda iterator: islice(iterator, max(n, 0)))
+
+    def drop(self, n: int) -> 'ImmutableListView[T]':
+        return self._with_stage(lambda iterator: islice(iterator, max(n, 0), None))
+
+    def take_while(self, predicate: Callable[[T], bool]) -> 'ImmutableListView[T]':
+        return self._with_stage(lambda iterator: takewhile(predicate, iterator))
+
+    def drop_while(self, predicate: Callable[[T], bool]) -> 'ImmutableListView[T]':
+        return self._with_stage(lambda iterator: dropwhile(predicate, iterator))
+
+    def fold_left(self, zero: U, combine: Callable[[U, T], U]) -> U:
+        return reduce(combine, iter(self), zero)
+
+    def to_list(self) -> ImmutableList[T]:
+        return ImmutableList.of_list(list(self))
+
+    def _with_stage(self, stage: Callable[[Iterator], Iterator]) -> 'ImmutableListView':
+        return ImmutableListView(self._source, self._stages + (stage,))
+
+
+def _walk(immutable_list: ImmutableList[T]) -> Iterator[T]:
+    current = immutable_list
+    while isinstance(current, Cons):
+        yield current.value
+        current = current.next
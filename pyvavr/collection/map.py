@@ -0,0 +1,155 @@
+from typing import Generic, TypeVar, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from pyvavr.collection import hamt
+
+K = TypeVar("K")  # pragma: no mutate
+V = TypeVar("V")  # pragma: no mutate
+L = TypeVar("L")  # pragma: no mutate
+W = TypeVar("W")  # pragma: no mutate
+U = TypeVar("U")  # pragma: no mutate
+
+
+class HashMap(Generic[K, V]):
+    """ Persistent map backed by a hash array mapped trie.
+
+    ``get``, ``put`` and ``remove`` are O(log32 n); updates copy only the path to the changed entry
+    and share everything else with the previous version. Iteration yields ``(key, value)`` tuples.
+    """
+    __slots__ = ("_root", "_hash")
+
+    def __init__(self, root: hamt.Node = hamt.EMPTY):
+        self._root = root
+        self._hash = None
+
+    @staticmethod
+    def of(*entries: Tuple[K, V]) -> 'HashMap[K, V]':
+        return HashMap.of_entries(entries)
+
+    @staticmethod
+    def of_entries(entries: Iterable[Tuple[K, V]]) -> 'HashMap[K, V]':
+        root = hamt.EMPTY
+        for key, value in entries:
+            root = root.put(0, hamt.hash_key(key), key, value)
+        return HashMap(root)
+
+    @staticmethod
+    def of_dict(values: Dict[K, V]) -> 'HashMap[K, V]':
+        return HashMap.of_entries(values.items())
+
+    @staticmethod
+    def empty() -> 'HashMap[K, V]':
+        return _EMPTY
+
+    def __len__(self):
+        return self._root.size
+
+    def __iter__(self) -> Iterator[Tuple[K, V]]:
+        for _, key, value in self._root.entries():
+            yield key, value
+
+    def __contains__(self, key: K) -> bool:
+        return self.contains_key(key)
+
+    def __getitem__(self, key: K) -> V:
+        value = self._root.get(0, hamt.hash_key(key), key)
+        if value is hamt.NOT_FOUND:
+            raise KeyError(key)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, HashMap) or len(self) != len(other):
+            return False
+        return all(other._root.get(0, h, key) == value for h, key, value in self._root.entries())
+
+    def __hash__(self):
+        if self._hash is None:
+            result = 0
+            for entry in self._root.entries():
+                result ^= hash(entry[1:])
+            self._hash = result
+        return self._hash
+
+    def __reduce__(self):
+        return HashMap.of_entries, (list(self),)
+
+    def __repr__(self):
+        return "HashMap(" + ", ".join(repr(entry) for entry in self) + ")"
+
+    def is_empty(self) -> bool:
+        return self._root.size == 0
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        value = self._root.get(0, hamt.hash_key(key), key)
+        return default if value is hamt.NOT_FOUND else value
+
+    def contains_key(self, key: K) -> bool:
+        return self._root.get(0, hamt.hash_key(key), key) is not hamt.NOT_FOUND
+
+    def put(self, key: K, value: V) -> 'HashMap[K, V]':
+        root = self._root.put(0, hamt.hash_key(key), key, value)
+        return self if root is self._root else HashMap(root)
+
+    def remove(self, key: K) -> 'HashMap[K, V]':
+        root = self._root.remove(0, hamt.hash_key(key), key)
+        if root is self._root:
+            return self
+        return HashMap(root or hamt.EMPTY)
+
+    def merge(self, other: 'HashMap[K, V]', resolve: Optional[Callable[[V, V], V]] = None) -> 'HashMap[K, V]':
+        """ Merges ``other`` into this map trie by trie instead of key by key.
+
+        Subtrees that only exist in one of the maps are reused as they are. Keys present in both
+        maps keep the value of this map unless ``resolve(this_value, other_value)`` is given.
+        """
+        if other.is_empty():
+            return self
+        if self.is_empty():
+            return other
+        return HashMap(hamt.merge(self._root, other._root, 0, resolve))
+
+    def keys(self) -> Iterator[K]:
+        return (key for _, key, _ in self._root.entries())
+
+    def values(self) -> Iterator[V]:
+        return (value for _, _, value in self._root.entries())
+
+    def map(self, func: Callable[[K, V], Tuple[L, W]]) -> 'HashMap[L, W]':
+        return HashMap.of_entries(func(key, value) for key, value in self)
+
+    def map_values(self, func: Callable[[V], W]) -> 'HashMap[K, W]':
+        return HashMap(_map_values(self._root, func))
+
+    def filter(self, predicate: Callable[[K, V], bool]) -> 'HashMap[K, V]':
+        root = self._root
+        for h, key, value in self._root.entries():
+            if not predicate(key, value):
+                root = root.remove(0, h, key) or hamt.EMPTY
+        return self if root is self._root else HashMap(root)
+
+    def fold_left(self, zero: U, combine: Callable[[U, Tuple[K, V]], U]) -> U:
+        result = zero
+        for entry in self:
+            result = combine(result, entry)
+        return result
+
+    def or_else(self, alternative: 'HashMap[K, V]') -> 'HashMap[K, V]':
+        if self.is_empty():
+            return alternative
+        return self
+
+    def to_dict(self) -> Dict[K, V]:
+        return dict(self)
+
+
+def _map_values(node: hamt.Node, func: Callable[[V], W]) -> hamt.Node:
+    # keys and hashes stay the same, so the trie keeps its shape and only the values are replaced
+    if isinstance(node, hamt.CollisionNode):
+        return hamt.CollisionNode(node.hash, tuple((h, key, func(value)) for h, key, value in node.pairs))
+    children = tuple((child[0], child[1], func(child[2])) if type(child) is tuple else _map_values(child, func)
+                     for child in node.children)
+    return hamt.BitmapNode(node.bitmap, children, node.size)
+
+
+_EMPTY = HashMap()
@@ -0,0 +1,260 @@
+import pickle
+from array import array
+from functools import reduce
+from itertools import compress
+from typing import Generic, TypeVar, Callable, Iterable, Iterator, Optional, Union
+
+from pyvavr import ValueException
+from pyvavr.collection.vector import Vector
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+N = TypeVar("N", int, float)  # pragma: no mutate
+U = TypeVar("U")  # pragma: no mutate
+
+_CHUNK_SIZE = 1024  # pragma: no mutate
+
+
+class NumericVector(Generic[N]):
+    """ Persistent vector of machine numbers stored in fixed size array chunks.
+
+    The chunks are NumPy arrays if NumPy is installed and ``array.array`` otherwise; they are held in
+    a ``Vector``, so updates copy one chunk plus the trie path to it. ``map``, ``filter``,
+    ``fold_left`` and ``zip_with`` hand whole chunks to NumPy ufuncs, or to any callable if
+    ``vectorized=True``, and fall back to calling the function per element.
+    """
+    __slots__ = ("_chunks", "_len")
+    _typecode = None
+    _dtype = None
+    _kinds = ""
+
+    def __init__(self, chunks: Vector = Vector.empty(), length: int = 0):
+        self._chunks = chunks
+        self._len = length
+
+    @classmethod
+    def of(cls, *values: N) -> 'NumericVector[N]':
+        return cls.of_iterable(values)
+
+    @classmethod
+    def of_iterable(cls, values: Iterable[N]) -> 'NumericVector[N]':
+        return cls._of_data(cls._data_of(values))
+
+    @classmethod
+    def empty(cls) -> 'NumericVector[N]':
+        return cls()
+
+    @classmethod
+    def _of_data(cls, data) -> 'NumericVector[N]':
+        chunks = Vector.of_iterable(_freeze(data[i:i + _CHUNK_SIZE]) for i in range(0, len(data), _CHUNK_SIZE))
+        return cls(chunks, len(data))
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self) -> Iterator[N]:
+        for chunk in self._chunks:
+            yield from chunk.tolist()
+
+    def __getitem__(self, index: int) -> N:
+        if index < 0 <= index + self._len:
+            index += self._len
+        return self.get(index)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, NumericVector) or self._len != other._len:
+            return False
+        return all(x == y for x, y in zip(self, other))
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce_ex__(self, protocol):
+        # the elements are pickled as one raw buffer, out of band with protocol 5
+        data = self._contiguous()
+        payload = pickle.PickleBuffer(data) if protocol >= 5 else data.tobytes()
+        return _from_buffer, (type(self), payload)
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + ", ".join(repr(x) for x in self) + ")"
+
+    def is_empty(self) -> bool:
+        return self._len == 0
+
+    def get(self, index: int) -> N:
+        if index < 0 or index >= self._len:
+            raise IndexError("index " + str(index) + " out of range")
+        value = self._chunks.get(index // _CHUNK_SIZE)[index % _CHUNK_SIZE]
+        return value if numpy is None else value.item()
+
+    def update(self, index: int, value: N) -> 'NumericVector[N]':
+        if index < 0 or index >= self._len:
+            raise IndexError("index " + str(index) + " out of range")
+        position = index // _CHUNK_SIZE
+        chunk = self._copy(self._chunks.get(position))
+        chunk[index % _CHUNK_SIZE] = self._data_of((value,))[0]
+        return type(self)(self._chunks.update(position, _freeze(chunk)), self._len)
+
+    def append(self, value: N) -> 'NumericVector[N]':
+        """ Appends ``value`` by copying the last chunk, up to 1024 numbers, in one C level copy.
+
+        Use ``of_iterable`` to build large vectors instead of appending element by element.
+        """
+        data = self._data_of((value,))
+        if self._len % _CHUNK_SIZE == 0:
+            return type(self)(self._chunks.append(_freeze(data)), self._len + 1)
+        chunk = self._chunks.last()
+        last = chunk + data if numpy is None else numpy.concatenate((chunk, data))
+        return type(self)(self._chunks.update(len(self._chunks) - 1, _freeze(last)), self._len + 1)
+
+    def sum(self) -> N:
+        if numpy is None:
+            return sum(sum(chunk) for chunk in self._chunks)
+        return sum(chunk.sum().item() for chunk in self._chunks)
+
+    def map(self, func: Callable, vectorized: Optional[bool] = None) -> 'NumericVector':
+        """ Applies ``func`` to every element, or once per chunk if it is a ufunc or ``vectorized``.
+
+        The result is a ``FloatVector`` if ``func`` produces floats, an ``IntVector`` otherwise.
+        """
+        if _is_vectorized(func, vectorized):
+            return _of_chunks(func(chunk) for chunk in self._chunks)
+        return _of_chunks([func(x) for x in chunk.tolist()] for chunk in self._chunks)
+
+    def filter(self, predicate: Callable, vectorized: Optional[bool] = None) -> 'NumericVector[N]':
+        """ Keeps the matching elements; a vectorized ``predicate`` returns a boolean mask per chunk. """
+        if _is_vectorized(predicate, vectorized):
+            if numpy is not None:
+                return self._of_parts(chunk[numpy.asarray(predicate(chunk), dtype=bool)] for chunk in self._chunks)
+            return self._of_parts(compress(chunk, predicate(chunk)) for chunk in self._chunks)
+        return self._of_parts([x for x in chunk.tolist() if predicate(x)] for chunk in self._chunks)
+
+    def fold_left(self, zero: U, combine: Callable[[U, N], U]) -> U:
+        """ Folds the elements from the left.
+
+        A ufunc like ``numpy.add`` is first reduced per chunk with ``combine.reduce`` and the chunk
+        results are then combined, which requires ``combine`` to be associative.
+        """
+        result = zero
+        if numpy is not None and isinstance(combine, numpy.ufunc):
+            for chunk in self._chunks:
+                result = combine(result, combine.reduce(chunk))
+            return result.item() if isinstance(result, numpy.generic) else result
+        for chunk in self._chunks:
+            result = reduce(combine, chunk.tolist(), result)
+        return result
+
+    def zip_with(self, other: 'NumericVector', func: Callable, vectorized: Optional[bool] = None) -> 'NumericVector':
+        if self._len != other._len:
+            raise ValueException("not same length")
+        if _is_vectorized(func, vectorized):
+            return _of_chunks(func(x, y) for x, y in zip(self._chunks, other._chunks))
+        return _of_chunks(list(map(func, x.tolist(), y.tolist())) for x, y in zip(self._chunks, other._chunks))
+
+    def or_else(self, alternative: 'NumericVector[N]') -> 'NumericVector[N]':
+        if self.is_empty():
+            return alternative
+        return self
+
+    def _contiguous(self):
+        chunks = list(self._chunks)
+        if numpy is None:
+            data = array(self._typecode)
+            for chunk in chunks:
+                data.extend(chunk)
+            return data
+        if not chunks:
+            return numpy.empty(0, dtype=self._dtype)
+        return numpy.ascontiguousarray(numpy.concatenate(chunks))
+
+    def _copy(self, chunk):
+        return array(self._typecode, chunk) if numpy is None else chunk.copy()
+
+    @classmethod
+    def _data_of(cls, values: Iterable[N]):
+        # like array.array, NumPy input of another kind, e.g. floats for an IntVector, is rejected
+        # with a TypeError instead of being truncated
+        if numpy is None:
+            return array(cls._typecode, values)
+        if isinstance(values, range):
+            data = numpy.arange(values.start, values.stop, values.step)
+        elif isinstance(values, numpy.ndarray):
+            data = values
+        else:
+            data = numpy.array(values if isinstance(values, (list, tuple)) else list(values))
+        if data.size == 0:
+            return numpy.empty(0, dtype=cls._dtype)
+        if data.dtype.kind not in cls._kinds:
+            raise TypeError(cls.__name__ + " cannot hold values of type " + str(data.dtype))
+        return data.astype(cls._dtype, copy=data is values)
+
+    @classmethod
+    def _of_parts(cls, parts: Iterable) -> 'NumericVector[N]':
+        if numpy is None:
+            data = array(cls._typecode)
+            for part in parts:
+                data.extend(part)
+            return cls._of_data(data)
+        parts = list(parts)
+        if not parts:
+            return cls()
+        return cls._of_data(numpy.concatenate([numpy.asarray(part, dtype=cls._dtype) for part in parts]))
+
+
+class IntVector(NumericVector[int]):
+    __slots__ = ()
+    _typecode = "q"
+    _dtype = "int64"
+    _kinds = "biu"
+
+    @classmethod
+    def range(cls, start: int, end: int, step: int = 1) -> 'IntVector':
+        if numpy is None:
+            return cls._of_data(array(cls._typecode, range(start, end, step)))
+        return cls._of_data(numpy.arange(start, end, step, dtype=cls._dtype))
+
+
+class FloatVector(NumericVector[float]):
+    __slots__ = ()
+    _typecode = "d"
+    _dtype = "float64"
+    _kinds = "biuf"
+
+
+def _is_vectorized(func: Callable, vectorized: Optional[bool]) -> bool:
+    if vectorized is not None:
+        return vectorized
+    return numpy is not None and isinstance(func, numpy.ufunc)
+
+
+def _is_float(part) -> bool:
+    if numpy is not None:
+        return numpy.asarray(part).dtype.kind == "f"
+    if isinstance(part, array):
+        return part.typecode == "d"
+    return any(isinstance(x, float) for x in part)
+
+
+def _of_chunks(parts: Iterable) -> Union[IntVector, FloatVector]:
+    parts = list(parts)
+    target = FloatVector if any(_is_float(part) for part in parts) else IntVector
+    return target._of_parts(parts)
+
+
+def _from_buffer(cls, buffer) -> NumericVector:
+    if numpy is None:
+        data = array(cls._typecode)
+        data.frombytes(memoryview(buffer).cast("B"))
+        return cls._of_data(data)
+    return cls._of_data(numpy.frombuffer(buffer, dtype=cls._dtype))
+
+
+def _freeze(chunk):
+    if numpy is not None:
+        chunk.flags.writeable = False
+    return chunk
@@ -0,0 +1,66 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial, reduce
+from itertools import chain, islice
+from typing import TypeVar, Callable, Iterable, Iterator, List, Optional
+
+T = TypeVar("T")  # pragma: no mutate
+U = TypeVar("U")  # pragma: no mutate
+
+_CHUNKS_PER_WORKER = 4  # pragma: no mutate
+
+
+def par_map(values: Iterable[T], length: int, func: Callable[[T], U], executor: Optional[Executor] = None,
+            chunk_size: Optional[int] = None) -> Iterator[U]:
+    """ Maps ``values`` chunk by chunk on ``executor`` and returns the results in their original order.
+
+    Without an executor a ``ProcessPoolExecutor`` is started for the call, so ``func`` has to be
+    picklable; pass a ``ThreadPoolExecutor`` for lambdas or I/O bound work.
+    """
+    results = _run(executor, partial(_map_chunk, func), _chunks(values, _chunk_size(length, chunk_size)))
+    return chain.from_iterable(results)
+
+
+def par_fold(values: Iterable[T], length: int, zero: T, combine: Callable[[T, T], T],
+             executor: Optional[Executor] = None, chunk_size: Optional[int] = None) -> T:
+    """ Folds every chunk on ``executor`` starting from ``zero`` and then folds the chunk results.
+
+    This is only equivalent to ``fold_left`` if ``combine`` is associative and ``zero`` is its
+    identity element, e.g. ``0`` and addition.
+    """
+    results = _run(executor, partial(_fold_chunk, zero, combine), _chunks(values, _chunk_size(length, chunk_size)))
+    return reduce(combine, results, zero)
+
+
+def _chunk_size(length: int, chunk_size: Optional[int]) -> int:
+    if chunk_size is not None:
+        return max(chunk_size, 1)
+    workers = os.cpu_count() or 1
+    return max(-(-length // (workers * _CHUNKS_PER_WORKER)), 1)
+
+
+def _chunks(values: Iterable[T], chunk_size: int) -> List[List[T]]:
+    iterator = iter(values)
+    chunks = []
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        chunks.append(chunk)
+        chunk = list(islice(iterator, chunk_size))
+    return chunks
+
+
+def _run(executor: Optional[Executor], func: Callable, chunks: List[list]) -> list:
+    if executor is not None:
+        return list(executor.map(func, chunks))
+    if len(chunks) <= 1:
+        return [func(chunk) for chunk in chunks]
+    with ProcessPoolExecutor() as pool:
+        return list(pool.map(func, chunks))
+
+
+def _map_chunk(func: Callable[[T], U], chunk: List[T]) -> List[U]:
+    return [func(value) for value in chunk]
+
+
+def _fold_chunk(zero: T, combine: Callable[[T, T], T], chunk: List[T]) -> T:
+    return reduce(combine, chunk, zero)
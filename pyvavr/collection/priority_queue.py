@@ -0,0 +1,168 @@
+from itertools import count
+from typing import Generic, TypeVar, Callable, Iterable, Iterator, Optional, Tuple
+
+from pyvavr import NoSuchElementException, ValueException
+from pyvavr.collection.list import ImmutableList
+
+T = TypeVar("T")  # pragma: no mutate
+U = TypeVar("U")  # pragma: no mutate
+
+# breaks ties between equal keys, so they are dequeued in insertion order and values are never compared
+_insertion_order = count()
+
+
+class _Node:
+    __slots__ = ("priority", "value", "children")
+
+    def __init__(self, priority: tuple, value, children: ImmutableList):
+        self.priority = priority
+        self.value = value
+        self.children = children
+
+
+class PriorityQueue(Generic[T]):
+    """ Persistent priority queue backed by a pairing heap; the smallest ``key(value)`` comes first.
+
+    ``enqueue``, ``peek`` and ``merge`` are O(1), ``dequeue`` is amortized O(log n). Equal keys are
+    dequeued in the order they were enqueued. Use a key like ``lambda task: -task.priority`` to get
+    the largest element first.
+    """
+    __slots__ = ("_root", "_size", "_key")
+
+    def __init__(self, key: Optional[Callable] = None, root: Optional[_Node] = None, size: int = 0):
+        self._key = key
+        self._root = root
+        self._size = size
+
+    @staticmethod
+    def of(*values: T, key: Optional[Callable] = None) -> 'PriorityQueue[T]':
+        return PriorityQueue.of_iterable(values, key)
+
+    @staticmethod
+    def of_iterable(values: Iterable[T], key: Optional[Callable] = None) -> 'PriorityQueue[T]':
+        queue = PriorityQueue(key)
+        for value in values:
+            queue = queue.enqueue(value)
+        return queue
+
+    @staticmethod
+    def empty(key: Optional[Callable] = None) -> 'PriorityQueue[T]':
+        return PriorityQueue(key)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates in priority order, O(log n) amortized per element. """
+        root = self._root
+        while root is not None:
+            yield root.value
+            root = _merge_pairs(root.children)
+
+    def __contains__(self, value: T) -> bool:
+        return any(x is value or x == value for x in _values(self._root))
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, PriorityQueue) or self._size != other._size:
+            return False
+        return all(x == y for x, y in zip(self, other))
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return PriorityQueue.of_iterable, (list(self), self._key)
+
+    def __repr__(self):
+        return "PriorityQueue(" + ", ".join(repr(x) for x in self) + ")"
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def enqueue(self, value: T) -> 'PriorityQueue[T]':
+        """ Adds ``value`` in O(1). """
+        key = value if self._key is None else self._key(value)
+        node = _Node((key, next(_insertion_order)), value, ImmutableList.empty())
+        return PriorityQueue(self._key, _meld(self._root, node), self._size + 1)
+
+    def dequeue(self) -> Tuple[T, 'PriorityQueue[T]']:
+        """ Returns the first element and the remaining queue in amortized O(log n). """
+        if self.is_empty():
+            raise NoSuchElementException()
+        return self._root.value, self.tail()
+
+    def peek(self) -> T:
+        return self.head()
+
+    def head(self) -> T:
+        """ Returns the first element in O(1). """
+        if self.is_empty():
+            raise NoSuchElementException("head of empty queue")
+        return self._root.value
+
+    def tail(self) -> 'PriorityQueue[T]':
+        if self.is_empty():
+            raise NoSuchElementException("tail of empty queue")
+        return PriorityQueue(self._key, _merge_pairs(self._root.children), self._size - 1)
+
+    def merge(self, other: 'PriorityQueue[T]') -> 'PriorityQueue[T]':
+        """ Merges two queues ordered by the same key function in O(1). """
+        if self._key is not other._key:
+            raise ValueException("cannot merge priority queues with different keys")
+        if other.is_empty():
+            return self
+        if self.is_empty():
+            return other
+        return PriorityQueue(self._key, _meld(self._root, other._root), self._size + other._size)
+
+    def map(self, func: Callable[[T], U], key: Optional[Callable] = None) -> 'PriorityQueue[U]':
+        return PriorityQueue.of_iterable((func(x) for x in self), key)
+
+    def filter(self, predicate: Callable[[T], bool]) -> 'PriorityQueue[T]':
+        return PriorityQueue.of_iterable((x for x in self if predicate(x)), self._key)
+
+    def fold_left(self, zero: U, combine: Callable[[U, T], U]) -> U:
+        result = zero
+        for value in self:
+            result = combine(result, value)
+        return result
+
+    def or_else(self, alternative: 'PriorityQueue[T]') -> 'PriorityQueue[T]':
+        if self.is_empty():
+            return alternative
+        return self
+
+    def to_list(self) -> ImmutableList[T]:
+        return ImmutableList.from_iterable(self)
+
+
+def _meld(first: Optional[_Node], second: Optional[_Node]) -> Optional[_Node]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    if second.priority < first.priority:
+        first, second = second, first
+    return _Node(first.priority, first.value, first.children.prepend(second))
+
+
+def _merge_pairs(children: ImmutableList) -> Optional[_Node]:
+    # the two pass pairing: meld neighbours from left to right, then the pairs from right to left
+    pairs = []
+    iterator = iter(children)
+    for first in iterator:
+        pairs.append(_meld(first, next(iterator, None)))
+    result = None
+    for node in reversed(pairs):
+        result = _meld(node, result)
+    return result
+
+
+def _values(root: Optional[_Node]) -> Iterator:
+    stack = [] if root is None else [root]
+    while stack:
+        node = stack.pop()
+        yield node.value
+        stack.extend(node.children)
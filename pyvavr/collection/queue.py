@@ -1,10 +1,14 @@
-from typing import Generic, TypeVar, List, Callable
+from concurrent.futures import Executor
+from typing import Generic, TypeVar, List, Callable, Iterable, Iterator, Optional, Tuple
 
 from pyvavr import NoSuchElementException
-from pyvavr.collection.list import ImmutableList
+from pyvavr.collection import parallel
+from pyvavr.collection.list import ImmutableList, Cons
+from pyvavr.collection.map import HashMap
 
 T = TypeVar("T")  # pragma: no mutate
 U = TypeVar("U")  # pragma: no mutate
+K = TypeVar("K")  # pragma: no mutate
 
 
 class ImmutableQueue(Generic[T]):
@@ -16,6 +20,7 @@ class ImmutableQueue(Generic[T]):
         else:
             self.front = front
             self.rear = rear
+        self._hash = None
 
     @staticmethod
     def of(*values: T) -> 'ImmutableQueue[T]':
@@ -39,11 +44,35 @@ class ImmutableQueue(Generic[T]):
     def __len__(self):
         return len(self.front) + len(self.rear)
 
-    def __iter__(self):
-        pass
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates the front and then the reversed rear without building a new list. """
+        yield from self.front
+        yield from reversed(self.rear)
 
-    def __eq__(self, other):
-        return self.front == other.front and self.rear == other.rear
+    def __reversed__(self) -> Iterator[T]:
+        yield from self.rear
+        yield from reversed(self.front)
+
+    def __contains__(self, value: T) -> bool:
+        return value in self.front or value in self.rear
+
+    def __eq__(self, other: object) -> bool:
+        """ Queues are equal if they hold equal elements in the same order, however they are split. """
+        if self is other:
+            return True
+        if not isinstance(other, ImmutableQueue) or len(self) != len(other):
+            return False
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return all(x is y or x == y for x, y in zip(self, other))
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __reduce__(self):
+        return ImmutableQueue.of_list, (list(self),)
 
     def __repr__(self):
         return self.front.__repr__() + self.rear.__repr__()
@@ -70,9 +99,84 @@ class ImmutableQueue(Generic[T]):
     def flat_map(self, func: Callable[[List[T]], U]) -> 'ImmutableQueue[U]':
         return ImmutableQueue(self.front.flat_map(func), self.rear.flat_map(func))
 
+    def par_map(self, func: Callable[[T], U], executor: Optional[Executor] = None,
+                chunk_size: Optional[int] = None) -> 'ImmutableQueue[U]':
+        """ Like ``map``, but maps chunks of the queue in parallel on ``executor``, keeping the order. """
+        values = parallel.par_map(self, len(self), func, executor, chunk_size)
+        return ImmutableQueue(front=ImmutableList.from_iterable(values))
+
+    def par_fold(self, zero: T, combine: Callable[[T, T], T], executor: Optional[Executor] = None,
+                 chunk_size: Optional[int] = None) -> T:
+        """ Folds chunks of the queue in parallel; ``combine`` must be associative with identity ``zero``. """
+        return parallel.par_fold(self, len(self), zero, combine, executor, chunk_size)
+
+    def group_by(self, key: Callable[[T], K]) -> HashMap[K, 'ImmutableQueue[T]']:
+        """ Groups the elements by ``key`` in one O(n) pass; every group keeps the order of the queue. """
+        groups = {}
+        for value in self:
+            groups.setdefault(key(value), []).append(value)
+        return HashMap.of_entries((k, ImmutableQueue.of_list(values)) for k, values in groups.items())
+
+    def count_by(self, key: Callable[[T], K]) -> HashMap[K, int]:
+        counts = {}
+        for value in self:
+            k = key(value)
+            counts[k] = counts.get(k, 0) + 1
+        return HashMap.of_dict(counts)
+
+    def partition(self, predicate: Callable[[T], bool]) -> Tuple['ImmutableQueue[T]', 'ImmutableQueue[T]']:
+        """ Splits the queue into the elements matching ``predicate`` and the rest in one O(n) pass. """
+        matching = []
+        others = []
+        for value in self:
+            (matching if predicate(value) else others).append(value)
+        return ImmutableQueue.of_list(matching), ImmutableQueue.of_list(others)
+
+    def distinct(self) -> 'ImmutableQueue[T]':
+        return self.distinct_by(lambda x: x)
+
+    def distinct_by(self, key: Callable[[T], K]) -> 'ImmutableQueue[T]':
+        """ Keeps the first element for every ``key`` in O(n), returning this queue if there are no duplicates. """
+        seen = set()
+        values = []
+        for value in self:
+            k = key(value)
+            if k not in seen:
+                seen.add(k)
+                values.append(value)
+        if len(values) == len(self):
+            return self
+        return ImmutableQueue.of_list(values)
+
     def enqueue(self, value: T) -> 'ImmutableQueue[T]':
         return ImmutableQueue(self.front, self.rear.prepend(value))
 
+    def enqueue_all(self, values: Iterable[T]) -> 'ImmutableQueue[T]':
+        """ Enqueues all ``values`` in order, building a single new queue instead of one per element. """
+        if self.is_empty():
+            front = ImmutableList.from_iterable(values)
+            return self if front.is_empty() else ImmutableQueue(front)
+        rear = self.rear
+        for value in values:
+            rear = Cons(value, rear)
+        if rear is self.rear:
+            return self
+        return ImmutableQueue(self.front, rear)
+
+    def dequeue_n(self, n: int) -> Tuple[ImmutableList[T], 'ImmutableQueue[T]']:
+        """ Dequeues up to ``n`` elements at once, returning them in order and the remaining queue.
+
+        This is O(n) if the front holds enough elements; otherwise the rear is reversed once for the
+        whole batch.
+        """
+        if n <= 0 or self.is_empty():
+            return ImmutableList.empty(), self
+        if n <= len(self.front):
+            return self.front.take(n), ImmutableQueue(self.front.drop(n), self.rear)
+        back = self.rear.reverse()
+        needed = n - len(self.front)
+        return self.front.concat(back.take(needed)), ImmutableQueue(back.drop(needed))
+
     def dequeue(self) -> T:
         if self.is_empty():
             raise NoSuchElementException()
@@ -0,0 +1,134 @@
+from typing import Generic, TypeVar, Callable, Iterable, Iterator, List, Tuple
+
+from pyvavr import NoSuchElementException
+from pyvavr.collection.list import ImmutableList
+from pyvavr.collection.stream import Stream, StreamCons
+
+T = TypeVar("T")  # pragma: no mutate
+U = TypeVar("U")  # pragma: no mutate
+
+
+class RealTimeQueue(Generic[T]):
+    """ Persistent FIFO queue with O(1) worst case ``enqueue``, ``dequeue`` and ``len``.
+
+    This is Okasaki's real-time queue: the front is a lazy ``Stream`` and the reversal of the rear is
+    interleaved with the front as a lazy rotation. Every operation forces exactly one step of that
+    rotation through the ``schedule``, so no single operation ever reverses the whole rear the way
+    ``ImmutableQueue`` does when its front runs empty.
+    """
+    __slots__ = ("_front", "_rear", "_schedule", "_size")
+
+    def __init__(self, front: Stream[T] = Stream.empty(), rear: ImmutableList[T] = ImmutableList.empty(),
+                 schedule: Stream[T] = Stream.empty(), size: int = 0):
+        self._front = front
+        self._rear = rear
+        self._schedule = schedule
+        self._size = size
+
+    @staticmethod
+    def of(*values: T) -> 'RealTimeQueue[T]':
+        return RealTimeQueue.of_iterable(values)
+
+    @staticmethod
+    def of_list(list: List[T]) -> 'RealTimeQueue[T]':
+        return RealTimeQueue.of_iterable(list)
+
+    @staticmethod
+    def of_iterable(values: Iterable[T]) -> 'RealTimeQueue[T]':
+        values = ImmutableList.from_iterable(values)
+        front = Stream.of_iterable(values)
+        return RealTimeQueue(front, ImmutableList.empty(), front, len(values))
+
+    @staticmethod
+    def empty() -> 'RealTimeQueue[T]':
+        return _EMPTY
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        yield from self._front
+        yield from reversed(self._rear)
+
+    def __contains__(self, value: T) -> bool:
+        return any(x is value or x == value for x in self)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, RealTimeQueue) or self._size != other._size:
+            return False
+        return all(x == y for x, y in zip(self, other))
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return RealTimeQueue.of_list, (list(self),)
+
+    def __repr__(self):
+        return "RealTimeQueue(" + ", ".join(repr(x) for x in self) + ")"
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def enqueue(self, value: T) -> 'RealTimeQueue[T]':
+        """ Adds ``value`` at the end in O(1) worst case. """
+        return _exec(self._front, self._rear.prepend(value), self._schedule, self._size + 1)
+
+    def dequeue(self) -> Tuple[T, 'RealTimeQueue[T]']:
+        """ Returns the first element and the remaining queue in O(1) worst case. """
+        if self.is_empty():
+            raise NoSuchElementException()
+        return self.head(), self.tail()
+
+    def peek(self) -> T:
+        return self.head()
+
+    def head(self) -> T:
+        if self.is_empty():
+            raise NoSuchElementException("head of empty queue")
+        return self._front.head()
+
+    def tail(self) -> 'RealTimeQueue[T]':
+        if self.is_empty():
+            raise NoSuchElementException("tail of empty queue")
+        return _exec(self._front.tail(), self._rear, self._schedule, self._size - 1)
+
+    def map(self, func: Callable[[T], U]) -> 'RealTimeQueue[U]':
+        return RealTimeQueue.of_iterable(func(x) for x in self)
+
+    def filter(self, predicate: Callable[[T], bool]) -> 'RealTimeQueue[T]':
+        return RealTimeQueue.of_iterable(x for x in self if predicate(x))
+
+    def fold_left(self, zero: U, combine: Callable[[U, T], U]) -> U:
+        result = zero
+        for value in self:
+            result = combine(result, value)
+        return result
+
+    def or_else(self, alternative: 'RealTimeQueue[T]') -> 'RealTimeQueue[T]':
+        if self.is_empty():
+            return alternative
+        return self
+
+
+def _exec(front: Stream[T], rear: ImmutableList[T], schedule: Stream[T], size: int) -> RealTimeQueue[T]:
+    # the schedule is the not yet evaluated suffix of the front; forcing one cell of it per
+    # operation keeps the rotation ahead of the consumers, once it is exhausted a new one starts
+    if not schedule.is_empty():
+        return RealTimeQueue(front, rear, schedule.tail(), size)
+    front = _rotate(front, rear, Stream.empty())
+    return RealTimeQueue(front, ImmutableList.empty(), front, size)
+
+
+def _rotate(front: Stream[T], rear: ImmutableList[T], accumulator: Stream[T]) -> Stream[T]:
+    # lazily computes front ++ reverse(rear) ++ accumulator, one step per forced tail;
+    # the rear is always exactly one element longer than the front
+    if front.is_empty():
+        return StreamCons(rear.head(), lambda: accumulator)
+    return StreamCons(front.head(),
+                      lambda: _rotate(front.tail(), rear.tail(), StreamCons(rear.head(), lambda: accumulator)))
+
+
+_EMPTY = RealTimeQueue()
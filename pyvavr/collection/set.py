@@ -0,0 +1,138 @@
+from typing import Generic, TypeVar, Callable, Iterable, Iterator
+
+from pyvavr.collection import hamt
+
+T = TypeVar("T")  # pragma: no mutate
+U = TypeVar("U")  # pragma: no mutate
+
+
+class HashSet(Generic[T]):
+    """ Persistent set backed by the same hash array mapped trie as ``HashMap``.
+
+    ``add``, ``remove`` and ``contains`` are O(log32 n). ``union``, ``intersection`` and
+    ``difference`` combine the tries node by node and reuse every subtree they do not have to change.
+    """
+    __slots__ = ("_root", "_hash")
+
+    def __init__(self, root: hamt.Node = hamt.EMPTY):
+        self._root = root
+        self._hash = None
+
+    @staticmethod
+    def of(*values: T) -> 'HashSet[T]':
+        return HashSet.of_iterable(values)
+
+    @staticmethod
+    def of_iterable(values: Iterable[T]) -> 'HashSet[T]':
+        root = hamt.EMPTY
+        for value in values:
+            root = root.put(0, hamt.hash_key(value), value, None)
+        return HashSet(root)
+
+    @staticmethod
+    def empty() -> 'HashSet[T]':
+        return _EMPTY
+
+    def __len__(self):
+        return self._root.size
+
+    def __iter__(self) -> Iterator[T]:
+        return (value for _, value, _ in self._root.entries())
+
+    def __contains__(self, value: T) -> bool:
+        return self._root.get(0, hamt.hash_key(value), value) is not hamt.NOT_FOUND
+
+    def __or__(self, other: 'HashSet[T]') -> 'HashSet[T]':
+        return self.union(other)
+
+    def __and__(self, other: 'HashSet[T]') -> 'HashSet[T]':
+        return self.intersection(other)
+
+    def __sub__(self, other: 'HashSet[T]') -> 'HashSet[T]':
+        return self.difference(other)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, HashSet) or len(self) != len(other):
+            return False
+        return all(other._root.get(0, h, value) is not hamt.NOT_FOUND for h, value, _ in self._root.entries())
+
+    def __hash__(self):
+        if self._hash is None:
+            result = 0
+            for h, _, _ in self._root.entries():
+                result ^= h
+            self._hash = result
+        return self._hash
+
+    def __reduce__(self):
+        return HashSet.of_iterable, (list(self),)
+
+    def __repr__(self):
+        return "HashSet(" + ", ".join(repr(value) for value in self) + ")"
+
+    def is_empty(self) -> bool:
+        return self._root.size == 0
+
+    def contains(self, value: T) -> bool:
+        return value in self
+
+    def add(self, value: T) -> 'HashSet[T]':
+        root = self._root.put(0, hamt.hash_key(value), value, None)
+        return self if root is self._root else HashSet(root)
+
+    def add_all(self, values: Iterable[T]) -> 'HashSet[T]':
+        if isinstance(values, HashSet):
+            return self.union(values)
+        root = self._root
+        for value in values:
+            root = root.put(0, hamt.hash_key(value), value, None)
+        return self if root is self._root else HashSet(root)
+
+    def remove(self, value: T) -> 'HashSet[T]':
+        root = self._root.remove(0, hamt.hash_key(value), value)
+        if root is self._root:
+            return self
+        return HashSet(root or hamt.EMPTY)
+
+    def union(self, other: 'HashSet[T]') -> 'HashSet[T]':
+        if other.is_empty():
+            return self
+        if self.is_empty():
+            return other
+        return HashSet(hamt.merge(self._root, other._root, 0))
+
+    def intersection(self, other: 'HashSet[T]') -> 'HashSet[T]':
+        root = hamt.intersect(self._root, other._root, 0)
+        if root is other._root:
+            return other
+        return self if root is self._root else HashSet(root or hamt.EMPTY)
+
+    def difference(self, other: 'HashSet[T]') -> 'HashSet[T]':
+        root = hamt.difference(self._root, other._root, 0)
+        return self if root is self._root else HashSet(root or hamt.EMPTY)
+
+    def map(self, func: Callable[[T], U]) -> 'HashSet[U]':
+        return HashSet.of_iterable(func(value) for value in self)
+
+    def filter(self, predicate: Callable[[T], bool]) -> 'HashSet[T]':
+        root = self._root
+        for h, value, _ in self._root.entries():
+            if not predicate(value):
+                root = root.remove(0, h, value) or hamt.EMPTY
+        return self if root is self._root else HashSet(root)
+
+    def fold_left(self, zero: U, combine: Callable[[U, T], U]) -> U:
+        result = zero
+        for value in self:
+            result = combine(result, value)
+        return result
+
+    def or_else(self, alternative: 'HashSet[T]') -> 'HashSet[T]':
+        if self.is_empty():
+            return alternative
+        return self
+
+
+_EMPTY = HashSet()
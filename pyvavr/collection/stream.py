@@ -0,0 +1,297 @@
+from abc import ABC, abstractmethod
+from heapq import nlargest, nsmallest
+from typing import Generic, TypeVar, List, Callable, Iterable, Iterator, Optional, Tuple
+
+from pyvavr import ValueException
+from pyvavr.collection.list import ImmutableList
+from pyvavr.collection.queue import ImmutableQueue
+
+T = TypeVar("T")  # pragma: no mutate
+U = TypeVar("U")  # pragma: no mutate
+R = TypeVar("R")  # pragma: no mutate
+
+
+class Stream(ABC, Generic[T]):
+    """ Lazy, memoizing linked list.
+
+    The head of a non-empty stream is evaluated eagerly, the tail only when it is first requested;
+    afterwards it is cached. Transformations like ``map``, ``filter`` or ``take`` return immediately
+    and only evaluate as many elements as are consumed, so they also work on infinite streams.
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def of(*values: T) -> 'Stream[T]':
+        return Stream.of_iterable(values)
+
+    @staticmethod
+    def of_list(list: List[T]) -> 'Stream[T]':
+        return Stream.of_iterable(list)
+
+    @staticmethod
+    def of_iterable(values: Iterable[T]) -> 'Stream[T]':
+        if isinstance(values, Stream):
+            return values
+        if isinstance(values, ImmutableList):
+            return _from_immutable_list(values)
+        return _from_iterator(iter(values))
+
+    @staticmethod
+    def range(start: int, end: int, step: int = 1) -> 'Stream[int]':
+        return Stream.of_iterable(range(start, end, step))
+
+    @staticmethod
+    def count(start: int = 0, step: int = 1) -> 'Stream[int]':
+        return StreamCons(start, lambda: Stream.count(start + step, step))
+
+    @staticmethod
+    def iterate(seed: T, func: Callable[[T], T]) -> 'Stream[T]':
+        return StreamCons(seed, lambda: Stream.iterate(func(seed), func))
+
+    @staticmethod
+    def continually(supplier: Callable[[], T]) -> 'Stream[T]':
+        return StreamCons(supplier(), lambda: Stream.continually(supplier))
+
+    @staticmethod
+    def empty() -> 'Stream[T]':
+        return StreamNil()
+
+    @abstractmethod
+    def head(self) -> T:
+        pass
+
+    @abstractmethod
+    def tail(self) -> 'Stream[T]':
+        pass
+
+    @abstractmethod
+    def is_empty(self) -> bool:
+        pass
+
+    def __bool__(self):
+        return not self.is_empty()
+
+    def __len__(self):
+        length = 0
+        current = self
+        while not current.is_empty():
+            length += 1
+            current = current.tail()
+        return length
+
+    def __iter__(self) -> Iterator[T]:
+        current = self
+        # do not keep the head alive while iterating, so consumed elements can be collected
+        del self
+        while not current.is_empty():
+            yield current.head()
+            current = current.tail()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Stream):
+            return False
+        current = self
+        while current is not other:
+            if current.is_empty() or other.is_empty():
+                return current.is_empty() and other.is_empty()
+            if current.head() != other.head():
+                return False
+            current = current.tail()
+            other = other.tail()
+        return True
+
+    def __repr__(self):
+        return "Stream(" + ", ".join(_evaluated_reprs(self)) + ")"
+
+    def prepend(self, value: T) -> 'Stream[T]':
+        if isinstance(self, _AppendedCons):
+            # keep the pending suffixes on the new first cell, so later appends still extend them
+            source = self._source
+            return _AppendedCons(StreamCons(value, lambda: source), self._pending)
+        return StreamCons(value, lambda: self)
+
+    def append(self, value: T) -> 'Stream[T]':
+        return self._append_lazy(lambda: StreamCons(value, Stream.empty))
+
+    def append_all(self, values: Iterable[T]) -> 'Stream[T]':
+        return self._append_lazy(lambda: Stream.of_iterable(values))
+
+    def map(self, func: Callable[[T], U]) -> 'Stream[U]':
+        if self.is_empty():
+            return self
+        return StreamCons(func(self.head()), lambda: self.tail().map(func))
+
+    def filter(self, predicate: Callable[[T], bool]) -> 'Stream[T]':
+        current = self.drop_until(predicate)
+        if current.is_empty():
+            return current
+        return StreamCons(current.head(), lambda: current.tail().filter(predicate))
+
+    def flat_map(self, func: Callable[[T], Iterable[U]]) -> 'Stream[U]':
+        current = self
+        while not current.is_empty():
+            inner = Stream.of_iterable(func(current.head()))
+            if not inner.is_empty():
+                rest = current
+                return inner._append_lazy(lambda: rest.tail().flat_map(func))
+            current = current.tail()
+        return current
+
+    def take(self, n: int) -> 'Stream[T]':
+        if n <= 0 or self.is_empty():
+            return Stream.empty()
+        if n == 1:
+            return StreamCons(self.head(), Stream.empty)
+        return StreamCons(self.head(), lambda: self.tail().take(n - 1))
+
+    def take_while(self, predicate: Callable[[T], bool]) -> 'Stream[T]':
+        if self.is_empty() or not predicate(self.head()):
+            return Stream.empty()
+        return StreamCons(self.head(), lambda: self.tail().take_while(predicate))
+
+    def take_until(self, predicate: Callable[[T], bool]) -> 'Stream[T]':
+        return self.take_while(lambda x: not predicate(x))
+
+    def drop(self, n: int) -> 'Stream[T]':
+        current = self
+        while n > 0 and not current.is_empty():
+            current = current.tail()
+            n -= 1
+        return current
+
+    def drop_while(self, predicate: Callable[[T], bool]) -> 'Stream[T]':
+        current = self
+        while not current.is_empty() and predicate(current.head()):
+            current = current.tail()
+        return current
+
+    def drop_until(self, predicate: Callable[[T], bool]) -> 'Stream[T]':
+        return self.drop_while(lambda x: not predicate(x))
+
+    def zip(self, other: 'Stream[U]') -> 'Stream[Tuple[T, U]]':
+        return self.zip_with(other, lambda x, y: (x, y))
+
+    def zip_with(self, other: 'Stream[U]', mapper: Callable[[T, U], R]) -> 'Stream[R]':
+        if self.is_empty() or other.is_empty():
+            return Stream.empty()
+        return StreamCons(mapper(self.head(), other.head()), lambda: self.tail().zip_with(other.tail(), mapper))
+
+    def fold_left(self, zero: U, combine: Callable[[U, T], U]) -> U:
+        result = zero
+        for value in self:
+            result = combine(result, value)
+        return result
+
+    def top_k(self, n: int, key: Optional[Callable] = None, reverse: bool = False) -> ImmutableList[T]:
+        """ Returns the ``n`` largest elements of a finite stream, largest first, keeping only ``n`` in memory. """
+        select = nsmallest if reverse else nlargest
+        return ImmutableList.of_list(select(n, self, key=key))
+
+    def or_else(self, alternative: 'Stream[T]') -> 'Stream[T]':
+        if self.is_empty():
+            return alternative
+        return self
+
+    def to_list(self) -> ImmutableList[T]:
+        return ImmutableList.of_list(list(self))
+
+    def _append_lazy(self, supplier: Callable[[], 'Stream[T]']) -> 'Stream[T]':
+        # repeated appends extend one queue of pending suffixes instead of wrapping the previous
+        # tail again, so forcing the tail does not recurse once per append
+        if self.is_empty():
+            return supplier()
+        if isinstance(self, _AppendedCons):
+            return _AppendedCons(self._source, self._pending.enqueue(supplier))
+        return _AppendedCons(self, ImmutableQueue.of(supplier))
+
+
+class StreamCons(Stream, Generic[T]):
+    __slots__ = ("_head", "_tail", "_tail_supplier")
+
+    def __init__(self, head: T, tail: Callable[[], Stream[T]]):
+        self._head = head
+        self._tail = None
+        self._tail_supplier = tail
+
+    def head(self) -> T:
+        return self._head
+
+    def tail(self) -> Stream[T]:
+        supplier = self._tail_supplier
+        if supplier is not None:
+            self._tail = supplier()
+            self._tail_supplier = None
+        return self._tail
+
+    def is_empty(self) -> bool:
+        return False
+
+    def is_tail_evaluated(self) -> bool:
+        return self._tail_supplier is None
+
+
+class _AppendedCons(StreamCons, Generic[T]):
+    """ The cell ``source`` followed by the rest of ``source`` and then the streams in ``pending``. """
+    __slots__ = ("_source", "_pending")
+
+    def __init__(self, source: Stream[T], pending: ImmutableQueue):
+        super().__init__(source.head(), lambda: _appended(source.tail(), pending))
+        self._source = source
+        self._pending = pending
+
+
+class StreamNil(Stream):
+    __slots__ = ()
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def head(self) -> T:
+        raise ValueException("No head of an empty stream")
+
+    def tail(self) -> Stream[T]:
+        raise ValueException("No tail of an empty stream")
+
+    def is_empty(self) -> bool:
+        return True
+
+
+def _from_iterator(iterator: Iterator[T]) -> Stream[T]:
+    for value in iterator:
+        return StreamCons(value, lambda: _from_iterator(iterator))
+    return StreamNil()
+
+
+def _from_immutable_list(values: ImmutableList[T]) -> Stream[T]:
+    if values.is_empty():
+        return StreamNil()
+    return StreamCons(values.head(), lambda: _from_immutable_list(values.tail()))
+
+
+def _evaluated_reprs(stream: Stream[T]) -> Iterator[str]:
+    # the elements evaluated so far, and "?" if there is an unevaluated tail
+    current = stream
+    while isinstance(current, StreamCons):
+        yield repr(current.head())
+        if not current.is_tail_evaluated():
+            yield "?"
+            return
+        current = current.tail()
+
+
+def _appended(stream: Stream[T], pending: ImmutableQueue) -> Stream[T]:
+    while stream.is_empty():
+        if pending.is_empty():
+            return stream
+        supplier, pending = pending.dequeue()
+        stream = supplier()
+    if pending.is_empty():
+        return stream
+    if isinstance(stream, _AppendedCons):
+        # the suffixes of the inner stream go first; only they are copied, the outer ones are shared
+        inner = ImmutableList.of_list(list(stream._pending))
+        return _AppendedCons(stream._source, ImmutableQueue(inner.concat(pending.front), pending.rear))
+    return _AppendedCons(stream, pending)
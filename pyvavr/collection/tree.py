@@ -0,0 +1,514 @@
+from typing import Generic, TypeVar, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+K = TypeVar("K")  # pragma: no mutate
+V = TypeVar("V")  # pragma: no mutate
+L = TypeVar("L")  # pragma: no mutate
+W = TypeVar("W")  # pragma: no mutate
+T = TypeVar("T")  # pragma: no mutate
+U = TypeVar("U")  # pragma: no mutate
+
+# balance parameters of the weight balanced tree, see Adams' "Implementing Sets Efficiently in a
+# Functional Language" and the variant used by Haskell's Data.Map
+_DELTA = 3  # pragma: no mutate
+_RATIO = 2  # pragma: no mutate
+
+
+class _Node:
+    __slots__ = ("key", "value", "left", "right", "size")
+
+    def __init__(self, key, value, left: Optional['_Node'], right: Optional['_Node']):
+        self.key = key
+        self.value = value
+        self.left = left
+        self.right = right
+        self.size = (left.size if left else 0) + (right.size if right else 0) + 1
+
+
+class TreeMap(Generic[K, V]):
+    """ Persistent sorted map backed by a weight balanced binary tree.
+
+    ``get``, ``put``, ``remove``, ``floor`` and ``ceiling`` are O(log n). ``sub_map`` splits the tree
+    in O(log n) and shares all nodes inside the range, ``iter_range`` walks a key range lazily.
+    Keys must be mutually comparable with ``<``.
+    """
+    __slots__ = ("_root", "_hash")
+
+    def __init__(self, root: Optional[_Node] = None):
+        self._root = root
+        self._hash = None
+
+    @staticmethod
+    def of(*entries: Tuple[K, V]) -> 'TreeMap[K, V]':
+        return TreeMap.of_entries(entries)
+
+    @staticmethod
+    def of_entries(entries: Iterable[Tuple[K, V]]) -> 'TreeMap[K, V]':
+        root = None
+        for key, value in entries:
+            root = _insert(root, key, value)
+        return TreeMap(root)
+
+    @staticmethod
+    def of_dict(values: Dict[K, V]) -> 'TreeMap[K, V]':
+        return TreeMap.of_entries(values.items())
+
+    @staticmethod
+    def empty() -> 'TreeMap[K, V]':
+        return TreeMap()
+
+    def __len__(self):
+        return _size(self._root)
+
+    def __iter__(self) -> Iterator[Tuple[K, V]]:
+        return _iterate(self._root, None, None)
+
+    def __reversed__(self) -> Iterator[Tuple[K, V]]:
+        return _iterate_reversed(self._root)
+
+    def __contains__(self, key: K) -> bool:
+        return _find(self._root, key) is not None
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.sub_map(key.start, key.stop)
+        node = _find(self._root, key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, TreeMap) or len(self) != len(other):
+            return False
+        return all(x == y for x, y in zip(self, other))
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __reduce__(self):
+        # pickled as flat sorted keys and values, which rebuild a balanced tree in O(n)
+        return _tree_map_of_sorted, (list(self.keys()), list(self.values()))
+
+    def __repr__(self):
+        return "TreeMap(" + ", ".join(repr(entry) for entry in self) + ")"
+
+    def is_empty(self) -> bool:
+        return self._root is None
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        node = _find(self._root, key)
+        return default if node is None else node.value
+
+    def contains_key(self, key: K) -> bool:
+        return key in self
+
+    def put(self, key: K, value: V) -> 'TreeMap[K, V]':
+        return TreeMap(_insert(self._root, key, value))
+
+    def remove(self, key: K) -> 'TreeMap[K, V]':
+        root = _delete(self._root, key)
+        return self if root is self._root else TreeMap(root)
+
+    def min(self) -> Optional[Tuple[K, V]]:
+        return _entry(_min_node(self._root))
+
+    def max(self) -> Optional[Tuple[K, V]]:
+        return _entry(_max_node(self._root))
+
+    def floor(self, key: K) -> Optional[Tuple[K, V]]:
+        """ Returns the entry with the greatest key less than or equal to ``key``, or None. """
+        return _entry(_floor(self._root, key))
+
+    def ceiling(self, key: K) -> Optional[Tuple[K, V]]:
+        """ Returns the entry with the least key greater than or equal to ``key``, or None. """
+        return _entry(_ceiling(self._root, key))
+
+    def iter_range(self, from_key: Optional[K] = None, to_key: Optional[K] = None) -> Iterator[Tuple[K, V]]:
+        """ Lazily yields the entries with ``from_key <= key < to_key``; a missing bound is unbounded. """
+        return _iterate(self._root, from_key, to_key)
+
+    def sub_map(self, from_key: Optional[K] = None, to_key: Optional[K] = None) -> 'TreeMap[K, V]':
+        """ Returns the entries with ``from_key <= key < to_key`` as a map sharing nodes with this one. """
+        return TreeMap(_range(self._root, from_key, to_key))
+
+    def keys(self) -> Iterator[K]:
+        return (key for key, _ in self)
+
+    def values(self) -> Iterator[V]:
+        return (value for _, value in self)
+
+    def map(self, func: Callable[[K, V], Tuple[L, W]]) -> 'TreeMap[L, W]':
+        return TreeMap.of_entries(func(key, value) for key, value in self)
+
+    def map_values(self, func: Callable[[V], W]) -> 'TreeMap[K, W]':
+        return TreeMap(_map_values(self._root, func))
+
+    def filter(self, predicate: Callable[[K, V], bool]) -> 'TreeMap[K, V]':
+        return TreeMap(_filter(self._root, lambda node: predicate(node.key, node.value)))
+
+    def fold_left(self, zero: U, combine: Callable[[U, Tuple[K, V]], U]) -> U:
+        result = zero
+        for entry in self:
+            result = combine(result, entry)
+        return result
+
+    def or_else(self, alternative: 'TreeMap[K, V]') -> 'TreeMap[K, V]':
+        if self.is_empty():
+            return alternative
+        return self
+
+    def to_dict(self) -> Dict[K, V]:
+        return dict(self)
+
+
+class TreeSet(Generic[T]):
+    """ Persistent sorted set backed by the same weight balanced tree as ``TreeMap``. """
+    __slots__ = ("_root", "_hash")
+
+    def __init__(self, root: Optional[_Node] = None):
+        self._root = root
+        self._hash = None
+
+    @staticmethod
+    def of(*values: T) -> 'TreeSet[T]':
+        return TreeSet.of_iterable(values)
+
+    @staticmethod
+    def of_iterable(values: Iterable[T]) -> 'TreeSet[T]':
+        root = None
+        for value in values:
+            root = _insert(root, value, None)
+        return TreeSet(root)
+
+    @staticmethod
+    def empty() -> 'TreeSet[T]':
+        return TreeSet()
+
+    def __len__(self):
+        return _size(self._root)
+
+    def __iter__(self) -> Iterator[T]:
+        return (key for key, _ in _iterate(self._root, None, None))
+
+    def __reversed__(self) -> Iterator[T]:
+        return (key for key, _ in _iterate_reversed(self._root))
+
+    def __contains__(self, value: T) -> bool:
+        return _find(self._root, value) is not None
+
+    def __getitem__(self, index: slice) -> 'TreeSet[T]':
+        """ Returns the sub set for a slice of values, like ``sub_set``; sets cannot be indexed. """
+        if not isinstance(index, slice):
+            raise TypeError("TreeSet indices must be slices, not " + type(index).__name__)
+        return self.sub_set(index.start, index.stop)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, TreeSet) or len(self) != len(other):
+            return False
+        return all(x == y for x, y in zip(self, other))
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __reduce__(self):
+        return _tree_set_of_sorted, (list(self),)
+
+    def __repr__(self):
+        return "TreeSet(" + ", ".join(repr(value) for value in self) + ")"
+
+    def is_empty(self) -> bool:
+        return self._root is None
+
+    def contains(self, value: T) -> bool:
+        return value in self
+
+    def add(self, value: T) -> 'TreeSet[T]':
+        if value in self:
+            return self
+        return TreeSet(_insert(self._root, value, None))
+
+    def remove(self, value: T) -> 'TreeSet[T]':
+        root = _delete(self._root, value)
+        return self if root is self._root else TreeSet(root)
+
+    def min(self) -> Optional[T]:
+        return _key(_min_node(self._root))
+
+    def max(self) -> Optional[T]:
+        return _key(_max_node(self._root))
+
+    def floor(self, value: T) -> Optional[T]:
+        """ Returns the greatest element less than or equal to ``value``, or None. """
+        return _key(_floor(self._root, value))
+
+    def ceiling(self, value: T) -> Optional[T]:
+        """ Returns the least element greater than or equal to ``value``, or None. """
+        return _key(_ceiling(self._root, value))
+
+    def iter_range(self, from_value: Optional[T] = None, to_value: Optional[T] = None) -> Iterator[T]:
+        """ Lazily yields the elements with ``from_value <= element < to_value``. """
+        return (key for key, _ in _iterate(self._root, from_value, to_value))
+
+    def sub_set(self, from_value: Optional[T] = None, to_value: Optional[T] = None) -> 'TreeSet[T]':
+        """ Returns the elements with ``from_value <= element < to_value``, sharing nodes with this set. """
+        return TreeSet(_range(self._root, from_value, to_value))
+
+    def map(self, func: Callable[[T], U]) -> 'TreeSet[U]':
+        return TreeSet.of_iterable(func(value) for value in self)
+
+    def filter(self, predicate: Callable[[T], bool]) -> 'TreeSet[T]':
+        return TreeSet(_filter(self._root, lambda node: predicate(node.key)))
+
+    def fold_left(self, zero: U, combine: Callable[[U, T], U]) -> U:
+        result = zero
+        for value in self:
+            result = combine(result, value)
+        return result
+
+    def or_else(self, alternative: 'TreeSet[T]') -> 'TreeSet[T]':
+        if self.is_empty():
+            return alternative
+        return self
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node else 0
+
+
+def _entry(node: Optional[_Node]):
+    return None if node is None else (node.key, node.value)
+
+
+def _key(node: Optional[_Node]):
+    return None if node is None else node.key
+
+
+def _find(node: Optional[_Node], key) -> Optional[_Node]:
+    while node is not None:
+        if key < node.key:
+            node = node.left
+        elif node.key < key:
+            node = node.right
+        else:
+            return node
+    return None
+
+
+def _floor(node: Optional[_Node], key) -> Optional[_Node]:
+    result = None
+    while node is not None:
+        if key < node.key:
+            node = node.left
+        elif node.key < key:
+            result = node
+            node = node.right
+        else:
+            return node
+    return result
+
+
+def _ceiling(node: Optional[_Node], key) -> Optional[_Node]:
+    result = None
+    while node is not None:
+        if node.key < key:
+            node = node.right
+        elif key < node.key:
+            result = node
+            node = node.left
+        else:
+            return node
+    return result
+
+
+def _min_node(node: Optional[_Node]) -> Optional[_Node]:
+    while node is not None and node.left is not None:
+        node = node.left
+    return node
+
+
+def _max_node(node: Optional[_Node]) -> Optional[_Node]:
+    while node is not None and node.right is not None:
+        node = node.right
+    return node
+
+
+def _iterate(node: Optional[_Node], from_key, to_key) -> Iterator[Tuple]:
+    stack = []
+    while True:
+        while node is not None:
+            if from_key is not None and node.key < from_key:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        if not stack:
+            return
+        node = stack.pop()
+        if to_key is not None and not node.key < to_key:
+            return
+        yield node.key, node.value
+        node = node.right
+
+
+def _iterate_reversed(node: Optional[_Node]) -> Iterator[Tuple]:
+    stack = []
+    while True:
+        while node is not None:
+            stack.append(node)
+            node = node.right
+        if not stack:
+            return
+        node = stack.pop()
+        yield node.key, node.value
+        node = node.left
+
+
+def _balance(key, value, left: Optional[_Node], right: Optional[_Node]) -> _Node:
+    size_left = _size(left)
+    size_right = _size(right)
+    if size_left + size_right <= 1:
+        return _Node(key, value, left, right)
+    if size_right > _DELTA * size_left:
+        if _size(right.left) < _RATIO * _size(right.right):
+            return _Node(right.key, right.value, _Node(key, value, left, right.left), right.right)
+        inner = right.left
+        return _Node(inner.key, inner.value, _Node(key, value, left, inner.left),
+                     _Node(right.key, right.value, inner.right, right.right))
+    if size_left > _DELTA * size_right:
+        if _size(left.right) < _RATIO * _size(left.left):
+            return _Node(left.key, left.value, left.left, _Node(key, value, left.right, right))
+        inner = left.right
+        return _Node(inner.key, inner.value, _Node(left.key, left.value, left.left, inner.left),
+                     _Node(key, value, inner.right, right))
+    return _Node(key, value, left, right)
+
+
+def _insert(node: Optional[_Node], key, value) -> _Node:
+    if node is None:
+        return _Node(key, value, None, None)
+    if key < node.key:
+        return _balance(node.key, node.value, _insert(node.left, key, value), node.right)
+    if node.key < key:
+        return _balance(node.key, node.value, node.left, _insert(node.right, key, value))
+    return _Node(key, value, node.left, node.right)
+
+
+def _delete(node: Optional[_Node], key) -> Optional[_Node]:
+    if node is None:
+        return None
+    if key < node.key:
+        left = _delete(node.left, key)
+        return node if left is node.left else _balance(node.key, node.value, left, node.right)
+    if node.key < key:
+        right = _delete(node.right, key)
+        return node if right is node.right else _balance(node.key, node.value, node.left, right)
+    return _glue(node.left, node.right)
+
+
+def _delete_min(node: _Node) -> Tuple[_Node, Optional[_Node]]:
+    if node.left is None:
+        return node, node.right
+    minimum, left = _delete_min(node.left)
+    return minimum, _balance(node.key, node.value, left, node.right)
+
+
+def _delete_max(node: _Node) -> Tuple[_Node, Optional[_Node]]:
+    if node.right is None:
+        return node, node.left
+    maximum, right = _delete_max(node.right)
+    return maximum, _balance(node.key, node.value, node.left, right)
+
+
+def _glue(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    # joins two balanced trees of similar size where every key of left is less than every key of right
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.size > right.size:
+        maximum, left = _delete_max(left)
+        return _balance(maximum.key, maximum.value, left, right)
+    minimum, right = _delete_min(right)
+    return _balance(minimum.key, minimum.value, left, right)
+
+
+def _link(key, value, left: Optional[_Node], right: Optional[_Node]) -> _Node:
+    # joins two trees of arbitrary size with key in between them
+    if left is None:
+        return _insert(right, key, value)
+    if right is None:
+        return _insert(left, key, value)
+    if _DELTA * left.size < right.size:
+        return _balance(right.key, right.value, _link(key, value, left, right.left), right.right)
+    if _DELTA * right.size < left.size:
+        return _balance(left.key, left.value, left.left, _link(key, value, left.right, right))
+    return _Node(key, value, left, right)
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    # like _link, but without a key in between
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if _DELTA * left.size < right.size:
+        return _balance(right.key, right.value, _merge(left, right.left), right.right)
+    if _DELTA * right.size < left.size:
+        return _balance(left.key, left.value, left.left, _merge(left.right, right))
+    return _glue(left, right)
+
+
+def _range(node: Optional[_Node], from_key, to_key) -> Optional[_Node]:
+    if node is None:
+        return None
+    if from_key is not None and node.key < from_key:
+        return _range(node.right, from_key, to_key)
+    if to_key is not None and not node.key < to_key:
+        return _range(node.left, from_key, to_key)
+    left = node.left if from_key is None else _range(node.left, from_key, None)
+    right = node.right if to_key is None else _range(node.right, None, to_key)
+    if left is node.left and right is node.right:
+        return node
+    return _link(node.key, node.value, left, right)
+
+
+def _filter(node: Optional[_Node], predicate: Callable[[_Node], bool]) -> Optional[_Node]:
+    if node is None:
+        return None
+    left = _filter(node.left, predicate)
+    right = _filter(node.right, predicate)
+    if not predicate(node):
+        return _merge(left, right)
+    if left is node.left and right is node.right:
+        return node
+    return _link(node.key, node.value, left, right)
+
+
+def _map_values(node: Optional[_Node], func: Callable) -> Optional[_Node]:
+    if node is None:
+        return None
+    return _Node(node.key, func(node.value), _map_values(node.left, func), _map_values(node.right, func))
+
+
+def _of_sorted(keys: list, values: Optional[list], low: int, high: int) -> Optional[_Node]:
+    # a perfectly balanced tree always satisfies the weight balance invariant
+    if low >= high:
+        return None
+    middle = (low + high) // 2
+    value = None if values is None else values[middle]
+    return _Node(keys[middle], value, _of_sorted(keys, values, low, middle), _of_sorted(keys, values, middle + 1, high))
+
+
+def _tree_map_of_sorted(keys: list, values: list) -> TreeMap:
+    return TreeMap(_of_sorted(keys, values, 0, len(keys)))
+
+
+def _tree_set_of_sorted(values: list) -> TreeSet:
+    return TreeSet(_of_sorted(values, None, 0, len(values)))
@@ -0,0 +1,289 @@
+from typing import Generic, TypeVar, List, Callable, Iterable, Iterator, Tuple, Optional
+
+from pyvavr import ValueException
+
+T = TypeVar("T")  # pragma: no mutate
+U = TypeVar("U")  # pragma: no mutate
+R = TypeVar("R")  # pragma: no mutate
+
+_BITS = 5  # pragma: no mutate
+_BRANCHING = 1 << _BITS  # pragma: no mutate
+_MASK = _BRANCHING - 1  # pragma: no mutate
+_EMPTY_NODE = (None,) * _BRANCHING  # pragma: no mutate
+
+
+class Vector(Generic[T]):
+    """ Persistent vector backed by a 32-way bit-partitioned trie.
+
+    Elements live in the trie starting at index ``offset``, followed by a tail buffer of up to 32
+    elements. The end of the trie region is always aligned to a leaf, so appending only touches the
+    tail until it is full and is then pushed into the trie as a whole leaf. Prepending and slicing
+    move ``offset`` and the length, sharing every untouched node with the original vector.
+    """
+
+    __slots__ = ("_root", "_shift", "_offset", "_trie_len", "_tail")
+
+    def __init__(self, root: Optional[tuple] = None, shift: int = 0, offset: int = 0, trie_len: int = 0,
+                 tail: tuple = ()):
+        self._root = root
+        self._shift = shift
+        self._offset = offset
+        self._trie_len = trie_len
+        self._tail = tail
+
+    @staticmethod
+    def of(*values: T) -> 'Vector[T]':
+        return Vector.of_iterable(values)
+
+    @staticmethod
+    def of_list(list: List[T]) -> 'Vector[T]':
+        return Vector.of_iterable(list)
+
+    @staticmethod
+    def of_iterable(values: Iterable[T]) -> 'Vector[T]':
+        values = tuple(values)
+        if len(values) <= _BRANCHING:
+            return Vector(tail=values)
+
+        tail_start = ((len(values) - 1) >> _BITS) << _BITS
+        nodes = [_pad(values[i:i + _BRANCHING]) for i in range(0, tail_start, _BRANCHING)]
+        shift = 0
+        while len(nodes) > 1:
+            nodes = [_pad(tuple(nodes[i:i + _BRANCHING])) for i in range(0, len(nodes), _BRANCHING)]
+            shift += _BITS
+        return Vector(nodes[0], shift, 0, tail_start, values[tail_start:])
+
+    @staticmethod
+    def range(start: int, end: int, step: int = 1) -> 'Vector[int]':
+        return Vector.of_iterable(range(start, end, step))
+
+    @staticmethod
+    def empty() -> 'Vector[T]':
+        return _EMPTY
+
+    def __len__(self):
+        return self._trie_len + len(self._tail)
+
+    def __iter__(self) -> Iterator[T]:
+        offset = self._offset
+        end = offset + self._trie_len
+        index = offset
+        while index < end:
+            leaf = self._leaf_for(index)
+            leaf_end = min((index | _MASK) + 1, end)
+            yield from leaf[index & _MASK:((leaf_end - 1) & _MASK) + 1]
+            index = leaf_end
+        yield from self._tail
+
+    def __reversed__(self) -> Iterator[T]:
+        yield from reversed(self._tail)
+        offset = self._offset
+        index = offset + self._trie_len
+        while index > offset:
+            leaf = self._leaf_for(index - 1)
+            leaf_start = max((index - 1) & ~_MASK, offset)
+            yield from reversed(leaf[leaf_start & _MASK:((index - 1) & _MASK) + 1])
+            index = leaf_start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.slice(start, stop)
+            return Vector.of_iterable(self.get(i) for i in range(start, stop, step))
+        if index < 0 <= index + len(self):
+            index += len(self)
+        return self.get(index)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Vector) or len(self) != len(other):
+            return False
+        return all(x == y for x, y in zip(self, other))
+
+    def __reduce__(self):
+        return Vector.of_iterable, (tuple(self),)
+
+    def __repr__(self):
+        return "Vector(" + ", ".join(repr(x) for x in self) + ")"
+
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    def head(self) -> T:
+        if self.is_empty():
+            raise ValueException("No head of an empty vector")
+        return self.get(0)
+
+    def tail(self) -> 'Vector[T]':
+        if self.is_empty():
+            raise ValueException("No tail of an empty vector")
+        return self.drop(1)
+
+    def last(self) -> T:
+        if self.is_empty():
+            raise ValueException("No last element of an empty vector")
+        return self.get(len(self) - 1)
+
+    def get(self, index: int) -> T:
+        """ Returns the element at ``index`` in O(log32 n). """
+        if index < 0 or index >= len(self):
+            raise IndexError("index " + str(index) + " out of range")
+        if index >= self._trie_len:
+            return self._tail[index - self._trie_len]
+        trie_index = self._offset + index
+        return self._leaf_for(trie_index)[trie_index & _MASK]
+
+    def update(self, index: int, value: T) -> 'Vector[T]':
+        """ Returns a copy with ``value`` at ``index``, copying only the path to it: O(log32 n). """
+        if index < 0 or index >= len(self):
+            raise IndexError("index " + str(index) + " out of range")
+        if index >= self._trie_len:
+            position = index - self._trie_len
+            tail = self._tail[:position] + (value,) + self._tail[position + 1:]
+            return Vector(self._root, self._shift, self._offset, self._trie_len, tail)
+        root = _assoc(self._root, self._shift, self._offset + index, value, 0)
+        return Vector(root, self._shift, self._offset, self._trie_len, self._tail)
+
+    def append(self, value: T) -> 'Vector[T]':
+        """ Appends ``value`` in amortized O(1), pushing a full tail into the trie in O(log32 n). """
+        if len(self._tail) < _BRANCHING:
+            return Vector(self._root, self._shift, self._offset, self._trie_len, self._tail + (value,))
+        root, shift, offset, trie_len = self._push_tail()
+        return Vector(root, shift, offset, trie_len, (value,))
+
+    def prepend(self, value: T) -> 'Vector[T]':
+        """ Prepends ``value`` in O(log32 n) by growing the trie in front of ``offset``. """
+        if self._trie_len == 0 and len(self._tail) < _BRANCHING:
+            return Vector(tail=(value,) + self._tail)
+
+        if self._trie_len == 0:
+            root, shift, offset, trie_len = self._push_tail()
+            tail = ()
+        else:
+            root, shift, offset, trie_len = self._root, self._shift, self._offset, self._trie_len
+            tail = self._tail
+
+        if offset == 0:
+            capacity = 1 << (shift + _BITS)
+            root = _EMPTY_NODE[1:] + (root,)
+            offset = capacity * (_BRANCHING - 1)
+            shift += _BITS
+
+        offset -= 1
+        return Vector(_assoc(root, shift, offset, value, 0), shift, offset, trie_len + 1, tail)
+
+    def drop(self, n: int) -> 'Vector[T]':
+        """ Drops the first ``n`` elements in O(log32 n), sharing the remaining nodes. """
+        if n <= 0:
+            return self
+        if n >= len(self):
+            return _EMPTY
+        if n >= self._trie_len:
+            return Vector(tail=self._tail[n - self._trie_len:])
+        return _collapse(self._root, self._shift, self._offset + n, self._trie_len - n, self._tail)
+
+    def take(self, n: int) -> 'Vector[T]':
+        """ Keeps the first ``n`` elements in O(log32 n), sharing the kept nodes. """
+        if n <= 0:
+            return _EMPTY
+        if n >= len(self):
+            return self
+        if n >= self._trie_len:
+            return Vector(self._root, self._shift, self._offset, self._trie_len, self._tail[:n - self._trie_len])
+
+        end = self._offset + n
+        aligned_end = end & ~_MASK
+        if aligned_end <= self._offset:
+            leaf = self._leaf_for(self._offset)
+            return Vector(tail=leaf[self._offset & _MASK:((end - 1) & _MASK) + 1])
+        tail = self._leaf_for(aligned_end)[:end & _MASK] if end != aligned_end else ()
+        return _collapse(self._root, self._shift, self._offset, aligned_end - self._offset, tail)
+
+    def drop_right(self, n: int) -> 'Vector[T]':
+        return self.take(len(self) - n)
+
+    def take_right(self, n: int) -> 'Vector[T]':
+        return self.drop(len(self) - n)
+
+    def slice(self, start: int, end: int) -> 'Vector[T]':
+        """ Returns the elements from ``start`` (inclusive) to ``end`` (exclusive) in O(log32 n). """
+        return self.take(end).drop(start)
+
+    def reverse(self) -> 'Vector[T]':
+        return Vector.of_iterable(reversed(self))
+
+    def map(self, func: Callable[[T], U]) -> 'Vector[U]':
+        return Vector.of_iterable(func(x) for x in self)
+
+    def filter(self, predicate: Callable[[T], bool]) -> 'Vector[T]':
+        return Vector.of_iterable(x for x in self if predicate(x))
+
+    def flat_map(self, func: Callable[[T], Iterable[U]]) -> 'Vector[U]':
+        return Vector.of_iterable(y for x in self for y in func(x))
+
+    def fold_left(self, zero: U, combine: Callable[[U, T], U]) -> U:
+        result = zero
+        for value in self:
+            result = combine(result, value)
+        return result
+
+    def or_else(self, alternative: 'Vector[T]') -> 'Vector[T]':
+        if self.is_empty():
+            return alternative
+        return self
+
+    def zip(self, other: Iterable[U]) -> 'Vector[Tuple[T, U]]':
+        return self.zip_with(other, lambda x, y: (x, y))
+
+    def zip_with(self, other: Iterable[U], mapper: Callable[[T, U], R]) -> 'Vector[R]':
+        if len(self) != len(other):
+            raise ValueException("not same length")
+        return Vector.of_iterable(mapper(x, y) for x, y in zip(self, other))
+
+    def _leaf_for(self, trie_index: int) -> tuple:
+        node = self._root
+        shift = self._shift
+        while shift > 0:
+            node = node[(trie_index >> shift) & _MASK]
+            shift -= _BITS
+        return node
+
+    def _push_tail(self) -> Tuple[tuple, int, int, int]:
+        leaf = _pad(self._tail)
+        if self._trie_len == 0:
+            return leaf, 0, 0, _BRANCHING
+
+        root, shift = self._root, self._shift
+        index = self._offset + self._trie_len
+        if index >= 1 << (shift + _BITS):
+            root = (root,) + _EMPTY_NODE[1:]
+            shift += _BITS
+        return _assoc(root, shift, index, leaf, _BITS), shift, self._offset, self._trie_len + _BRANCHING
+
+
+def _pad(values: tuple) -> tuple:
+    return values + _EMPTY_NODE[len(values):]
+
+
+def _assoc(node: Optional[tuple], shift: int, index: int, value, level: int) -> tuple:
+    if node is None:
+        node = _EMPTY_NODE
+    slot = (index >> shift) & _MASK
+    child = value if shift == level else _assoc(node[slot], shift - _BITS, index, value, level)
+    return node[:slot] + (child,) + node[slot + 1:]
+
+
+def _collapse(root: tuple, shift: int, offset: int, trie_len: int, tail: tuple) -> Vector:
+    last = offset + trie_len - 1
+    while shift > 0 and offset >> shift == last >> shift:
+        slot = offset >> shift
+        root = root[slot]
+        offset -= slot << shift
+        last -= slot << shift
+        shift -= _BITS
+    return Vector(root, shift, offset, trie_len, tail)
+
+
+_EMPTY = Vector()
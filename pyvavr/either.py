@@ -60,6 +60,15 @@ class Left(Either):
     def is_right(self):
         return False
 
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Left) and self._left == other._left
+
+    def __hash__(self):
+        return hash((Left, self._left))
+
+    def __reduce__(self):
+        return Left, (self._left,)
+
     @property
     def right(self) -> RIGHT:
         raise ValueException("Not a right value")
@@ -81,6 +90,15 @@ class Right(Either):
     def is_left(self):
         return False
 
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Right) and self._right == other._right
+
+    def __hash__(self):
+        return hash((Right, self._right))
+
+    def __reduce__(self):
+        return Right, (self._right,)
+
     @property
     def right(self) -> RIGHT:
         return self._right
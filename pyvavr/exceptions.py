@@ -8,3 +8,9 @@ class CantCurryVarArgException(Exception):
 
     def __init__(self, message=None):
         super().__init__(message)
+
+
+class NoSuchElementException(Exception):
+
+    def __init__(self, message=None):
+        super().__init__(message)
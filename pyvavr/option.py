@@ -44,6 +44,15 @@ class Option(ABC, Generic[T]):
     def or_else_raise(self, alternative: Union[T, Callable[[], Exception]]) -> T:
         pass
 
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self._value == other._value
+
+    def __hash__(self):
+        return hash((type(self), self._value))
+
+    def __reduce__(self):
+        return type(self), (self._value,)
+
     def __repr__(self) -> str:
         return "Option(" + self._value + ")"
 
@@ -81,6 +90,9 @@ class Nothing(Option):
     def __init__(self):
         super().__init__(None)
 
+    def __reduce__(self):
+        return Nothing, ()
+
     def is_empty(self):
         return True
 
@@ -0,0 +1,185 @@
+""" Opt-in instrumentation of the collections and value types.
+
+Inside ``with profile() as result:`` every public method and the main protocol methods of
+``ImmutableList``, ``ImmutableQueue`` and the value types are wrapped to count calls and measure
+their inclusive wall time. The wrappers are removed again when the block exits, so the classes are
+untouched and cost nothing while profiling is off.
+
+A traversal is one whole-collection operation such as ``map``, ``filter``, ``fold_left`` or ``in``,
+or one iteration that runs to the end. Operations called by another traversal, like the iteration
+inside ``sorted``, are not counted again.
+"""
+import inspect
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from pyvavr.attempts import Try, Success, Failure
+from pyvavr.collection.list import ImmutableList, Cons, Nil
+from pyvavr.collection.queue import ImmutableQueue
+from pyvavr.either import Either, Left, Right
+from pyvavr.exceptions import ValueException
+from pyvavr.option import Option, Just, Nothing
+from pyvavr.validation import Validation, Valid, Invalid
+
+TARGETS = (ImmutableList, Cons, Nil, ImmutableQueue, Option, Just, Nothing, Try, Success, Failure,
+           Either, Left, Right, Validation, Valid, Invalid)
+
+_PROTOCOL = ("__init__", "__iter__", "__reversed__", "__len__", "__contains__", "__getitem__", "__eq__",
+             "__hash__", "__add__")
+_COLLECTIONS = (ImmutableList, Cons, Nil, ImmutableQueue)
+_ITERATIONS = ("__iter__", "__reversed__")
+_TRAVERSALS = frozenset((
+    "__contains__", "append", "append_all", "concat", "count_by", "distinct", "distinct_by",
+    "drop_right_while", "filter", "flat_map", "fold_left", "group_by", "index_of", "map", "max_by",
+    "merge_sorted", "min_by", "par_fold", "par_map", "partition", "reverse", "sort_by", "sorted",
+    "take_right_while", "to_list", "to_string", "top_k", "zip", "zip_with"))
+
+_active = None
+
+
+class Profile:
+    """ Call counts and inclusive wall time per method, keyed by ``Class.method``. """
+
+    def __init__(self):
+        self.calls = Counter()
+        self.seconds = defaultdict(float)
+        self.traversals = 0
+        self._walking = 0
+
+    @property
+    def allocations(self) -> Dict[str, int]:
+        """ Instances created per class, e.g. the number of ``Cons`` cells. """
+        return {name[:-len(".__init__")]: count for name, count in self.calls.items() if name.endswith(".__init__")}
+
+    @property
+    def reversals(self) -> int:
+        return sum(count for name, count in self.calls.items() if name.endswith(".reverse"))
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """ Renders the operations as a table, the most expensive first. """
+        rows = sorted(self.calls, key=lambda name: (-self.seconds[name], name))[:limit]
+        width = max([len(name) for name in rows] + [len("operation")])
+        lines = ["operation".ljust(width) + "       calls    total ms"]
+        for name in rows:
+            lines.append(name.ljust(width) + str(self.calls[name]).rjust(12) +
+                         ("%.3f" % (self.seconds[name] * 1000)).rjust(12))
+        lines.append("allocations: " + ", ".join(name + "=" + str(count)
+                                                 for name, count in sorted(self.allocations.items())))
+        lines.append("reversals: " + str(self.reversals) + ", traversals: " + str(self.traversals))
+        return "\n".join(lines)
+
+    def _record(self, name: str, seconds: float):
+        self.calls[name] += 1
+        self.seconds[name] += seconds
+
+
+def enabled() -> bool:
+    return _active is not None
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """ Instruments the collections and value types for the duration of the ``with`` block. """
+    global _active
+    if _active is not None:
+        raise ValueException("profiling is already enabled")
+    result = Profile()
+    originals = _instrument(result)
+    _active = result
+    try:
+        yield result
+    finally:
+        _active = None
+        for cls, name, original in originals:
+            setattr(cls, name, original)
+
+
+def _instrument(result: Profile) -> List[Tuple[type, str, object]]:
+    originals = []
+    for cls in TARGETS:
+        for name, attribute in list(vars(cls).items()):
+            if not _is_instrumented(cls, name):
+                continue
+            wrapped = _wrap(result, cls, name, attribute)
+            if wrapped is not None:
+                originals.append((cls, name, attribute))
+                setattr(cls, name, wrapped)
+    return originals
+
+
+def _is_instrumented(cls: type, name: str) -> bool:
+    if name == "__init__":
+        # abstract base classes only initialize their subclasses, which are counted themselves
+        return not inspect.isabstract(cls)
+    return name in _PROTOCOL or not name.startswith("_")
+
+
+def _wrap(result: Profile, cls: type, name: str, attribute):
+    qualified = cls.__name__ + "." + name
+    if isinstance(attribute, staticmethod):
+        return staticmethod(_timed(result, qualified, attribute.__func__))
+    if isinstance(attribute, classmethod):
+        return classmethod(_timed(result, qualified, attribute.__func__))
+    if not inspect.isfunction(attribute):
+        return None
+    if cls in _COLLECTIONS and name in _ITERATIONS:
+        attribute = _iterating(result, attribute)
+    elif cls in _COLLECTIONS and name in _TRAVERSALS:
+        attribute = _traversing(result, attribute)
+    return _timed(result, qualified, attribute)
+
+
+def _timed(result: Profile, name: str, func: Callable) -> Callable:
+    @wraps(func)
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            result._record(name, time.perf_counter() - start)
+
+    return timed
+
+
+def _traversing(result: Profile, func: Callable) -> Callable:
+    @wraps(func)
+    def traversing(*args, **kwargs):
+        outermost = result._walking == 0
+        result._walking += 1
+        try:
+            value = func(*args, **kwargs)
+        finally:
+            result._walking -= 1
+        if outermost:
+            result.traversals += 1
+        return value
+
+    return traversing
+
+
+def _iterating(result: Profile, func: Callable) -> Callable:
+    @wraps(func)
+    def iterating(*args, **kwargs):
+        iterator = func(*args, **kwargs)
+        if result._walking:
+            return iterator
+        return _counted(result, iterator)
+
+    return iterating
+
+
+def _counted(result: Profile, iterator: Iterator) -> Iterator:
+    # only a fully consumed iteration counts; whatever runs while fetching an element belongs to it
+    while True:
+        result._walking += 1
+        try:
+            value = next(iterator)
+        except StopIteration:
+            break
+        finally:
+            result._walking -= 1
+        yield value
+    result.traversals += 1
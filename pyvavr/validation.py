@@ -112,11 +112,17 @@ class Valid(Validation):
         return self
 
     def __eq__(self, o: Validation[E, T]) -> bool:
-        if o.invalid():
+        if not isinstance(o, Validation) or o.invalid():
             return False
         else:
             return self.value == o.get()
 
+    def __hash__(self):
+        return hash((Valid, self.value))
+
+    def __reduce__(self):
+        return Valid, (self.value,)
+
 
 class Invalid(Validation):
     def __init__(self, error: E) -> None:
@@ -141,11 +147,17 @@ class Invalid(Validation):
             return alternative
 
     def __eq__(self, o: Validation[E, T]) -> bool:
-        if o.valid():
+        if not isinstance(o, Validation) or o.valid():
             return False
         else:
             return self.error == o.get_error()
 
+    def __hash__(self):
+        return hash((Invalid, self.error))
+
+    def __reduce__(self):
+        return Invalid, (self.error,)
+
 
 class ValidationBuilder(Generic[E, T, U]):
     def __init__(self, *validations: Validation[E, T]) -> None:
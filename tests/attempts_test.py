@@ -1,3 +1,4 @@
+import pickle
 import pytest
 
 from pyvavr import ValueException
@@ -109,4 +110,13 @@ def test_failure_is_not_success(failed_try):
     assert failed_try.is_success() == False
 
 def raise_something():
-    raise NotImplementedError
\ No newline at end of file
+    raise NotImplementedError
+
+def test_equality_and_hash(successful_try):
+    assert successful_try == Try.success("Some")
+    assert successful_try != Try.success("Other")
+    assert {successful_try: 1}[Try.success("Some")] == 1
+
+
+def test_pickle(successful_try):
+    assert pickle.loads(pickle.dumps(successful_try)) == successful_try
@@ -0,0 +1,95 @@
+import pickle
+import pytest
+
+from pyvavr import ValueException
+from pyvavr.collection.catenable import CatenableList
+from pyvavr.collection.list import ImmutableList
+
+
+def test_empty():
+    assert CatenableList.empty().is_empty()
+    assert len(CatenableList.empty()) == 0
+    assert list(CatenableList.empty()) == []
+    with pytest.raises(ValueException):
+        CatenableList.empty().head()
+    with pytest.raises(ValueException):
+        CatenableList.empty().tail()
+
+
+def test_of():
+    values = CatenableList.of(1, 2, 3)
+    assert list(values) == [1, 2, 3]
+    assert len(values) == 3
+    assert repr(values) == "CatenableList(1, 2, 3)"
+
+
+def test_concat():
+    values = CatenableList.of(1, 2) + CatenableList.of(3) + CatenableList.empty() + CatenableList.of(4, 5)
+    assert list(values) == [1, 2, 3, 4, 5]
+    assert len(values) == 5
+    assert values == CatenableList.of(1, 2, 3, 4, 5)
+
+
+def test_concat_keeps_operands():
+    left = CatenableList.of(1, 2)
+    right = CatenableList.of(3, 4)
+    left.concat(right)
+    assert list(left) == [1, 2]
+    assert list(right) == [3, 4]
+
+
+def test_head_and_tail():
+    values = CatenableList.of(1).concat(CatenableList.of(2, 3)).concat(CatenableList.of(4)).prepend(0).append(5)
+    result = []
+    while not values.is_empty():
+        result.append(values.head())
+        values = values.tail()
+    assert result == [0, 1, 2, 3, 4, 5]
+
+
+def test_concat_many_parts():
+    parts = [CatenableList.of_iterable(range(i * 3, i * 3 + 3)) for i in range(10000)]
+    result = CatenableList.empty()
+    for part in parts:
+        result = result + part
+    assert len(result) == 30000
+    assert list(result) == list(range(30000))
+    assert result.tail().tail().head() == 2
+
+
+def test_append_all():
+    assert list(CatenableList.of(1).append_all([2, 3])) == [1, 2, 3]
+
+
+def test_map_filter_fold():
+    values = CatenableList.of(1, 2) + CatenableList.of(3, 4)
+    assert values.map(lambda x: x * 2) == CatenableList.of(2, 4, 6, 8)
+    assert values.filter(lambda x: x % 2 == 0) == CatenableList.of(2, 4)
+    assert values.fold_left(0, lambda x, y: x + y) == 10
+
+
+def test_to_list():
+    assert (CatenableList.of(1) + CatenableList.of(2)).to_list() == ImmutableList.of(1, 2)
+
+
+def test_eq_and_hash():
+    assert CatenableList.of(1, 2) + CatenableList.of(3) == CatenableList.of(1) + CatenableList.of(2, 3)
+    assert hash(CatenableList.of(1, 2) + CatenableList.of(3)) == hash(CatenableList.of(1, 2, 3))
+    assert CatenableList.of(1, 2) != CatenableList.of(1, 3)
+
+
+def test_pickle():
+    values = CatenableList.of(1, 2) + CatenableList.of(3)
+    assert pickle.loads(pickle.dumps(values)) == values
+
+
+def test_tail_of_old_version():
+    values = CatenableList.empty()
+    for i in range(1000):
+        values = values + CatenableList.of(i, i)
+    first = values.tail()
+    second = values.tail()
+    assert first == second
+    assert len(first) == 1999
+    assert list(first.tail()) == list(second.tail())
+    assert list(values) == [i // 2 for i in range(2000)]
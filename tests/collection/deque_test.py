@@ -0,0 +1,118 @@
+import pickle
+
+import pytest
+
+from pyvavr import NoSuchElementException
+from pyvavr.collection import Deque
+
+
+def test_empty():
+    deque = Deque.empty()
+    assert deque.is_empty()
+    assert len(deque) == 0
+    assert list(deque) == []
+    with pytest.raises(NoSuchElementException):
+        deque.head()
+    with pytest.raises(NoSuchElementException):
+        deque.last()
+    with pytest.raises(NoSuchElementException):
+        deque.pop_left()
+    with pytest.raises(NoSuchElementException):
+        deque.pop_right()
+
+
+def test_of():
+    deque = Deque.of(1, 2, 3)
+    assert list(deque) == [1, 2, 3]
+    assert list(reversed(deque)) == [3, 2, 1]
+    assert repr(deque) == "Deque(1, 2, 3)"
+
+
+def test_both_ends():
+    deque = Deque.empty()
+    for i in range(100):
+        deque = deque.append(i).prepend(-i - 1)
+    assert len(deque) == 200
+    assert deque.head() == -100
+    assert deque.last() == 99
+    assert list(deque) == list(range(-100, 100))
+    value, rest = deque.pop_left()
+    assert value == -100
+    assert rest.head() == -99
+    value, rest = deque.pop_right()
+    assert value == 99
+    assert rest.last() == 98
+    assert list(deque.tail().init()) == list(range(-99, 99))
+
+
+def test_drain_from_both_ends():
+    deque = Deque.of_iterable(range(1000))
+    front = []
+    back = []
+    while not deque.is_empty():
+        value, deque = deque.pop_left()
+        front.append(value)
+        if not deque.is_empty():
+            value, deque = deque.pop_right()
+            back.append(value)
+    assert front + back[::-1] == list(range(1000))
+
+
+def test_get():
+    deque = Deque.of_iterable(range(1000))
+    assert [deque.get(i) for i in range(1000)] == list(range(1000))
+    assert deque[-1] == 999
+    with pytest.raises(IndexError):
+        deque.get(1000)
+    with pytest.raises(IndexError, match="index -1001 out of range"):
+        deque[-1001]
+
+
+@pytest.mark.parametrize("index", [-1, 0, 1, 5, 500, 998, 999, 1000, 1001])
+def test_split_at(index):
+    deque = Deque.of_iterable(range(1000))
+    left, right = deque.split_at(index)
+    expected = max(0, min(index, 1000))
+    assert list(left) == list(range(expected))
+    assert list(right) == list(range(expected, 1000))
+    assert len(left) == expected
+
+
+def test_concat():
+    left = Deque.of_iterable(range(500))
+    right = Deque.of_iterable(range(500, 1200))
+    deque = left + right
+    assert list(deque) == list(range(1200))
+    assert deque.get(777) == 777
+    assert Deque.empty().concat(right) is right
+    assert list(Deque.of(1) + Deque.of(2)) == [1, 2]
+
+
+def test_persistent():
+    deque = Deque.of(1, 2, 3)
+    deque.append(4)
+    deque.prepend(0)
+    deque.split_at(1)
+    assert list(deque) == [1, 2, 3]
+
+
+def test_take_and_drop():
+    deque = Deque.of_iterable(range(10))
+    assert list(deque.take(3)) == [0, 1, 2]
+    assert list(deque.drop(7)) == [7, 8, 9]
+
+
+def test_map_filter_fold():
+    deque = Deque.of(1, 2, 3, 4)
+    assert deque.map(lambda x: x * 2) == Deque.of(2, 4, 6, 8)
+    assert deque.filter(lambda x: x % 2 == 0) == Deque.of(2, 4)
+    assert deque.fold_left(0, lambda x, y: x + y) == 10
+    assert 3 in deque
+    assert 5 not in deque
+
+
+def test_eq_hash_and_pickle():
+    built = Deque.of(2, 3).prepend(1)
+    assert built == Deque.of(1, 2, 3)
+    assert hash(built) == hash(Deque.of(1, 2, 3))
+    assert pickle.loads(pickle.dumps(built)) == built
@@ -1,8 +1,13 @@
+import operator
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from pytest import fail
 
 from pyvavr import ValueException
-from pyvavr.collection.list import Nil, Cons, ImmutableList
+from pyvavr.collection.list import Nil, Cons, ImmutableList, ImmutableListIterator
+from pyvavr.collection.map import HashMap
 
 
 def test_nil_is_empty():
@@ -31,6 +36,49 @@ def test_list_of_list():
     assert ImmutableList.of_list([1, 2, 3]) == Cons(1, Cons(2, Cons(3, Nil())))
 
 
+def test_list_range_with_step():
+    assert ImmutableList.range(0, 6, 2) == ImmutableList.of(0, 2, 4)
+
+
+def test_from_iterable_generator():
+    list = ImmutableList.from_iterable(x * 2 for x in range(0, 4))
+    assert list == ImmutableList.of(0, 2, 4, 6)
+    assert len(list.tail()) == 3
+
+
+def test_from_iterable_empty():
+    assert ImmutableList.from_iterable(iter([])) is Nil()
+
+
+def test_builder():
+    builder = ImmutableList.builder().append(1).extend(range(2, 4)).append(4)
+    assert len(builder) == 4
+    assert builder.build() == ImmutableList.of(1, 2, 3, 4)
+
+
+def test_builder_keeps_elements_if_iterable_raises():
+    def failing():
+        yield 1
+        yield 2
+        raise IOError("cursor closed")
+
+    builder = ImmutableList.builder().append(0)
+    with pytest.raises(IOError):
+        builder.extend(failing())
+    assert len(builder) == 3
+    result = builder.append(9).build()
+    assert result == ImmutableList.of(0, 1, 2, 9)
+    assert len(result.drop(1)) == 3
+
+
+def test_builder_starts_over_after_build():
+    builder = ImmutableList.builder().append(1)
+    first = builder.build()
+    second = builder.append(2).build()
+    assert first == ImmutableList.of(1)
+    assert second == ImmutableList.of(2)
+
+
 def test_reverse():
     assert ImmutableList.of(1, 2, 3).reverse() == Cons(3, Cons(2, Cons(1, Nil())))
 
@@ -52,6 +100,76 @@ def test_recusrion_limit():
     assert len(list) == 2000
 
 
+def test_nil_is_singleton():
+    assert Nil() is Nil()
+    assert ImmutableList.empty() is Nil()
+
+
+def test_cons_has_no_instance_dict():
+    assert not hasattr(Cons(1, Nil()), "__dict__")
+
+
+def test_len_after_prepend_and_drop():
+    list = ImmutableList.range(0, 100)
+    assert len(list.prepend(-1)) == 101
+    assert len(list.drop(40)) == 60
+    assert len(list.take(40)) == 40
+
+
+def test_equality_of_long_lists():
+    assert ImmutableList.range(0, 100000) == ImmutableList.range(0, 100000)
+    assert ImmutableList.range(0, 100000) != ImmutableList.of_list(list(range(0, 99999)) + [-1])
+
+
+def test_equality_different_lengths():
+    assert ImmutableList.of(1, 2) != ImmutableList.of(1, 2, 3)
+    assert ImmutableList.of(1, 2, 3) != ImmutableList.of(1, 2)
+
+
+def test_equality_shared_tail():
+    tail = ImmutableList.range(0, 100000)
+    assert tail.prepend(1) == tail.prepend(1)
+    assert tail.prepend(1) != tail.prepend(2)
+
+
+def test_hash():
+    assert hash(ImmutableList.of(1, 2, 3)) == hash(ImmutableList.of(1, 2, 3))
+    assert hash(ImmutableList.empty()) == hash(Nil())
+    assert {ImmutableList.of(1, 2): "a"}[ImmutableList.of(1, 2)] == "a"
+
+
+def test_hash_is_cached_incrementally():
+    tail = ImmutableList.range(0, 100000)
+    hash(tail)
+    list = tail.prepend(1)
+    assert list._hash is None
+    hash(list)
+    assert list._hash is not None
+    assert list.next is tail
+
+
+def test_equality_short_circuits_on_hash():
+    one = ImmutableList.of(1, 2, 3)
+    other = ImmutableList.of(1, 2, 4)
+    hash(one)
+    hash(other)
+    assert one != other
+
+
+def test_repr():
+    assert repr(ImmutableList.of(1, 2)) == "(1, (2, Nil()))"
+    assert repr(ImmutableList.empty()) == "Nil()"
+
+
+def test_repr_long_list():
+    assert len(repr(ImmutableList.range(0, 100000))) > 100000
+
+
+def test_to_string_with_limit():
+    assert ImmutableList.of(1, 2, 3).to_string(limit=2) == "(1, (2, ...))"
+    assert ImmutableList.of(1, 2).to_string(limit=2) == "(1, (2, Nil()))"
+
+
 def test_head_nil_raises():
     with pytest.raises(ValueException):
         Nil().head()
@@ -225,6 +343,37 @@ def test_take_right_while():
     assert ImmutableList.of(1, 2, 3, 4, 5, 6).take_right_while(lambda x: x > 3) == ImmutableList.of(4, 5, 6)
 
 
+def test_take_right_shares_suffix():
+    list = ImmutableList.of(1, 2, 3, 4, 5)
+    assert list.take_right(2) is list.tail().tail().tail()
+
+
+def test_take_right_while_shares_suffix():
+    list = ImmutableList.of(1, 5, 2, 4, 5)
+    assert list.take_right_while(lambda x: x > 3) is list.drop(3)
+
+
+def test_take_right_while_all_match():
+    list = ImmutableList.of(4, 5, 6)
+    assert list.take_right_while(lambda x: x > 3) is list
+
+
+def test_drop_right_while_nothing_dropped():
+    list = ImmutableList.of(4, 5, 6)
+    assert list.drop_right_while(lambda x: x > 6) is list
+
+
+def test_drop_right_while_all_dropped():
+    assert ImmutableList.of(4, 5, 6).drop_right_while(lambda x: x > 3) == ImmutableList.empty()
+
+
+def test_right_operations_on_long_list():
+    list = ImmutableList.range(0, 100000)
+    assert len(list.drop_right(10)) == 99990
+    assert list.take_right(10) == ImmutableList.range(99990, 100000)
+    assert list.drop_right_while(lambda x: x > 10) == ImmutableList.range(0, 11)
+
+
 def test_filter():
     assert ImmutableList.of(1, 2, 3, 4, 5, 6).filter(lambda x: x % 2 == 0) == ImmutableList.of(2, 4, 6)
 
@@ -251,3 +400,212 @@ def test_zip():
     list_one = ImmutableList.of(1, 2, 3, 4)
     list_two = ImmutableList.of(4, 3, 2, 1)
     assert list_one.zip(list_two) == ImmutableList.of((1, 4), (2, 3), (3, 2), (4, 1))
+
+
+def test_view_to_list():
+    view = ImmutableList.range(0, 10).view().map(lambda x: x * 2).filter(lambda x: x % 3 != 0)
+    assert view.to_list() == ImmutableList.of(2, 4, 8, 10, 14, 16)
+
+
+def test_view_flat_map_take_drop():
+    view = ImmutableList.of(1, 2, 3).view().flat_map(lambda x: range(0, x)).drop(1).take(3)
+    assert view.to_list() == ImmutableList.of(0, 1, 0)
+
+
+def test_view_take_while_drop_while():
+    view = ImmutableList.range(0, 10).view().drop_while(lambda x: x < 3).take_while(lambda x: x < 6)
+    assert list(view) == [3, 4, 5]
+
+
+def test_view_fold_left():
+    assert ImmutableList.range(0, 2000).view().map(lambda x: x + 1).fold_left(0, lambda x, y: x + y) == 2001000
+
+
+def test_view_is_lazy():
+    evaluated = []
+    view = ImmutableList.of(1, 2, 3).view().map(lambda x: evaluated.append(x))
+    assert evaluated == []
+    view.to_list()
+    assert evaluated == [1, 2, 3]
+
+
+def test_view_can_be_consumed_twice():
+    view = ImmutableList.of(1, 2, 3).view().map(lambda x: x + 1)
+    assert view.to_list() == view.to_list()
+
+
+def test_par_map_keeps_order():
+    values = ImmutableList.range(0, 1000)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        result = values.par_map(lambda x: x * 2, executor=executor, chunk_size=64)
+    assert result == values.map(lambda x: x * 2)
+
+
+def test_par_map_on_process_pool():
+    assert ImmutableList.of(-1, 2, -3).par_map(abs, chunk_size=1) == ImmutableList.of(1, 2, 3)
+
+
+def test_par_fold():
+    values = ImmutableList.range(0, 1000)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert values.par_fold(0, operator.add, executor=executor, chunk_size=100) == sum(range(1000))
+    assert ImmutableList.empty().par_fold(0, operator.add) == 0
+
+
+def test_append():
+    assert ImmutableList.of(1, 2).append(3) == ImmutableList.of(1, 2, 3)
+    assert ImmutableList.empty().append(1) == ImmutableList.of(1)
+
+
+def test_insert_shares_suffix():
+    values = ImmutableList.of(1, 2, 4, 5)
+    result = values.insert(2, 3)
+    assert result == ImmutableList.of(1, 2, 3, 4, 5)
+    assert result.drop(3) is values.drop(2)
+    assert values.insert(4, 6) == ImmutableList.of(1, 2, 4, 5, 6)
+    with pytest.raises(IndexError):
+        values.insert(5, 6)
+
+
+def test_get():
+    values = ImmutableList.of(1, 2, 3)
+    assert values.get(0) == 1
+    assert values.get(2) == 3
+    with pytest.raises(IndexError):
+        values.get(3)
+    with pytest.raises(IndexError):
+        values.get(-1)
+
+
+def test_update_shares_suffix():
+    values = ImmutableList.of(1, 2, 3, 4)
+    result = values.update(1, 20)
+    assert result == ImmutableList.of(1, 20, 3, 4)
+    assert result.drop(2) is values.drop(2)
+    with pytest.raises(IndexError):
+        values.update(4, 5)
+
+
+def test_remove_at():
+    values = ImmutableList.of(1, 2, 3, 4)
+    result = values.remove_at(1)
+    assert result == ImmutableList.of(1, 3, 4)
+    assert result.drop(1) is values.drop(2)
+    assert values.remove_at(0) is values.tail()
+    with pytest.raises(IndexError):
+        ImmutableList.empty().remove_at(0)
+
+
+def test_index_of():
+    values = ImmutableList.of(1, 2, 3, 2)
+    assert values.index_of(2) == 1
+    assert values.index_of(2, 2) == 3
+    assert values.index_of(5) == -1
+
+
+def test_contains():
+    assert 3 in ImmutableList.of(1, 2, 3)
+    assert 4 not in ImmutableList.of(1, 2, 3)
+    assert 1 not in ImmutableList.empty()
+
+
+def test_partition():
+    even, odd = ImmutableList.range(0, 7).partition(lambda x: x % 2 == 0)
+    assert even == ImmutableList.of(0, 2, 4, 6)
+    assert odd == ImmutableList.of(1, 3, 5)
+
+
+def test_getitem():
+    values = ImmutableList.of(1, 2, 3, 4, 5)
+    assert values[0] == 1
+    assert values[-1] == 5
+    assert values[1:3] == ImmutableList.of(2, 3)
+    assert values[2:] is values.drop(2)
+    assert values[::2] == ImmutableList.of(1, 3, 5)
+    assert values[::-1] == values.reverse()
+    with pytest.raises(IndexError):
+        values[5]
+    with pytest.raises(IndexError, match="index -6 out of range"):
+        values[-6]
+
+
+def test_concat_shares_right_list():
+    right = ImmutableList.of(3, 4)
+    result = ImmutableList.of(1, 2) + right
+    assert result == ImmutableList.of(1, 2, 3, 4)
+    assert result.drop(2) is right
+    assert ImmutableList.of(1).append_all([2, 3]) == ImmutableList.of(1, 2, 3)
+    assert ImmutableList.empty().concat(right) is right
+
+
+def test_group_by():
+    groups = ImmutableList.range(0, 7).group_by(lambda x: x % 3)
+    assert groups == HashMap.of((0, ImmutableList.of(0, 3, 6)), (1, ImmutableList.of(1, 4)), (2, ImmutableList.of(2, 5)))
+    assert ImmutableList.empty().group_by(lambda x: x).is_empty()
+
+
+def test_count_by():
+    counts = ImmutableList.of("a", "bb", "cc", "d").count_by(len)
+    assert counts == HashMap.of((1, 2), (2, 2))
+
+
+def test_distinct():
+    assert ImmutableList.of(1, 2, 1, 3, 2).distinct() == ImmutableList.of(1, 2, 3)
+    values = ImmutableList.of(1, 2, 3)
+    assert values.distinct() is values
+
+
+def test_distinct_by():
+    assert ImmutableList.of("a", "bb", "c", "dd", "eee").distinct_by(len) == ImmutableList.of("a", "bb", "eee")
+
+
+def test_sorted_is_stable():
+    values = ImmutableList.of((2, "a"), (1, "b"), (2, "c"), (1, "d"))
+    assert values.sorted(key=lambda x: x[0]) == ImmutableList.of((1, "b"), (1, "d"), (2, "a"), (2, "c"))
+    assert values.sort_by(lambda x: x[0], reverse=True) == ImmutableList.of((2, "a"), (2, "c"), (1, "b"), (1, "d"))
+    assert ImmutableList.of(3, 1, 2).sorted() == ImmutableList.of(1, 2, 3)
+    assert ImmutableList.empty().sorted() == ImmutableList.empty()
+
+
+def test_min_by_and_max_by():
+    values = ImmutableList.of("bb", "a", "c", "dd")
+    assert values.min_by(len) == "a"
+    assert values.max_by(len) == "bb"
+    assert ImmutableList.empty().min_by(len) is None
+
+
+def test_top_k():
+    values = ImmutableList.of(5, 1, 9, 3, 7)
+    assert values.top_k(2) == ImmutableList.of(9, 7)
+    assert values.top_k(2, reverse=True) == ImmutableList.of(1, 3)
+    assert values.top_k(10) == ImmutableList.of(9, 7, 5, 3, 1)
+    assert ImmutableList.of("aa", "b", "cc").top_k(2, key=len) == ImmutableList.of("aa", "cc")
+
+
+def test_merge_sorted():
+    right = ImmutableList.of(2, 5, 8, 9)
+    result = ImmutableList.of(1, 3, 5).merge_sorted(right)
+    assert result == ImmutableList.of(1, 2, 3, 5, 5, 8, 9)
+    assert result.drop(5) is right.drop(2)
+    assert ImmutableList.empty().merge_sorted(right) is right
+    merged = ImmutableList.of((1, "l"), (2, "l")).merge_sorted(ImmutableList.of((1, "r")), key=lambda x: x[0])
+    assert merged == ImmutableList.of((1, "l"), (1, "r"), (2, "l"))
+
+
+def test_pickle_long_list():
+    values = ImmutableList.range(0, 100000)
+    assert pickle.loads(pickle.dumps(values)) == values
+    assert pickle.loads(pickle.dumps(ImmutableList.empty())) is Nil()
+    assert pickle.loads(pickle.dumps(ImmutableList.of(1, 2), protocol=0)) == ImmutableList.of(1, 2)
+
+
+def test_iterator_is_iterable():
+    iterator = iter(ImmutableList.of(1, 2, 3))
+    assert iter(iterator) is iterator
+    assert list(iterator) == [1, 2, 3]
+    assert list(ImmutableListIterator(ImmutableList.of(1, 2))) == [1, 2]
+
+
+@pytest.mark.parametrize("size", [0, 1, 63, 64, 65, 5000])
+def test_reversed(size):
+    assert list(reversed(ImmutableList.range(0, size))) == list(range(size - 1, -1, -1))
@@ -0,0 +1,143 @@
+import pickle
+import pytest
+
+from pyvavr.collection import HashMap
+
+
+class CollidingKey:
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.value == other.value
+
+
+def test_empty():
+    assert len(HashMap.empty()) == 0
+    assert HashMap.empty().is_empty() == True
+
+
+def test_put_and_get():
+    map = HashMap.empty().put("a", 1).put("b", 2)
+    assert map.get("a") == 1
+    assert map["b"] == 2
+    assert len(map) == 2
+
+
+def test_get_missing():
+    assert HashMap.of(("a", 1)).get("b") is None
+    assert HashMap.of(("a", 1)).get("b", 0) == 0
+
+
+def test_getitem_missing_raises():
+    with pytest.raises(KeyError):
+        HashMap.empty()["a"]
+
+
+def test_put_keeps_old_version():
+    map = HashMap.of(("a", 1))
+    updated = map.put("a", 2)
+    assert map["a"] == 1
+    assert updated["a"] == 2
+    assert len(updated) == 1
+
+
+def test_put_same_value_returns_same_map():
+    value = object()
+    map = HashMap.of(("a", value))
+    assert map.put("a", value) is map
+
+
+def test_remove():
+    map = HashMap.of(("a", 1), ("b", 2))
+    assert map.remove("a") == HashMap.of(("b", 2))
+    assert map.remove("c") is map
+    assert map.remove("a").remove("b").is_empty() == True
+
+
+def test_many_entries():
+    map = HashMap.of_entries((i, str(i)) for i in range(0, 10000))
+    assert len(map) == 10000
+    assert all(map[i] == str(i) for i in range(0, 10000))
+    for i in range(0, 10000, 2):
+        map = map.remove(i)
+    assert len(map) == 5000
+    assert 3 in map
+    assert 4 not in map
+
+
+def test_hash_collisions():
+    map = HashMap.of_entries((CollidingKey(i), i) for i in range(0, 10))
+    assert len(map) == 10
+    assert map[CollidingKey(3)] == 3
+    map = map.remove(CollidingKey(3))
+    assert CollidingKey(3) not in map
+    assert len(map) == 9
+
+
+def test_merge():
+    left = HashMap.of(("a", 1), ("b", 2))
+    right = HashMap.of(("b", 3), ("c", 4))
+    assert left.merge(right) == HashMap.of(("a", 1), ("b", 2), ("c", 4))
+    assert left.merge(right, lambda x, y: x + y) == HashMap.of(("a", 1), ("b", 5), ("c", 4))
+
+
+def test_merge_large():
+    left = HashMap.of_entries((i, i) for i in range(0, 5000))
+    right = HashMap.of_entries((i, -i) for i in range(2500, 7500))
+    merged = left.merge(right)
+    assert len(merged) == 7500
+    assert merged[3000] == 3000
+    assert merged[6000] == -6000
+
+
+def test_merge_with_collisions():
+    left = HashMap.of((CollidingKey(1), 1), ("a", 2))
+    right = HashMap.of((CollidingKey(1), 10), (CollidingKey(2), 20))
+    assert left.merge(right, lambda x, y: x + y) == HashMap.of((CollidingKey(1), 11), (CollidingKey(2), 20), ("a", 2))
+
+
+def test_merge_reuses_shared_subtrees():
+    base = HashMap.of_entries((i, i) for i in range(0, 5000))
+    merged = base.put(-1, -1).merge(base.put(-2, -2))
+    assert len(merged) == 5002
+
+
+def test_map():
+    assert HashMap.of(("a", 1)).map(lambda k, v: (k + k, v + 1)) == HashMap.of(("aa", 2))
+
+
+def test_map_values():
+    assert HashMap.of(("a", 1), ("b", 2)).map_values(lambda v: v * 10) == HashMap.of(("a", 10), ("b", 20))
+
+
+def test_filter():
+    map = HashMap.of(("a", 1), ("b", 2), ("c", 3))
+    assert map.filter(lambda k, v: v % 2 == 1) == HashMap.of(("a", 1), ("c", 3))
+
+
+def test_fold_left():
+    map = HashMap.of_entries((i, i) for i in range(0, 2000))
+    assert map.fold_left(0, lambda acc, entry: acc + entry[1]) == 1999000
+
+
+def test_keys_and_values():
+    map = HashMap.of(("a", 1), ("b", 2))
+    assert sorted(map.keys()) == ["a", "b"]
+    assert sorted(map.values()) == [1, 2]
+
+
+def test_hash():
+    assert hash(HashMap.of(("a", 1), ("b", 2))) == hash(HashMap.of(("b", 2), ("a", 1)))
+
+
+def test_to_dict():
+    assert HashMap.of_dict({"a": 1, "b": 2}).to_dict() == {"a": 1, "b": 2}
+
+
+def test_pickle():
+    values = HashMap.of_entries((i, str(i)) for i in range(1000))
+    assert pickle.loads(pickle.dumps(values)) == values
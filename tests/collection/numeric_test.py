@@ -0,0 +1,130 @@
+import operator
+import pickle
+
+import pytest
+
+from pyvavr import ValueException
+from pyvavr.collection import IntVector, FloatVector
+
+
+def test_empty():
+    assert len(IntVector.empty()) == 0
+    assert IntVector.empty().is_empty() == True
+    assert IntVector.empty().fold_left(0, operator.add) == 0
+
+
+def test_of_and_iterate():
+    assert list(FloatVector.of(1.5, 2.5)) == [1.5, 2.5]
+
+
+def test_int_vector_rejects_floats():
+    with pytest.raises(TypeError):
+        IntVector.of(1.7, 2)
+    with pytest.raises(TypeError):
+        IntVector.of(1).update(0, 2.5)
+    with pytest.raises(TypeError):
+        IntVector.of(1).append(3.9)
+    assert list(IntVector.of_iterable(range(5, 0, -2))) == [5, 3, 1]
+    assert list(FloatVector.of(1, 2)) == [1.0, 2.0]
+
+
+def test_range_spanning_chunks():
+    vector = IntVector.range(0, 5000)
+    assert len(vector) == 5000
+    assert vector.get(4321) == 4321
+    assert vector[-1] == 4999
+    assert list(vector) == list(range(0, 5000))
+
+
+def test_get_out_of_range_raises():
+    with pytest.raises(IndexError):
+        IntVector.of(1).get(1)
+    with pytest.raises(IndexError, match="index -2 out of range"):
+        IntVector.of(1)[-2]
+
+
+def test_update_is_persistent():
+    vector = IntVector.range(0, 3000)
+    updated = vector.update(2000, -1)
+    assert updated[2000] == -1
+    assert vector[2000] == 2000
+
+
+def test_append():
+    vector = IntVector.empty()
+    for i in range(0, 2100):
+        vector = vector.append(i)
+    assert list(vector) == list(range(0, 2100))
+    assert list(vector.append(-1))[-2:] == [2099, -1]
+    assert len(vector) == 2100
+
+
+def test_map():
+    assert IntVector.range(0, 3000).map(lambda x: x * 2) == IntVector.range(0, 6000, 2)
+
+
+def test_map_to_floats_returns_float_vector():
+    result = IntVector.of(1, 2).map(lambda x: x / 2)
+    assert isinstance(result, FloatVector)
+    assert list(result) == [0.5, 1.0]
+
+
+def test_map_vectorized_callable():
+    result = IntVector.range(0, 3000).map(lambda chunk: [x + 1 for x in chunk], vectorized=True)
+    assert result == IntVector.range(1, 3001)
+
+
+def test_filter():
+    assert list(IntVector.range(0, 3000).filter(lambda x: x % 1000 == 0)) == [0, 1000, 2000]
+
+
+def test_filter_vectorized_mask():
+    result = IntVector.range(0, 3000).filter(lambda chunk: [x % 1000 == 0 for x in chunk], vectorized=True)
+    assert list(result) == [0, 1000, 2000]
+
+
+def test_fold_left_and_sum():
+    vector = IntVector.range(0, 2000)
+    assert vector.fold_left(0, operator.add) == 1999000
+    assert vector.sum() == 1999000
+
+
+def test_zip_with():
+    result = IntVector.range(0, 3000).zip_with(IntVector.range(0, 3000), operator.mul)
+    assert result[2999] == 2999 * 2999
+
+
+def test_zip_with_different_length_raises():
+    with pytest.raises(ValueException):
+        IntVector.of(1).zip_with(IntVector.of(1, 2), operator.add)
+
+
+def test_numpy_ufuncs():
+    numpy = pytest.importorskip("numpy")
+    vector = FloatVector.of_iterable(numpy.arange(0, 3000, dtype="float64"))
+    assert vector.map(numpy.sqrt)[16] == 4.0
+    assert vector.filter(lambda chunk: chunk > 2990, vectorized=True) == FloatVector.of_iterable(range(2991, 3000))
+    assert vector.fold_left(0.0, numpy.add) == 4498500.0
+    assert vector.zip_with(vector, numpy.add)[10] == 20.0
+
+
+def test_repr():
+    assert repr(IntVector.of(1, 2)) == "IntVector(1, 2)"
+
+
+def test_pickle():
+    values = IntVector.range(0, 3000)
+    assert pickle.loads(pickle.dumps(values)) == values
+    assert pickle.loads(pickle.dumps(values, protocol=2)) == values
+    assert pickle.loads(pickle.dumps(FloatVector.empty())) == FloatVector.empty()
+    assert type(pickle.loads(pickle.dumps(FloatVector.of(1.5)))) is FloatVector
+
+
+def test_pickle_out_of_band():
+    values = FloatVector.of(1.5, 2.5, 3.5)
+    buffers = []
+    data = pickle.dumps(values, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    result = pickle.loads(data, buffers=buffers)
+    assert result == values
+    assert result.update(0, 0.5).get(0) == 0.5
@@ -0,0 +1,85 @@
+import pickle
+import random
+
+import pytest
+
+from pyvavr import NoSuchElementException, ValueException
+from pyvavr.collection import ImmutableList, PriorityQueue
+
+
+def test_empty():
+    queue = PriorityQueue.empty()
+    assert queue.is_empty()
+    assert len(queue) == 0
+    assert list(queue) == []
+    with pytest.raises(NoSuchElementException):
+        queue.peek()
+    with pytest.raises(NoSuchElementException):
+        queue.dequeue()
+    with pytest.raises(NoSuchElementException):
+        queue.tail()
+
+
+def test_dequeue_in_priority_order():
+    values = list(range(1000))
+    random.Random(7).shuffle(values)
+    queue = PriorityQueue.of_iterable(values)
+    assert len(queue) == 1000
+    assert queue.peek() == 0
+    result = []
+    while not queue.is_empty():
+        value, queue = queue.dequeue()
+        result.append(value)
+    assert result == list(range(1000))
+
+
+def test_key():
+    queue = PriorityQueue.of("ccc", "a", "bb", key=len)
+    assert list(queue) == ["a", "bb", "ccc"]
+    assert list(PriorityQueue.of(1, 3, 2, key=lambda x: -x)) == [3, 2, 1]
+
+
+def test_equal_keys_keep_insertion_order():
+    queue = PriorityQueue.of((1, "first"), (0, "x"), (1, "second"), (1, "third"), key=lambda x: x[0])
+    assert [name for _, name in queue] == ["x", "first", "second", "third"]
+
+
+def test_persistent():
+    queue = PriorityQueue.of(3, 1, 2)
+    queue.enqueue(0)
+    queue.tail()
+    assert list(queue) == [1, 2, 3]
+    assert list(queue.enqueue(0)) == [0, 1, 2, 3]
+    assert list(queue.tail()) == [2, 3]
+
+
+def test_merge():
+    key = len
+    merged = PriorityQueue.of("aaa", "c", key=key).merge(PriorityQueue.of("bb", "dddd", key=key))
+    assert list(merged) == ["c", "bb", "aaa", "dddd"]
+    assert len(merged) == 4
+    empty = PriorityQueue.empty()
+    other = PriorityQueue.of(1)
+    assert empty.merge(other) is other
+    with pytest.raises(ValueException):
+        PriorityQueue.of(1).merge(PriorityQueue.of(2, key=lambda x: x))
+
+
+def test_contains_and_transformations():
+    queue = PriorityQueue.of(5, 1, 4, 2)
+    assert 4 in queue
+    assert 3 not in queue
+    assert list(queue.map(lambda x: x * 10)) == [10, 20, 40, 50]
+    assert list(queue.filter(lambda x: x % 2 == 0)) == [2, 4]
+    assert queue.fold_left([], lambda acc, x: acc + [x]) == [1, 2, 4, 5]
+    assert queue.to_list() == ImmutableList.of(1, 2, 4, 5)
+
+
+def test_eq_hash_and_pickle():
+    queue = PriorityQueue.of(2, 1, 3)
+    assert queue == PriorityQueue.of(3, 2, 1)
+    assert hash(queue) == hash(PriorityQueue.of(1, 2, 3))
+    assert repr(queue) == "PriorityQueue(1, 2, 3)"
+    assert pickle.loads(pickle.dumps(queue)) == queue
+    by_length = pickle.loads(pickle.dumps(PriorityQueue.of("bb", "a", key=len)))
+    assert list(by_length.enqueue("")) == ["", "a", "bb"]
@@ -1,7 +1,11 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from pyvavr import NoSuchElementException
 from pyvavr.collection.list import ImmutableList
+from pyvavr.collection.map import HashMap
 from pyvavr.collection.queue import ImmutableQueue
 
 
@@ -99,3 +103,104 @@ def test_filter():
 
 def test_filter_nil():
     assert ImmutableQueue.empty().filter(lambda x: x % 2 == 0) == ImmutableQueue.empty()
+
+
+def test_hash():
+    assert hash(ImmutableQueue.of(1, 2, 3)) == hash(ImmutableQueue.of(1, 2, 3))
+    assert {ImmutableQueue.of(1, 2): "a"}[ImmutableQueue.of(1, 2)] == "a"
+
+
+def test_eq_ignores_split():
+    built = ImmutableQueue.of(1, 2).enqueue(3)
+    assert ImmutableQueue.of(1, 2, 3) == built
+    assert hash(ImmutableQueue.of(1, 2, 3)) == hash(built)
+    assert {built: "a"}[ImmutableQueue.of(1, 2, 3)] == "a"
+    assert ImmutableQueue.of(1, 2, 3) != ImmutableQueue.of(1, 3, 2)
+    assert ImmutableQueue.of(1, 2) != ImmutableQueue.of(1, 2, 3)
+    assert ImmutableQueue.of(1) != 1
+
+
+def test_par_map_keeps_order():
+    queue = ImmutableQueue(ImmutableList.of(1, 2), ImmutableList.of(4, 3))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = queue.par_map(lambda x: x * 10, executor=executor, chunk_size=1)
+    assert result == ImmutableQueue.of(10, 20, 30, 40)
+
+
+def test_par_fold():
+    queue = ImmutableQueue(ImmutableList.of(1, 2), ImmutableList.of(4, 3))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert queue.map(str).par_fold("", lambda x, y: x + y, executor=executor, chunk_size=1) == "1234"
+
+
+def test_group_by():
+    queue = ImmutableQueue(ImmutableList.of(1, 2), ImmutableList.of(4, 3))
+    groups = queue.group_by(lambda x: x % 2)
+    assert groups[0] == ImmutableQueue.of(2, 4)
+    assert groups[1] == ImmutableQueue.of(1, 3)
+
+
+def test_count_by():
+    queue = ImmutableQueue(ImmutableList.of(1, 2), ImmutableList.of(4, 3))
+    assert queue.count_by(lambda x: x > 1) == HashMap.of((False, 1), (True, 3))
+
+
+def test_partition():
+    queue = ImmutableQueue(ImmutableList.of(1, 2), ImmutableList.of(4, 3))
+    even, odd = queue.partition(lambda x: x % 2 == 0)
+    assert even == ImmutableQueue.of(2, 4)
+    assert odd == ImmutableQueue.of(1, 3)
+
+
+def test_distinct():
+    queue = ImmutableQueue(ImmutableList.of(1, 2), ImmutableList.of(1, 3, 2))
+    assert queue.distinct() == ImmutableQueue.of(1, 2, 3)
+    assert queue.distinct_by(lambda x: x < 3).head() == 1
+    unique = ImmutableQueue.of(1, 2)
+    assert unique.distinct() is unique
+
+
+def test_pickle():
+    queue = ImmutableQueue(ImmutableList.of(1, 2), ImmutableList.of(4, 3))
+    loaded = pickle.loads(pickle.dumps(queue))
+    assert loaded == queue
+    assert hash(loaded) == hash(queue)
+    queue = ImmutableQueue.of(1, 2).enqueue(3)
+    assert pickle.loads(pickle.dumps(queue)) == queue
+
+
+def test_iter():
+    queue = ImmutableQueue(ImmutableList.of(1, 2), ImmutableList.of(4, 3))
+    assert list(queue) == [1, 2, 3, 4]
+    assert list(reversed(queue)) == [4, 3, 2, 1]
+    assert list(ImmutableQueue.empty()) == []
+
+
+def test_contains():
+    queue = ImmutableQueue(ImmutableList.of(1, 2), ImmutableList.of(4, 3))
+    assert 3 in queue
+    assert 1 in queue
+    assert 5 not in queue
+
+
+def test_enqueue_all():
+    queue = ImmutableQueue.of(1, 2).enqueue_all(range(3, 6))
+    assert list(queue) == [1, 2, 3, 4, 5]
+    assert list(ImmutableQueue.empty().enqueue_all([1, 2])) == [1, 2]
+    assert queue.enqueue_all([]) is queue
+
+
+def test_dequeue_n():
+    queue = ImmutableQueue(ImmutableList.of(1, 2, 3), ImmutableList.of(6, 5, 4))
+    items, rest = queue.dequeue_n(2)
+    assert items == ImmutableList.of(1, 2)
+    assert list(rest) == [3, 4, 5, 6]
+    items, rest = queue.dequeue_n(5)
+    assert items == ImmutableList.of(1, 2, 3, 4, 5)
+    assert list(rest) == [6]
+    items, rest = queue.dequeue_n(10)
+    assert items == ImmutableList.of(1, 2, 3, 4, 5, 6)
+    assert rest.is_empty()
+    items, rest = queue.dequeue_n(0)
+    assert items.is_empty()
+    assert rest is queue
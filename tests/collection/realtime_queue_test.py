@@ -0,0 +1,89 @@
+import pickle
+from collections import deque
+
+import pytest
+
+from pyvavr import NoSuchElementException
+from pyvavr.collection import RealTimeQueue
+
+
+def test_empty():
+    queue = RealTimeQueue.empty()
+    assert queue.is_empty()
+    assert len(queue) == 0
+    assert list(queue) == []
+    with pytest.raises(NoSuchElementException):
+        queue.dequeue()
+    with pytest.raises(NoSuchElementException):
+        queue.head()
+    with pytest.raises(NoSuchElementException):
+        queue.tail()
+
+
+def test_of():
+    queue = RealTimeQueue.of(1, 2, 3)
+    assert list(queue) == [1, 2, 3]
+    assert len(queue) == 3
+    assert queue.peek() == 1
+    assert repr(queue) == "RealTimeQueue(1, 2, 3)"
+
+
+def test_fifo_order():
+    queue = RealTimeQueue.empty()
+    for i in range(10):
+        queue = queue.enqueue(i)
+    result = []
+    while not queue.is_empty():
+        value, queue = queue.dequeue()
+        result.append(value)
+    assert result == list(range(10))
+
+
+def test_mixed_operations_match_deque():
+    queue = RealTimeQueue.empty()
+    expected = deque()
+    for i in range(3000):
+        if i % 3 == 2:
+            value, queue = queue.dequeue()
+            assert value == expected.popleft()
+        else:
+            queue = queue.enqueue(i)
+            expected.append(i)
+        assert len(queue) == len(expected)
+    assert list(queue) == list(expected)
+
+
+def test_persistent():
+    queue = RealTimeQueue.of(1, 2, 3)
+    longer = queue.enqueue(4)
+    shorter = queue.tail()
+    assert list(queue) == [1, 2, 3]
+    assert list(longer) == [1, 2, 3, 4]
+    assert list(shorter) == [2, 3]
+    assert list(shorter.enqueue(5)) == [2, 3, 5]
+
+
+def test_contains():
+    queue = RealTimeQueue.of(1, 2).enqueue(3)
+    assert 3 in queue
+    assert 4 not in queue
+
+
+def test_map_filter_fold():
+    queue = RealTimeQueue.of(1, 2, 3, 4)
+    assert queue.map(lambda x: x * 2) == RealTimeQueue.of(2, 4, 6, 8)
+    assert queue.filter(lambda x: x % 2 == 0) == RealTimeQueue.of(2, 4)
+    assert queue.fold_left(0, lambda x, y: x + y) == 10
+    assert RealTimeQueue.empty().or_else(queue) is queue
+
+
+def test_eq_and_hash():
+    built = RealTimeQueue.empty().enqueue(1).enqueue(2)
+    assert built == RealTimeQueue.of(1, 2)
+    assert hash(built) == hash(RealTimeQueue.of(1, 2))
+    assert built != RealTimeQueue.of(2, 1)
+
+
+def test_pickle():
+    queue = RealTimeQueue.of(1, 2).enqueue(3)
+    assert pickle.loads(pickle.dumps(queue)) == queue
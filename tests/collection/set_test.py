@@ -0,0 +1,99 @@
+import pickle
+from pyvavr.collection import HashSet
+
+
+class CollidingValue:
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return 7
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingValue) and self.value == other.value
+
+
+def test_empty():
+    assert len(HashSet.empty()) == 0
+    assert HashSet.empty().is_empty() == True
+
+
+def test_of_removes_duplicates():
+    assert len(HashSet.of(1, 2, 2, 3)) == 3
+
+
+def test_add_and_contains():
+    set = HashSet.of(1, 2)
+    added = set.add(3)
+    assert 3 in added
+    assert set.contains(3) == False
+    assert added.add(3) is added
+
+
+def test_remove():
+    set = HashSet.of(1, 2, 3)
+    assert set.remove(2) == HashSet.of(1, 3)
+    assert set.remove(4) is set
+    assert set.remove(1).remove(2).remove(3).is_empty() == True
+
+
+def test_many_values():
+    set = HashSet.of_iterable(range(0, 10000))
+    assert len(set) == 10000
+    assert all(i in set for i in range(0, 10000))
+    assert 10000 not in set
+
+
+def test_union():
+    assert HashSet.of(1, 2) | HashSet.of(2, 3) == HashSet.of(1, 2, 3)
+
+
+def test_intersection():
+    assert HashSet.of(1, 2, 3) & HashSet.of(2, 3, 4) == HashSet.of(2, 3)
+    assert (HashSet.of(1) & HashSet.of(2)).is_empty() == True
+
+
+def test_difference():
+    assert HashSet.of(1, 2, 3) - HashSet.of(2, 3, 4) == HashSet.of(1)
+    assert (HashSet.of(1) - HashSet.of(1)).is_empty() == True
+
+
+def test_bulk_operations_on_large_sets():
+    left = HashSet.of_iterable(range(0, 20000))
+    right = HashSet.of_iterable(range(10000, 30000))
+    assert len(left.union(right)) == 30000
+    assert set(left.intersection(right)) == set(range(10000, 20000))
+    assert set(left.difference(right)) == set(range(0, 10000))
+
+
+def test_bulk_operations_reuse_versions():
+    base = HashSet.of_iterable(range(0, 20000))
+    added = base.add(-1)
+    assert added & base is base
+    assert added - base == HashSet.of(-1)
+    assert base - base == HashSet.empty()
+
+
+def test_bulk_operations_with_collisions():
+    left = HashSet.of(CollidingValue(1), CollidingValue(2), 3)
+    right = HashSet.of(CollidingValue(2), CollidingValue(4), 3)
+    assert left | right == HashSet.of(CollidingValue(1), CollidingValue(2), CollidingValue(4), 3)
+    assert left & right == HashSet.of(CollidingValue(2), 3)
+    assert left - right == HashSet.of(CollidingValue(1))
+
+
+def test_map_filter_fold():
+    set = HashSet.of(1, 2, 3, 4)
+    assert set.map(lambda x: x % 2) == HashSet.of(0, 1)
+    assert set.filter(lambda x: x > 2) == HashSet.of(3, 4)
+    assert set.fold_left(0, lambda x, y: x + y) == 10
+
+
+def test_hash():
+    assert hash(HashSet.of(1, 2, 3)) == hash(HashSet.of(3, 2, 1))
+    assert {HashSet.of(1, 2): "a"}[HashSet.of(2, 1)] == "a"
+
+
+def test_pickle():
+    values = HashSet.of_iterable(range(1000))
+    assert pickle.loads(pickle.dumps(values)) == values
@@ -0,0 +1,162 @@
+import pytest
+
+from pyvavr import ValueException
+from pyvavr.collection import ImmutableList, Stream
+
+
+def counting(values, evaluated):
+    for value in values:
+        evaluated.append(value)
+        yield value
+
+
+def test_empty():
+    assert Stream.empty().is_empty() == True
+    assert list(Stream.empty()) == []
+
+
+def test_of():
+    assert list(Stream.of(1, 2, 3)) == [1, 2, 3]
+
+
+def test_head_empty_raises():
+    with pytest.raises(ValueException):
+        Stream.empty().head()
+
+
+def test_tail_empty_raises():
+    with pytest.raises(ValueException):
+        Stream.empty().tail()
+
+
+def test_of_immutable_list():
+    assert list(Stream.of_iterable(ImmutableList.range(0, 5))) == [0, 1, 2, 3, 4]
+
+
+def test_of_stream_shares_the_stream():
+    stream = Stream.of(1, 2)
+    assert Stream.of_iterable(stream) is stream
+    assert Stream.of(0).append_all(stream).tail() is stream
+    nested = Stream.empty()
+    for i in range(3000):
+        nested = Stream.of(i).append_all(nested)
+    assert len(nested) == 3000
+
+
+def test_tail_is_lazy_and_memoized():
+    evaluated = []
+    stream = Stream.of_iterable(counting(range(0, 10), evaluated))
+    assert evaluated == [0]
+    assert stream.tail() is stream.tail()
+    assert evaluated == [0, 1]
+
+
+def test_pipeline_only_evaluates_needed_elements():
+    evaluated = []
+    stream = Stream.of_iterable(counting(range(0, 1000), evaluated))
+    result = stream.map(lambda x: x * 2).filter(lambda x: x % 4 == 0).take(10)
+    assert list(result) == [0, 4, 8, 12, 16, 20, 24, 28, 32, 36]
+    assert evaluated == list(range(0, 19))
+
+
+def test_infinite_count():
+    assert list(Stream.count(5).take(3)) == [5, 6, 7]
+
+
+def test_iterate():
+    assert list(Stream.iterate(1, lambda x: x * 2).take(5)) == [1, 2, 4, 8, 16]
+
+
+def test_continually():
+    assert list(Stream.continually(lambda: "a").take(2)) == ["a", "a"]
+
+
+def test_flat_map():
+    assert list(Stream.of(1, 2, 3).flat_map(lambda x: range(0, x))) == [0, 0, 1, 0, 1, 2]
+
+
+def test_flat_map_infinite():
+    assert list(Stream.count(0).flat_map(lambda x: [x, x]).take(5)) == [0, 0, 1, 1, 2]
+
+
+def test_take_while():
+    assert list(Stream.count(0).take_while(lambda x: x < 3)) == [0, 1, 2]
+
+
+def test_drop():
+    assert list(Stream.range(0, 10).drop(7)) == [7, 8, 9]
+
+
+def test_drop_while():
+    assert list(Stream.range(0, 10).drop_while(lambda x: x < 7)) == [7, 8, 9]
+
+
+def test_zip():
+    assert list(Stream.count(0).zip(Stream.of("a", "b"))) == [(0, "a"), (1, "b")]
+
+
+def test_append_and_prepend():
+    assert list(Stream.of(2, 3).prepend(1).append(4)) == [1, 2, 3, 4]
+
+
+def test_many_appends_do_not_recurse():
+    stream = Stream.empty()
+    for i in range(3000):
+        stream = stream.append(i)
+    assert list(stream) == list(range(3000))
+    stream = Stream.of(0)
+    for i in range(1, 3000):
+        stream = stream.append_all([i] if i % 2 else [])
+    assert list(stream) == [0] + list(range(1, 3000, 2))
+
+
+def test_appends_between_prepends_do_not_recurse():
+    stream = Stream.empty()
+    for i in range(3000):
+        stream = stream.prepend(i).append(i)
+    assert list(stream) == list(range(2999, -1, -1)) + list(range(3000))
+    nested = Stream.empty()
+    for i in range(3000):
+        nested = Stream.of(i).append_all(nested).append(-i)
+    assert len(nested) == 6000
+
+
+def test_prepend_keeps_appended_stream():
+    base = Stream.of(1).append(2)
+    assert list(base.prepend(0)) == [0, 1, 2]
+    assert list(base.prepend(0).append(3)) == [0, 1, 2, 3]
+    assert list(base) == [1, 2]
+
+
+def test_append_is_persistent():
+    base = Stream.of(1, 2).append(3)
+    assert list(base.append(4)) == [1, 2, 3, 4]
+    assert list(base.append(5)) == [1, 2, 3, 5]
+    assert list(base) == [1, 2, 3]
+
+
+def test_fold_left():
+    assert Stream.range(0, 2000).fold_left(0, lambda x, y: x + y) == 1999000
+
+
+def test_long_stream_does_not_recurse():
+    assert len(Stream.range(0, 100000).map(lambda x: x + 1).filter(lambda x: x % 2 == 0)) == 50000
+
+
+def test_equality():
+    assert Stream.of(1, 2, 3) == Stream.range(1, 4)
+    assert Stream.of(1, 2) != Stream.of(1, 2, 3)
+
+
+def test_repr_shows_only_evaluated_elements():
+    stream = Stream.count(0)
+    stream.tail()
+    assert repr(stream) == "Stream(0, 1, ?)"
+
+
+def test_to_list():
+    assert Stream.count(0).take(3).to_list() == ImmutableList.of(0, 1, 2)
+
+
+def test_top_k():
+    assert Stream.range(0, 1000).map(lambda x: (x * 7) % 1000).top_k(3) == ImmutableList.of(999, 998, 997)
@@ -0,0 +1,145 @@
+import pickle
+import pytest
+
+from pyvavr.collection import TreeMap, TreeSet
+from pyvavr.collection.tree import _find
+
+
+@pytest.fixture()
+def events():
+    return TreeMap.of_entries((t, "event " + str(t)) for t in range(0, 100, 10))
+
+
+def test_empty():
+    assert len(TreeMap.empty()) == 0
+    assert TreeMap.empty().is_empty() == True
+    assert TreeMap.empty().min() is None
+
+
+def test_iterates_in_key_order():
+    map = TreeMap.of((3, "c"), (1, "a"), (2, "b"))
+    assert list(map) == [(1, "a"), (2, "b"), (3, "c")]
+    assert list(reversed(map)) == [(3, "c"), (2, "b"), (1, "a")]
+
+
+def test_put_and_get(events):
+    updated = events.put(15, "new")
+    assert updated[15] == "new"
+    assert events.get(15) is None
+    assert len(updated) == 11
+
+
+def test_getitem_missing_raises(events):
+    with pytest.raises(KeyError):
+        events[15]
+
+
+def test_remove(events):
+    removed = events.remove(50)
+    assert 50 not in removed
+    assert 50 in events
+    assert events.remove(55) is events
+
+
+def test_floor_and_ceiling(events):
+    assert events.floor(55) == (50, "event 50")
+    assert events.floor(50) == (50, "event 50")
+    assert events.floor(-1) is None
+    assert events.ceiling(55) == (60, "event 60")
+    assert events.ceiling(91) is None
+
+
+def test_min_and_max(events):
+    assert events.min() == (0, "event 0")
+    assert events.max() == (90, "event 90")
+
+
+def test_iter_range_is_lazy_iterator(events):
+    scan = events.iter_range(25, 60)
+    assert next(scan) == (30, "event 30")
+    assert list(scan) == [(40, "event 40"), (50, "event 50")]
+
+
+def test_iter_range_open_bounds(events):
+    assert [key for key, _ in events.iter_range(to_key=20)] == [0, 10]
+    assert [key for key, _ in events.iter_range(from_key=80)] == [80, 90]
+
+
+def test_sub_map(events):
+    assert list(events.sub_map(25, 60).keys()) == [30, 40, 50]
+    assert list(events[:20].keys()) == [0, 10]
+
+
+def test_sub_map_shares_nodes():
+    map = TreeMap.of_entries((i, i) for i in range(0, 10000))
+    sub = map.sub_map(0, 5000)
+    assert len(sub) == 5000
+    assert _find(sub._root, 100) is _find(map._root, 100)
+
+
+def test_large_map_stays_balanced():
+    map = TreeMap.of_entries((i, i) for i in range(0, 20000))
+    for i in range(0, 20000, 3):
+        map = map.remove(i)
+    assert len(map) == 13333
+    assert list(map.keys())[:3] == [1, 2, 4]
+
+
+def test_map_values(events):
+    assert events.map_values(len)[10] == 8
+
+
+def test_filter(events):
+    assert list(events.filter(lambda k, v: k > 60).keys()) == [70, 80, 90]
+
+
+def test_fold_left(events):
+    assert events.fold_left(0, lambda acc, entry: acc + entry[0]) == 450
+
+
+def test_equality_and_hash():
+    assert TreeMap.of((1, "a"), (2, "b")) == TreeMap.of((2, "b"), (1, "a"))
+    assert hash(TreeMap.of((1, "a"))) == hash(TreeMap.of((1, "a")))
+
+
+def test_set_of():
+    assert list(TreeSet.of(3, 1, 2, 1)) == [1, 2, 3]
+
+
+def test_set_add_and_remove():
+    set = TreeSet.of(1, 2, 3)
+    assert set.add(2) is set
+    assert list(set.add(0)) == [0, 1, 2, 3]
+    assert list(set.remove(2)) == [1, 3]
+    assert 2 in set
+
+
+def test_set_floor_and_ceiling():
+    set = TreeSet.of(10, 20, 30)
+    assert set.floor(25) == 20
+    assert set.ceiling(25) == 30
+    assert set.ceiling(31) is None
+
+
+def test_set_ranges():
+    set = TreeSet.of_iterable(range(0, 100))
+    assert list(set.iter_range(10, 13)) == [10, 11, 12]
+    assert set.sub_set(95) == TreeSet.of(95, 96, 97, 98, 99)
+    assert list(set[:2]) == [0, 1]
+    with pytest.raises(TypeError):
+        set[0]
+
+
+def test_set_map_filter_fold():
+    set = TreeSet.of(1, 2, 3, 4)
+    assert set.map(lambda x: x % 2) == TreeSet.of(0, 1)
+    assert set.filter(lambda x: x > 2) == TreeSet.of(3, 4)
+    assert set.fold_left(0, lambda x, y: x + y) == 10
+
+
+def test_pickle(events):
+    result = pickle.loads(pickle.dumps(events))
+    assert result == events
+    assert result.put(5, "event 5").floor(7) == (5, "event 5")
+    values = TreeSet.of_iterable(range(1000))
+    assert pickle.loads(pickle.dumps(values)) == values
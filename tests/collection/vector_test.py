@@ -0,0 +1,150 @@
+import pickle
+import pytest
+
+from pyvavr import ValueException
+from pyvavr.collection import Vector
+
+
+def test_empty():
+    assert len(Vector.empty()) == 0
+    assert Vector.empty().is_empty() == True
+
+
+def test_of():
+    assert list(Vector.of(1, 2, 3)) == [1, 2, 3]
+
+
+def test_of_list_spanning_several_levels():
+    values = list(range(0, 40000))
+    assert list(Vector.of_list(values)) == values
+
+
+def test_range():
+    assert Vector.range(0, 5) == Vector.of(0, 1, 2, 3, 4)
+
+
+def test_get():
+    vector = Vector.range(0, 5000)
+    assert vector.get(0) == 0
+    assert vector.get(1234) == 1234
+    assert vector.get(4999) == 4999
+
+
+def test_get_out_of_range_raises():
+    with pytest.raises(IndexError):
+        Vector.of(1, 2, 3).get(3)
+    with pytest.raises(IndexError, match="index -4 out of range"):
+        Vector.of(1, 2, 3)[-4]
+
+
+def test_getitem_negative_index():
+    assert Vector.range(0, 100)[-1] == 99
+
+
+def test_update():
+    vector = Vector.range(0, 5000)
+    updated = vector.update(1234, -1)
+    assert updated.get(1234) == -1
+    assert vector.get(1234) == 1234
+
+
+def test_update_shares_untouched_leaves():
+    vector = Vector.range(0, 5000)
+    updated = vector.update(0, -1)
+    assert updated._leaf_for(4000) is vector._leaf_for(4000)
+
+
+def test_append():
+    vector = Vector.empty()
+    for i in range(0, 2000):
+        vector = vector.append(i)
+    assert list(vector) == list(range(0, 2000))
+
+
+def test_prepend():
+    vector = Vector.empty()
+    for i in range(0, 2000):
+        vector = vector.prepend(i)
+    assert list(vector) == list(reversed(range(0, 2000)))
+
+
+def test_prepend_and_append():
+    vector = Vector.range(0, 100).prepend(-1).append(100)
+    assert list(vector) == list(range(-1, 101))
+
+
+def test_head_and_tail():
+    vector = Vector.of(1, 2, 3)
+    assert vector.head() == 1
+    assert vector.tail() == Vector.of(2, 3)
+
+
+def test_head_empty_raises():
+    with pytest.raises(ValueException):
+        Vector.empty().head()
+
+
+def test_tail_empty_raises():
+    with pytest.raises(ValueException):
+        Vector.empty().tail()
+
+
+def test_drop():
+    assert list(Vector.range(0, 1000).drop(500)) == list(range(500, 1000))
+
+
+def test_take():
+    assert list(Vector.range(0, 1000).take(500)) == list(range(0, 500))
+
+
+def test_take_then_append():
+    vector = Vector.range(0, 1000).take(500).append(-1)
+    assert list(vector) == list(range(0, 500)) + [-1]
+
+
+def test_slice():
+    vector = Vector.range(0, 5000)
+    assert list(vector[1000:3000]) == list(range(1000, 3000))
+    assert list(vector[1000:3000:7]) == list(range(1000, 3000, 7))
+
+
+def test_reversed():
+    assert list(reversed(Vector.range(0, 1000))) == list(reversed(range(0, 1000)))
+
+
+def test_reverse():
+    assert Vector.of(1, 2, 3).reverse() == Vector.of(3, 2, 1)
+
+
+def test_map():
+    assert Vector.of(1, 2, 3).map(lambda x: x + 2) == Vector.of(3, 4, 5)
+
+
+def test_filter():
+    assert Vector.of(1, 2, 3, 4, 5, 6).filter(lambda x: x % 2 == 0) == Vector.of(2, 4, 6)
+
+
+def test_flat_map():
+    assert Vector.of(1, 2, 3).flat_map(lambda x: range(0, x)) == Vector.of(0, 0, 1, 0, 1, 2)
+
+
+def test_fold_left():
+    assert Vector.range(0, 2000).fold_left(0, lambda x, y: x + y) == 1999000
+
+
+def test_zip():
+    assert Vector.of(1, 2).zip(Vector.of(3, 4)) == Vector.of((1, 3), (2, 4))
+
+
+def test_or_else():
+    assert Vector.empty().or_else(Vector.of(1)) == Vector.of(1)
+    assert Vector.of(2).or_else(Vector.of(1)) == Vector.of(2)
+
+
+def test_repr():
+    assert repr(Vector.of(1, 2)) == "Vector(1, 2)"
+
+
+def test_pickle():
+    values = Vector.range(0, 2000)
+    assert pickle.loads(pickle.dumps(values)) == values
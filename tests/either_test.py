@@ -1,3 +1,4 @@
+import pickle
 import pytest
 
 from pyvavr import ValueException
@@ -87,3 +88,14 @@ def test_left_get_on_right_raises():
 def test_right_get_on_left_raises():
     with pytest.raises(ValueException):
         var = Left("Some").right
+
+
+def test_equality_and_hash(left, right):
+    assert left == Left("Some")
+    assert left != right
+    assert {left: 1, right: 2}[Right("Some")] == 2
+
+
+def test_pickle(left, right):
+    assert pickle.loads(pickle.dumps(left)) == left
+    assert pickle.loads(pickle.dumps(right)) == right
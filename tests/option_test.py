@@ -1,3 +1,4 @@
+import pickle
 import pytest
 
 from pyvavr import ValueException
@@ -119,3 +120,15 @@ def test_just_or_else_raise_with_callable(just):
 
 def raise_something():
     raise ValueException("Something")
+
+
+def test_equality_and_hash(just, nothing):
+    assert just == Just("Some")
+    assert nothing == Nothing()
+    assert just != nothing
+    assert {just: 1, nothing: 2}[Just("Some")] == 1
+
+
+def test_pickle():
+    assert pickle.loads(pickle.dumps(Just(1))) == Just(1)
+    assert pickle.loads(pickle.dumps(Nothing())) == Nothing()
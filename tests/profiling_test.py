@@ -0,0 +1,78 @@
+import pytest
+
+from pyvavr import ValueException
+from pyvavr.collection.list import Cons, ImmutableList
+from pyvavr.collection.queue import ImmutableQueue
+from pyvavr.option import Just
+from pyvavr.profiling import profile, enabled
+
+
+def test_counts_allocations_reversals_and_traversals():
+    values = ImmutableList.of(1, 2, 3)
+    with profile() as result:
+        assert enabled()
+        mapped = values.map(lambda x: x * 2)
+        list(mapped)
+    assert not enabled()
+    assert result.calls["Cons.map"] == 1
+    assert result.allocations["Cons"] == 6
+    assert result.reversals == 1
+    assert result.traversals == 2
+    assert result.seconds["Cons.map"] > 0
+
+
+def test_counts_whole_list_operations_as_traversals():
+    values = ImmutableList.range(0, 1000)
+    with profile() as result:
+        values.map(lambda x: x + 1)
+        values.filter(lambda x: x % 2 == 0)
+        values.fold_left(0, lambda x, y: x + y)
+        assert -1 not in values
+        values.sorted()
+    assert result.traversals == 5
+
+
+def test_counts_only_finished_iterations():
+    values = ImmutableList.range(0, 10)
+    queue = ImmutableQueue.of(1, 2).enqueue(3)
+    with profile() as result:
+        iter(values)
+        for _ in values:
+            break
+        list(reversed(values))
+        list(queue)
+    assert result.traversals == 2
+
+
+def test_counts_static_methods_and_value_types():
+    with profile() as result:
+        ImmutableList.of(1, 2)
+        ImmutableQueue.empty().enqueue(1).enqueue(2)
+        Just(1).map(lambda x: x + 1)
+    assert result.calls["ImmutableList.of"] == 1
+    assert result.calls["ImmutableQueue.enqueue"] == 2
+    assert result.allocations["Just"] == 2
+    assert "Option" not in result.allocations
+
+
+def test_restores_methods():
+    original = Cons.map
+    with profile():
+        assert Cons.map is not original
+    assert Cons.map is original
+    assert ImmutableList.of(1).map(lambda x: x + 1) == ImmutableList.of(2)
+
+
+def test_report():
+    with profile() as result:
+        ImmutableList.of(1, 2).reverse()
+    report = result.report()
+    assert "Cons.reverse" in report
+    assert "allocations: Cons=4" in report
+
+
+def test_cannot_nest():
+    with profile():
+        with pytest.raises(ValueException):
+            with profile():
+                pass
@@ -1,3 +1,4 @@
+import pickle
 import pytest
 
 from pyvavr import ValueException
@@ -161,3 +162,13 @@ def test_ap(valid):
     assert isinstance(ap.get(), TestValidation)
     assert ap.get().value1 == "Some"
     assert ap.get().value2 == 1
+
+
+def test_hash(valid, invalid):
+    assert hash(valid) == hash(Valid("Some"))
+    assert {valid: 1, invalid: 2}[Invalid("Error")] == 2
+
+
+def test_pickle(valid, invalid):
+    assert pickle.loads(pickle.dumps(valid)) == valid
+    assert pickle.loads(pickle.dumps(invalid)) == invalid